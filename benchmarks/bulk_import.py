@@ -0,0 +1,88 @@
+"""NDJSON 대량 가져오기 처리량 측정.
+
+    python -m benchmarks.bulk_import --rows 100000 --batch-sizes 500 5000
+
+임시 SQLite 파일에 `--rows` 건의 게시글 NDJSON 을 `bulk_import` 로 넣고,
+배치 크기별로 초당 행 수를 출력합니다. 비교용으로 `POST /api/posts` 를
+한 건씩 호출하는 경우(`--per-request` 건)도 함께 잽니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+os.environ.setdefault(
+    "DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "bench.db")
+)
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from src.main import app  # noqa: E402
+from src.service.bulk import bulk_import  # noqa: E402
+
+
+def make_ndjson(rows: int) -> bytes:
+    return b"".join(
+        json.dumps(
+            {
+                "author_id": f"author-{i % 100}",
+                "title": f"title {i}",
+                "content": "x" * 200,
+            }
+        ).encode()
+        + b"\n"
+        for i in range(rows)
+    )
+
+
+async def chunks(body: bytes, size: int = 64 * 1024):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+async def per_request(rows: int) -> float:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        started = time.perf_counter()
+        for i in range(rows):
+            await client.post(
+                "/api/posts",
+                json={"title": f"title {i}", "content": "x" * 200},
+                headers={"Author": "bench"},
+            )
+        return rows / (time.perf_counter() - started)
+
+
+async def run(args: argparse.Namespace) -> None:
+    body = make_ndjson(args.rows)
+    async with app.router.lifespan_context(app):
+        print(f"{'mode':>12} {'batch':>8} {'rows/s':>12}")
+
+        rate = await per_request(args.per_request)
+        print(f"{'per-request':>12} {'-':>8} {rate:>12.1f}")
+
+        for batch_size in args.batch_sizes:
+            started = time.perf_counter()
+            report = await bulk_import("posts", chunks(body), batch_size)
+            rate = report.inserted / (time.perf_counter() - started)
+            print(f"{'bulk':>12} {batch_size:>8} {rate:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--per-request", type=int, default=1000)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[500, 5000, 20000]
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
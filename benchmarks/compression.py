@@ -0,0 +1,146 @@
+"""인코딩별 응답 크기와 서버 CPU 비용 비교.
+
+    python -m benchmarks.compression --rows 100000 --requests 200
+
+캐시된 데이터셋(`benchmarks.dataset`)을 복사해 uvicorn 을 띄우고, 목록
+엔드포인트(`limit=100`)와 NDJSON 내보내기를 `Accept-Encoding` 만 바꿔 가며
+`--requests` 번씩 호출합니다. 엔드포인트/인코딩마다 전송된 바이트(압축된
+본문 그대로)의 요청당 평균과, 서버 프로세스의 CPU 시간(/proc, Linux 전용)의
+요청당 평균을 출력합니다. `identity` 와의 CPU 차이가 압축 비용입니다.
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from benchmarks.dataset import ensure
+from benchmarks.suite import free_port, wait_ready
+
+from src.api.compression import ENCODERS
+
+COLUMNS = ("bytes", "ratio", "cpu_ms", "wall_ms")
+
+
+def cpu_seconds(pid: int) -> float:
+    # utime + stime (man 5 proc)
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def endpoints(db_path: Path) -> dict[str, str]:
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        author_id = conn.execute(
+            "SELECT author_id FROM post GROUP BY author_id"
+            " ORDER BY count(*) DESC LIMIT 1"
+        ).fetchone()[0]
+        post_id = conn.execute(
+            "SELECT post_id FROM comment GROUP BY post_id"
+            " ORDER BY count(*) DESC LIMIT 1"
+        ).fetchone()[0]
+        # 내보내기는 마지막 1000 건 정도만
+        since = conn.execute(
+            "SELECT id FROM post ORDER BY id DESC LIMIT 1 OFFSET 1000"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    return {
+        "get_posts": "/api/posts?limit=100",
+        "get_posts_by_user": f"/api/auth/{author_id}/posts?limit=100",
+        "get_comments_by_post": f"/api/posts/{post_id}/comments?limit=100",
+        "export_posts": f"/api/export/posts?since={since}",
+    }
+
+
+async def measure(
+    client: httpx.AsyncClient, pid: int, url: str, encoding: str, n: int
+) -> dict[str, float]:
+    headers = {"Accept-Encoding": encoding}
+    transferred = 0
+    cpu_started = cpu_seconds(pid)
+    started = time.perf_counter()
+    for _ in range(n):
+        async with client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_raw():
+                transferred += len(chunk)
+    wall = time.perf_counter() - started
+    cpu = cpu_seconds(pid) - cpu_started
+    return {
+        "bytes": transferred / n,
+        "cpu_ms": cpu / n * 1000,
+        "wall_ms": wall / n * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    db_path = Path(tempfile.mkdtemp()) / "compression.db"
+    shutil.copyfile(ensure(args.rows, args.seed), db_path)
+    port = free_port()
+    env = {
+        **os.environ,
+        "DATABASE_PATH": str(db_path),
+        # 캐시가 켜져 있으면 직렬화 비용이 빠져 압축 비용만 두드러진다.
+        "CACHE_ENABLED": "false",
+        "COMPRESSION_ENABLED": "true",
+        "COMPRESSION_MIN_SIZE": str(args.min_size),
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app"]
+        + ["--host", "127.0.0.1", "--port", str(port)]
+        + ["--log-level", "warning", "--no-access-log"],
+        env=env,
+    )
+    encodings = ["identity"] + [e for e in args.encodings if e in ENCODERS]
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", timeout=60
+        ) as client:
+            await wait_ready(client)
+            print(
+                f"{'endpoint':<22}{'encoding':>10}"
+                + "".join(f"{c:>12}" for c in COLUMNS)
+            )
+            for name, url in endpoints(db_path).items():
+                # 워밍업: 페이지 캐시와 준비된 문장을 채운다.
+                await measure(client, server.pid, url, "identity", 5)
+                baseline = None
+                for encoding in encodings:
+                    result = await measure(
+                        client, server.pid, url, encoding, args.requests
+                    )
+                    baseline = baseline or result["bytes"]
+                    result["ratio"] = result["bytes"] / baseline
+                    print(
+                        f"{name:<22}{encoding:>10}"
+                        + "".join(f"{result[c]:>12.2f}" for c in COLUMNS)
+                    )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--min-size", type=int, default=1024)
+    parser.add_argument(
+        "--encodings", nargs="+", default=["gzip", "br", "zstd"]
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
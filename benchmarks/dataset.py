@@ -0,0 +1,82 @@
+"""벤치마크용 SQLite 데이터셋을 만들고 캐시합니다.
+
+    python -m benchmarks.dataset --rows 1000000
+
+데이터는 `src.sqlite3.generate` 로 만들며, 같은 `--rows`, `--seed` 로 만들면
+비밀번호 해시를 제외하고 항상 같은 DB 가 만들어집니다. 만든 파일은
+`benchmarks/.data/` 에 두고 다음 실행에서 재사용합니다.
+
+`rows` 는 게시글 + 댓글 수이며, 1/4 이 게시글입니다. 사용자는 rows / 1000 명
+(최소 10명)이고, 모두 비밀번호가 `BENCH_PASSWORD` 입니다.
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from src.sqlite3.generate import DEFAULT_PASSWORD as BENCH_PASSWORD
+from src.sqlite3.generate import WORDS, DatasetShape, create_schema, generate
+from src.sqlite3.migration import LATEST_VERSION
+
+DATA_DIR = Path(__file__).parent / ".data"
+
+
+def dataset_path(rows: int, seed: int) -> Path:
+    # 스키마가 바뀌면(마이그레이션 추가) 새 데이터셋을 만든다.
+    return DATA_DIR / f"rows{rows}-seed{seed}-v{LATEST_VERSION}.db"
+
+
+def build(path: Path, rows: int, seed: int) -> None:
+    """`path` 에 스키마를 만들고 데이터를 넣는다. 별도 프로세스에서 실행한다."""
+    asyncio.run(create_schema())
+    generate(str(path), DatasetShape.from_rows(rows), seed, BENCH_PASSWORD)
+
+
+def ensure(rows: int, seed: int) -> Path:
+    """캐시된 데이터셋 경로를 돌려준다. 없으면 새 프로세스에서 만든다."""
+    path = dataset_path(rows, seed)
+    if path.exists():
+        return path
+
+    DATA_DIR.mkdir(exist_ok=True)
+    partial = path.with_suffix(".partial")
+    for leftover in DATA_DIR.glob(partial.name + "*"):
+        leftover.unlink()
+
+    # src 의 엔진은 import 시점의 DATABASE_PATH 를 쓰므로 프로세스를 나눈다.
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "benchmarks.dataset", "--rows", str(rows)]
+        + ["--seed", str(seed), "--path", str(partial)],
+        env={**os.environ, "DATABASE_PATH": str(partial)},
+        check=True,
+    )
+    partial.rename(path)
+    print(
+        f"seeded {path.name} in {time.perf_counter() - started:.1f}s",
+        file=sys.stderr,
+    )
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--path", help="지정하면 캐시를 쓰지 않고 이 파일에 만든다"
+    )
+    args = parser.parse_args()
+
+    if args.path is None:
+        print(ensure(args.rows, args.seed))
+    else:
+        build(Path(args.path), args.rows, args.seed)
+
+
+if __name__ == "__main__":
+    main()
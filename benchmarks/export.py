@@ -0,0 +1,81 @@
+"""NDJSON 스트리밍 내보내기와 전체 목록 직렬화의 최대 메모리 비교.
+
+    python -m benchmarks.export --rows 50000 100000
+
+임시 SQLite 파일에 `--rows` 건의 게시글을 넣고, `list` 는 전체를
+`PostResponse` 리스트로 만든 뒤 JSON 으로 직렬화하고, `stream` 은
+`stream_ndjson` 을 끝까지 소비합니다. tracemalloc 으로 최대 할당량을 잽니다.
+스트리밍은 행 수와 무관하게 일정해야 합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault(
+    "DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "bench.db")
+)
+
+from benchmarks.pagination import seed  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlmodel import delete, select  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+from src.domain.post import Post, PostResponse  # noqa: E402
+from src.main import app  # noqa: E402
+from src.service.export import stream_ndjson  # noqa: E402
+from src.sqlite3.connection import get_engine, get_read_engine  # noqa: E402
+
+
+async def as_list() -> int:
+    async with AsyncSession(get_read_engine()) as session:
+        rows = (await session.exec(select(Post).order_by(Post.id))).all()
+        items = [PostResponse.model_validate(row) for row in rows]
+        return len(TypeAdapter(list[PostResponse]).dump_json(items))
+
+
+async def as_stream() -> int:
+    size = 0
+    async for chunk in stream_ndjson(Post, Post.id, PostResponse):
+        size += len(chunk)
+    return size
+
+
+async def measure(fn) -> tuple[float, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    await fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with app.router.lifespan_context(app):
+        print(f"{'rows':>8} {'mode':>8} {'seconds':>8} {'peak MiB':>10}")
+        for rows in args.rows:
+            async with AsyncSession(get_engine()) as session:
+                await session.exec(delete(Post))
+                await seed(session, rows)
+
+            for mode, fn in (("list", as_list), ("stream", as_stream)):
+                elapsed, peak = await measure(fn)
+                print(f"{rows:>8} {mode:>8} {elapsed:>8.2f} {peak:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[50_000, 100_000]
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""그룹 커밋 유무에 따른 INSERT 처리량 비교.
+
+    python -m benchmarks.group_commit --inserts 5000 --concurrency 100
+
+임시 SQLite 파일(설정된 PRAGMA 그대로)에 동시 작업자 `--concurrency` 개가
+게시글을 INSERT 합니다. `direct` 는 INSERT 마다 커밋하고, `group` 은
+`WriteQueue` 가 window 안에 모인 INSERT 를 한 트랜잭션으로 커밋합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault(
+    "DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "bench.db")
+)
+
+from src.domain.post import Post  # noqa: E402
+from src.main import app  # noqa: E402
+from src.sqlite3.connection import get_engine  # noqa: E402
+from src.sqlite3.writer import WriteQueue  # noqa: E402
+
+
+async def insert_all(
+    writer: WriteQueue, inserts: int, concurrency: int
+) -> float:
+    remaining = iter(range(inserts))
+
+    async def worker() -> None:
+        for i in remaining:
+            await writer.add(
+                Post(author_id="bench", title=f"post {i}", content="x" * 200)
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return inserts / (time.perf_counter() - started)
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with app.router.lifespan_context(app):
+        print(f"{'mode':>8} {'window':>8} {'inserts/s':>12}")
+
+        direct = WriteQueue(get_engine(), window_ms=0, max_batch=1)
+        rate = await insert_all(direct, args.inserts, args.concurrency)
+        print(f"{'direct':>8} {'-':>8} {rate:>12.1f}")
+
+        for window_ms in args.windows:
+            writer = WriteQueue(
+                get_engine(), window_ms=window_ms, max_batch=args.max_batch
+            )
+            await writer.start()
+            try:
+                rate = await insert_all(writer, args.inserts, args.concurrency)
+            finally:
+                await writer.stop()
+            print(f"{'group':>8} {window_ms:>6}ms {rate:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--inserts", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument(
+        "--windows", type=float, nargs="+", default=[1.0, 2.0, 5.0]
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
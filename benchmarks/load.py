@@ -0,0 +1,184 @@
+"""sync 엔진(스레드풀) 경로와 async 엔진 경로의 부하 테스트.
+
+    python -m benchmarks.load --concurrency 200 --duration 10
+
+같은 데이터를 넣은 임시 SQLite 파일을 두고, 각 경로를 별도 uvicorn 프로세스로
+띄운 뒤 동시 클라이언트 `--concurrency` 개로 `GET /api/posts/{post_id}` 와
+`GET /api/posts` 를 섞어 호출합니다. 초당 요청 수와 p50/p99 지연 시간을 출력합니다.
+
+sync 경로는 async 전환 이전의 라우터(동기 엔진 + 동기 Session)를 그대로 재현한
+것으로, 비교용으로만 이 파일 안에 둡니다.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import statistics
+import tempfile
+import time
+from typing import Annotated
+
+import httpx
+import uvicorn
+from benchmarks.pagination import seed
+from fastapi import Depends, FastAPI, HTTPException, Query
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.post import post_router
+from src.domain.post import Post, PostResponse
+from src.repository.sql import sql_repositories
+from src.service.repository import get_repositories
+
+
+def sync_app(db_path: str) -> FastAPI:
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        pool_size=5,
+        max_overflow=10,
+    )
+
+    def session_dep():
+        with Session(engine) as session:
+            yield session
+
+    SessionDep = Annotated[Session, Depends(session_dep)]
+    app = FastAPI()
+
+    @app.get("/api/posts/{post_id}")
+    def get_post(session: SessionDep, post_id: str) -> PostResponse:
+        post = session.exec(select(Post).where(Post.id == post_id)).first()
+        if post is None:
+            raise HTTPException(status_code=404)
+        return PostResponse.model_validate(post)
+
+    @app.get("/api/posts")
+    def get_posts(
+        session: SessionDep, limit: int = Query(10, ge=1, le=100)
+    ) -> list[PostResponse]:
+        posts = session.exec(select(Post).order_by(Post.id).limit(limit))
+        return [PostResponse.model_validate(p) for p in posts.all()]
+
+    return app
+
+
+def async_app(db_path: str) -> FastAPI:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}", pool_size=5, max_overflow=10
+    )
+
+    async def repositories_dep():
+        async with AsyncSession(engine) as session:
+            yield sql_repositories(session)
+
+    app = FastAPI()
+    app.include_router(post_router, prefix="/api")
+    app.dependency_overrides[get_repositories] = repositories_dep
+    return app
+
+
+APPS = {"sync": sync_app, "async": async_app}
+
+
+def serve(kind: str, db_path: str, port: int) -> None:
+    uvicorn.run(APPS[kind](db_path), port=port, log_level="warning")
+
+
+async def wait_ready(base_url: str) -> None:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(100):
+            try:
+                await client.get("/api/posts", params={"limit": 1})
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+async def drive(
+    base_url: str, post_ids: list[str], concurrency: int, duration: float
+) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency)
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                if random.random() < 0.8:
+                    url = f"/api/posts/{random.choice(post_ids)}"
+                else:
+                    url = "/api/posts"
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+async def prepare(db_path: str, rows: int) -> list[str]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        await seed(session, rows)
+        post_ids = (await session.exec(select(Post.id))).all()
+    await engine.dispose()
+    return list(post_ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = f"{tmp}/bench.db"
+        post_ids = asyncio.run(prepare(db_path, args.rows))
+
+        print(
+            f"{'path':>6} {'req/s':>10} {'p50 (ms)':>10} {'p99 (ms)':>10}"
+            f" {'errors':>8}"
+        )
+        for kind in APPS:
+            server = multiprocessing.Process(
+                target=serve, args=(kind, db_path, args.port), daemon=True
+            )
+            server.start()
+            base_url = f"http://127.0.0.1:{args.port}"
+            try:
+                asyncio.run(wait_ready(base_url))
+                latencies, errors = asyncio.run(
+                    drive(base_url, post_ids, args.concurrency, args.duration)
+                )
+            finally:
+                server.terminate()
+                server.join()
+
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"{kind:>6} {len(latencies) / args.duration:>10.1f}"
+                f" {quantiles[49] * 1000:>10.2f} {quantiles[98] * 1000:>10.2f}"
+                f" {errors:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""쓰기 폭주 상황에서 admission control 유무에 따른 지연 시간 비교.
+
+    python -m benchmarks.overload --requests 3000 --concurrency 400
+
+같은 임시 SQLite 파일로 uvicorn 을 `ADMISSION_ENABLED` 를 켜고 끈 채 각각
+띄우고, 동시 클라이언트 `--concurrency` 개가 `POST /api/posts` 와
+`POST /api/comments` 를 쏟아붓습니다. 받아들여진 요청(2xx)의 p50/p99 와
+거절(503), 타임아웃 수를 출력합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from benchmarks.suite import free_port, wait_ready
+
+COLUMNS = (
+    "ok",
+    "rejected",
+    "timeout",
+    "error",
+    "accepted/s",
+    "p50_ms",
+    "p99_ms",
+)
+
+
+async def burst(
+    client: httpx.AsyncClient, requests: int, concurrency: int
+) -> dict[str, float]:
+    post = await client.post(
+        "/api/posts",
+        json={"title": "seed", "content": "seed"},
+        headers={"Author": "bench"},
+    )
+    post_id = post.json()["id"]
+    remaining = iter(range(requests))
+    latencies: list[float] = []
+    outcomes = {"ok": 0, "rejected": 0, "timeout": 0, "error": 0}
+
+    async def worker() -> None:
+        for i in remaining:
+            if i % 2:
+                url, body = "/api/comments", {
+                    "post_id": post_id,
+                    "content": "c",
+                }
+            else:
+                url, body = "/api/posts", {"title": "t", "content": "c" * 200}
+            started = time.perf_counter()
+            try:
+                response = await client.post(
+                    url, json=body, headers={"Author": "bench"}
+                )
+            except httpx.TimeoutException:
+                outcomes["timeout"] += 1
+                continue
+            if response.status_code == 201:
+                latencies.append(time.perf_counter() - started)
+                outcomes["ok"] += 1
+            elif response.status_code == 503:
+                outcomes["rejected"] += 1
+            else:
+                outcomes["error"] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100) if latencies else []
+    return {
+        **outcomes,
+        "accepted/s": outcomes["ok"] / elapsed,
+        "p50_ms": quantiles[49] * 1000 if quantiles else 0.0,
+        "p99_ms": quantiles[98] * 1000 if quantiles else 0.0,
+    }
+
+
+async def run_server(
+    db_path: Path, admission: bool, args: argparse.Namespace
+) -> dict[str, float]:
+    port = free_port()
+    env = {
+        **os.environ,
+        "DATABASE_PATH": str(db_path),
+        "ADMISSION_ENABLED": str(admission).lower(),
+        "CACHE_ENABLED": "false",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app"]
+        + ["--host", "127.0.0.1", "--port", str(port)]
+        + ["--log-level", "warning", "--no-access-log"],
+        env=env,
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            limits=httpx.Limits(max_connections=args.concurrency),
+            timeout=args.timeout,
+        ) as client:
+            await wait_ready(client)
+            return await burst(client, args.requests, args.concurrency)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def run(args: argparse.Namespace) -> None:
+    db_path = Path(tempfile.mkdtemp()) / "overload.db"
+    print(f"{'admission':>10}" + "".join(f"{c:>12}" for c in COLUMNS))
+    for admission in (False, True):
+        result = await run_server(db_path, admission, args)
+        name = "on" if admission else "off"
+        print(f"{name:>10}" + "".join(f"{result[c]:>12.1f}" for c in COLUMNS))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=400)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
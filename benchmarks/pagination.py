@@ -0,0 +1,113 @@
+"""커서(keyset) 페이지네이션과 OFFSET 페이지네이션의 지연 시간 비교.
+
+    python -m benchmarks.pagination --pages 10000 --limit 10
+
+임시 SQLite 파일에 `pages * limit` 건의 게시글을 넣은 뒤, 1 페이지와 마지막
+페이지를 각각 여러 번 조회해 중앙값을 출력합니다. 커서 방식은 페이지 깊이와
+무관하게 일정해야 합니다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ulid import ULID
+
+from src.api.post import get_posts
+from src.domain.comment import Comment  # noqa: F401 (metadata 등록)
+from src.domain.post import Post
+from src.domain.user import User  # noqa: F401 (metadata 등록)
+from src.repository.sql import sql_repositories
+
+TIME_ZONE = ZoneInfo("Asia/Seoul")
+
+
+async def seed(session: AsyncSession, count: int) -> None:
+    start = datetime.now(TIME_ZONE) - timedelta(days=30)
+    rows = []
+    for i in range(count):
+        created_at = start + timedelta(seconds=i)
+        rows.append(
+            {
+                "id": str(ULID.from_datetime(created_at)),
+                "author_id": f"author-{i % 100}",
+                "title": f"title {i}",
+                "content": "x" * 200,
+                "created_at": created_at,
+            }
+        )
+    await session.exec(insert(Post), params=rows)
+    await session.commit()
+
+
+async def measure(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+async def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+        async with AsyncSession(engine) as session:
+            await seed(session, args.pages * args.limit)
+            repo = sql_repositories(session)
+
+            print(f"{'page':>8} {'keyset (ms)':>12} {'offset (ms)':>12}")
+            for page in (1, args.pages):
+                offset = (page - 1) * args.limit
+                after = None
+                if offset:
+                    after = (
+                        await session.exec(
+                            select(Post.id)
+                            .order_by(Post.id)
+                            .offset(offset - 1)
+                            .limit(1)
+                        )
+                    ).one()
+
+                async def by_offset():
+                    stmt = (
+                        select(Post)
+                        .order_by(Post.id)
+                        .offset(offset)
+                        .limit(args.limit)
+                    )
+                    return (await session.exec(stmt)).all()
+
+                keyset_ms = await measure(
+                    lambda: get_posts(repo, args.limit, after), args.repeat
+                )
+                offset_ms = await measure(by_offset, args.repeat)
+                print(f"{page:>8} {keyset_ms:>12.3f} {offset_ms:>12.3f}")
+
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
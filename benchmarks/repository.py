@@ -0,0 +1,148 @@
+"""SQL 저장소와 in-memory 저장소의 연산별 처리량 비교.
+
+    python -m benchmarks.repository --posts 2000 --ops 2000 --concurrency 50
+
+두 구현(`src/repository/`)에 같은 게시글 `--posts` 개와 댓글을 넣은 뒤,
+동시 작업자 `--concurrency` 개로 연산마다 `--ops` 번 호출해 초당 연산 수를
+출력합니다. SQL 쪽은 임시 SQLite 파일에 그룹 커밋 writer 를 켠 상태입니다.
+HTTP 계층 없이 저장소만 잽니다.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+
+os.environ.setdefault(
+    "DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "bench.db")
+)
+
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+from src.domain.comment import Comment  # noqa: E402
+from src.domain.post import Post  # noqa: E402
+from src.main import app  # noqa: E402
+from src.repository.base import Repositories  # noqa: E402
+from src.repository.memory import memory_repositories  # noqa: E402
+from src.repository.sql import sql_repositories  # noqa: E402
+from src.sqlite3.connection import get_read_engine  # noqa: E402
+
+Op = Callable[[Repositories, random.Random], Awaitable[object]]
+# 앱처럼 작업자(요청)마다 저장소를 연다. AsyncSession 은 동시에 쓸 수 없다.
+Opener = Callable[[], AbstractAsyncContextManager[Repositories]]
+
+
+@asynccontextmanager
+async def open_sql() -> AsyncIterator[Repositories]:
+    async with AsyncSession(get_read_engine()) as session:
+        yield sql_repositories(session)
+
+
+def memory_opener() -> Opener:
+    repo = memory_repositories()
+
+    @asynccontextmanager
+    async def open_memory() -> AsyncIterator[Repositories]:
+        yield repo
+
+    return open_memory
+
+
+async def seed(repo: Repositories, posts: int, authors: int) -> list[str]:
+    ids = []
+    for i in range(posts):
+        post = await repo.posts.add(
+            Post(author_id=f"author-{i % authors}", title=f"t{i}", content="c")
+        )
+        await repo.comments.add(
+            Comment(author_id="bench", post_id=post.id, content="c")
+        )
+        ids.append(post.id)
+    return ids
+
+
+def operations(ids: list[str], authors: int) -> dict[str, Op]:
+    return {
+        "posts.get": lambda repo, rng: repo.posts.get(rng.choice(ids)),
+        "posts.list_all": lambda repo, rng: repo.posts.list_all(
+            rng.choice(ids), 11
+        ),
+        "posts.list_by_author": lambda repo, rng: repo.posts.list_by_author(
+            f"author-{rng.randrange(authors)}", None, 11
+        ),
+        "posts.revision": lambda repo, rng: repo.posts.revision(
+            rng.choice(ids)
+        ),
+        "comments.list_by_post": lambda repo, rng: repo.comments.list_by_post(
+            rng.choice(ids), None, 11
+        ),
+        "posts.add": lambda repo, rng: repo.posts.add(
+            Post(author_id="bench", title="t", content="c" * 200)
+        ),
+        "comments.add": lambda repo, rng: repo.comments.add(
+            Comment(author_id="bench", post_id=rng.choice(ids), content="c")
+        ),
+    }
+
+
+async def measure(
+    open_repo: Opener, op: Op, ops: int, concurrency: int, seed: int
+) -> float:
+    remaining = iter(range(ops))
+
+    async def worker(rng: random.Random) -> None:
+        async with open_repo() as repo:
+            for _ in remaining:
+                await op(repo, rng)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(worker(random.Random(seed + i)) for i in range(concurrency))
+    )
+    return ops / (time.perf_counter() - started)
+
+
+async def run_backend(
+    open_repo: Opener, args: argparse.Namespace
+) -> dict[str, float]:
+    async with open_repo() as repo:
+        ids = await seed(repo, args.posts, args.authors)
+    results = {}
+    for name, op in operations(ids, args.authors).items():
+        results[name] = await measure(
+            open_repo, op, args.ops, args.concurrency, args.seed
+        )
+    return results
+
+
+async def run(args: argparse.Namespace) -> None:
+    memory = await run_backend(memory_opener(), args)
+    async with app.router.lifespan_context(app):
+        sql = await run_backend(open_sql, args)
+
+    print(f"{'operation':>22} {'sql ops/s':>12} {'memory ops/s':>14} {'x':>8}")
+    for op_name in sql:
+        print(
+            f"{op_name:>22} {sql[op_name]:>12.1f} {memory[op_name]:>14.1f}"
+            f" {memory[op_name] / sql[op_name]:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--authors", type=int, default=50)
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
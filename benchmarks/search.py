@@ -0,0 +1,121 @@
+"""FTS5 검색 지연 시간 측정.
+
+    python -m benchmarks.search --posts 1000000
+
+임시 SQLite 파일에 `--posts` 건의 게시글을 넣고(트리거가 FTS 인덱스를 채움),
+드문 단어 / 중간 빈도 단어 / 두 단어 AND 검색의 첫 페이지와 다음 페이지
+지연 시간 중앙값을 출력합니다. 단어 빈도는 Zipf 분포를 따릅니다.
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault(
+    "DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "bench.db")
+)
+
+from sqlalchemy import text  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+from ulid import ULID  # noqa: E402
+
+from src.main import app  # noqa: E402
+from src.service.search import search_service, to_match_query  # noqa: E402
+from src.sqlite3.connection import config, get_read_engine  # noqa: E402
+
+VOCABULARY = [f"w{i}" for i in range(50_000)]
+CUM_WEIGHTS = list(
+    itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY)))
+)
+
+
+def seed(path: str, posts: int, seed: int) -> None:
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA synchronous = OFF")
+
+    def rows():
+        for i in range(posts):
+            words = rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=40)
+            yield (
+                str(ULID()),
+                f"author-{i % 1000}",
+                " ".join(words[:6]),
+                " ".join(words[6:]),
+                "2025-01-01 00:00:00.000000",
+            )
+
+    conn.executemany(
+        "INSERT INTO post (id, author_id, title, content, created_at)"
+        " VALUES (?, ?, ?, ?, ?)",
+        rows(),
+    )
+    conn.commit()
+    conn.close()
+
+
+async def measure(q: str, repeat: int) -> tuple[float, float, int]:
+    first, second = [], []
+    async with AsyncSession(get_read_engine()) as session:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            page = await search_service(q, "posts", session, 20)
+            first.append(time.perf_counter() - started)
+            if page.next_cursor is not None:
+                started = time.perf_counter()
+                await search_service(q, "posts", session, 20, page.next_cursor)
+                second.append(time.perf_counter() - started)
+
+        count = (
+            await session.exec(
+                text("SELECT count(*) FROM post_fts WHERE post_fts MATCH :q"),
+                params={"q": to_match_query(q)},
+            )
+        ).scalar()
+    return (
+        statistics.median(first) * 1000,
+        statistics.median(second) * 1000 if second else 0.0,
+        count,
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        seed(config.database_path, args.posts, args.seed)
+        print(
+            f"seeded {args.posts} posts in {time.perf_counter() - started:.1f}s"
+        )
+
+        queries = {
+            "rare": VOCABULARY[-1],
+            "medium": VOCABULARY[500],
+            "and": f"{VOCABULARY[50]} {VOCABULARY[200]}",
+            "prefix": "w4999*",
+        }
+        print(
+            f"{'query':>8} {'matches':>9} {'page 1 (ms)':>12} {'page 2 (ms)':>12}"
+        )
+        for name, q in queries.items():
+            first, second, count = await measure(q, args.repeat)
+            print(f"{name:>8} {count:>9} {first:>12.2f} {second:>12.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
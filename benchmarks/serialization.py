@@ -0,0 +1,92 @@
+"""기본 APIRoute 와 FastJSONRoute 의 목록 응답 직렬화 시간 비교.
+
+    python -m benchmarks.serialization --items 100 10000
+
+DB 없이 미리 만들어 둔 `Page[PostResponse]` 를 돌려주는 엔드포인트를 두
+라우트 클래스로 각각 등록하고, ASGI 로 여러 번 호출해 중앙값을 출력합니다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from httpx import ASGITransport, AsyncClient
+from ulid import ULID
+
+from src.api.routing import FastJSONRoute
+from src.domain.page import Page
+from src.domain.post import PostResponse
+
+TIME_ZONE = ZoneInfo("Asia/Seoul")
+
+
+def make_page(items: int) -> Page[PostResponse]:
+    return Page[PostResponse](
+        items=[
+            PostResponse(
+                id=str(ULID()),
+                author_id=f"author-{i % 100}",
+                title=f"게시글 제목 {i}",
+                content="본문 " * 40,
+                created_at=datetime.now(TIME_ZONE),
+            )
+            for i in range(items)
+        ],
+        next_cursor=None,
+    )
+
+
+def make_app(route_class: type[APIRoute], page: Page[PostResponse]) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/posts", response_model=Page[PostResponse])
+    async def get_posts() -> Page[PostResponse]:
+        return page
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def measure(app: FastAPI, repeat: int) -> float:
+    samples = []
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = await client.get("/posts")
+            samples.append(time.perf_counter() - started)
+            assert response.status_code == 200
+    return statistics.median(samples) * 1000
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(f"{'items':>8} {'default (ms)':>14} {'fast (ms)':>12} {'speedup':>8}")
+    for items in args.items:
+        page = make_page(items)
+        repeat = max(5, args.repeat * 100 // items)
+        default = await measure(make_app(APIRoute, page), repeat)
+        fast = await measure(make_app(FastJSONRoute, page), repeat)
+        print(
+            f"{items:>8} {default:>14.3f} {fast:>12.3f}"
+            f" {default / fast:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 10_000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
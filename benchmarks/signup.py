@@ -0,0 +1,85 @@
+"""비밀번호 해시 위치에 따른 가입 처리량과 이벤트 루프 지연 비교.
+
+    python -m benchmarks.signup --signups 200 --concurrency 50
+
+`inline` 은 이벤트 루프에서 바로 `hash_password` 를 호출하고, `pool` 은
+`PasswordHasher` 워커 풀에 넘깁니다. 측정하는 동안 ticker 가 1ms 마다
+깨어나 예정 시각보다 얼마나 늦었는지(루프 지연)를 기록합니다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from src.service.password import PasswordHasher, hash_password
+
+
+async def measure(hash_fn, signups: int, concurrency: int) -> tuple:
+    remaining = iter(range(signups))
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - started - 0.001)
+
+    async def worker() -> None:
+        for i in remaining:
+            await hash_fn(f"Password{i}")
+
+    tick = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await tick
+
+    lags.sort()
+    p99 = lags[int(len(lags) * 0.99)] if lags else 0.0
+    return signups / elapsed, statistics.median(lags or [0.0]), p99
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'mode':>8} {'workers':>8} {'signups/s':>10}"
+        f" {'lag p50':>10} {'lag p99':>10}"
+    )
+
+    async def inline(password: str) -> str:
+        return hash_password(password)
+
+    rate, p50, p99 = await measure(inline, args.signups, args.concurrency)
+    print(
+        f"{'inline':>8} {'-':>8} {rate:>10.1f}"
+        f" {p50 * 1000:>8.2f}ms {p99 * 1000:>8.2f}ms"
+    )
+
+    for workers in args.workers:
+        hasher = PasswordHasher(workers=workers, queue_limit=args.signups)
+        try:
+            rate, p50, p99 = await measure(
+                hasher.hash, args.signups, args.concurrency
+            )
+        finally:
+            hasher.shutdown()
+        print(
+            f"{'pool':>8} {workers:>8} {rate:>10.1f}"
+            f" {p50 * 1000:>8.2f}ms {p99 * 1000:>8.2f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--signups", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""프로세스 시작부터 첫 요청 응답까지의 시간(cold start) 측정.
+
+    python -m benchmarks.startup --runs 5 --budget 3.0
+
+임시 SQLite 파일에 스키마를 한 번 만들어 둔 뒤, uvicorn 프로세스를 `--runs`
+번 새로 띄워 첫 `GET /api/health` 가 200 을 돌려줄 때까지의 시간을 잽니다.
+스키마를 처음 만드는 실행(`fresh`)은 따로 출력하고 예산에는 넣지 않습니다.
+중앙값이 `--budget` 초를 넘으면 1로 종료합니다.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from benchmarks.suite import free_port
+
+
+def startup_phases(client: httpx.Client) -> dict[str, float]:
+    # 서버가 스스로 잰 단계별 시간 (src/metrics/startup.py)
+    phases = {}
+    for line in client.get("/api/metrics").text.splitlines():
+        if line.startswith("process_startup_seconds{"):
+            labels, value = line.rsplit(" ", 1)
+            phases[labels.split('"')[1]] = float(value)
+    return phases
+
+
+def cold_start(db_path: Path) -> tuple[float, dict[str, float]]:
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app"]
+        + ["--host", "127.0.0.1", "--port", str(port)]
+        + ["--log-level", "warning", "--no-access-log"],
+        env={**os.environ, "DATABASE_PATH": str(db_path)},
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}") as client:
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError("uvicorn exited during startup")
+                try:
+                    if client.get("/api/health").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    time.sleep(0.005)
+            elapsed = time.perf_counter() - started
+            return elapsed, startup_phases(client)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def report(name: str, elapsed: float, phases: dict[str, float]) -> None:
+    detail = " ".join(f"{k}={v * 1000:.0f}ms" for k, v in phases.items())
+    print(f"{name:>6} {elapsed * 1000:>10.0f}  {detail}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=3.0,
+        help="median seconds from spawn to first response",
+    )
+    args = parser.parse_args()
+
+    db_path = Path(tempfile.mkdtemp()) / "startup.db"
+    print(f"{'run':>6} {'first (ms)':>10}  server-side phases")
+    report("fresh", *cold_start(db_path))
+
+    samples = []
+    for run in range(args.runs):
+        elapsed, phases = cold_start(db_path)
+        samples.append(elapsed)
+        report(str(run + 1), elapsed, phases)
+
+    median = statistics.median(samples)
+    print(f"median {median * 1000:.0f}ms, budget {args.budget * 1000:.0f}ms")
+    if median > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
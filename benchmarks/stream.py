@@ -0,0 +1,147 @@
+"""댓글 SSE 스트림의 구독자당 메모리와 fan-out 지연 측정.
+
+    python -m benchmarks.stream --subscribers 10000
+
+임시 SQLite 파일로 uvicorn 을 띄우고, 게시글 하나에 `--subscribers` 개의
+SSE 연결을 엽니다. 연결 전후 서버 프로세스의 RSS(/proc, Linux 전용)로
+구독자당 메모리를 구하고, 댓글을 `--comments` 번 달아 모든 구독자가 받을
+때까지의 시간(p50/max)을 출력합니다. 열 수 있는 파일 수(`ulimit -n`)가
+구독자 수보다 커야 합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from benchmarks.suite import free_port, wait_ready
+
+
+def rss_bytes(pid: int) -> int:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) * 1024
+    raise RuntimeError("VmRSS not found")
+
+
+async def subscribe(
+    port: int, post_id: str
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    # httpx 연결 하나보다 가벼운 날 소켓으로 수만 개를 연다.
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"GET /api/posts/{post_id}/comments/stream HTTP/1.1\r\n"
+        "Host: bench\r\nAccept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    if not head.startswith(b"HTTP/1.1 200"):
+        raise RuntimeError(head.decode(errors="replace"))
+    return reader, writer
+
+
+async def receive(reader: asyncio.StreamReader, comment_id: str) -> float:
+    marker = f"id: {comment_id}".encode()
+    while True:
+        # chunked 본문이라 크기 줄이 섞이지만, 이벤트 줄만 보면 된다.
+        line = await reader.readline()
+        if not line:
+            raise RuntimeError("stream closed")
+        if line.startswith(marker):
+            return time.perf_counter()
+
+
+async def run(args: argparse.Namespace) -> None:
+    db_path = Path(tempfile.mkdtemp()) / "stream.db"
+    port = free_port()
+    env = {
+        **os.environ,
+        "DATABASE_PATH": str(db_path),
+        "STREAM_MAX_SUBSCRIBERS": str(args.subscribers),
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app"]
+        + ["--host", "127.0.0.1", "--port", str(port)]
+        + ["--log-level", "warning", "--no-access-log"]
+        + ["--backlog", str(args.subscribers)],
+        env=env,
+    )
+    streams = []
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", timeout=60
+        ) as client:
+            await wait_ready(client)
+            headers = {"Author": "bench"}
+            post = await client.post(
+                "/api/posts",
+                json={"title": "stream", "content": "stream"},
+                headers=headers,
+            )
+            post_id = post.json()["id"]
+            await asyncio.sleep(0.5)
+            before = rss_bytes(server.pid)
+
+            started = time.perf_counter()
+            for offset in range(0, args.subscribers, args.batch):
+                count = min(args.batch, args.subscribers - offset)
+                streams += await asyncio.gather(
+                    *(subscribe(port, post_id) for _ in range(count))
+                )
+            connect = time.perf_counter() - started
+            await asyncio.sleep(0.5)
+            after = rss_bytes(server.pid)
+            print(
+                f"subscribers={len(streams)} connect={connect:.1f}s"
+                f" rss_before={before / 2**20:.1f}MiB"
+                f" rss_after={after / 2**20:.1f}MiB"
+                f" per_subscriber={(after - before) / len(streams) / 1024:.1f}KiB"
+            )
+
+            latencies = []
+            for i in range(args.comments):
+                sent = time.perf_counter()
+                comment = await client.post(
+                    "/api/comments",
+                    json={"post_id": post_id, "content": f"c{i}"},
+                    headers=headers,
+                )
+                comment_id = comment.json()["id"]
+                received = await asyncio.gather(
+                    *(receive(reader, comment_id) for reader, _ in streams)
+                )
+                latencies.append(max(received) - sent)
+            print(
+                f"fan-out to all: p50={statistics.median(latencies) * 1000:.1f}ms"
+                f" max={max(latencies) * 1000:.1f}ms"
+            )
+    finally:
+        # 연결을 실제로 닫아야 uvicorn 이 열린 스트림을 기다리지 않고 내려간다.
+        for _, writer in streams:
+            writer.close()
+        await asyncio.gather(
+            *(writer.wait_closed() for _, writer in streams),
+            return_exceptions=True,
+        )
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--comments", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
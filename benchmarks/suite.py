@@ -0,0 +1,620 @@
+"""모든 라우터를 대상으로 하는 HTTP 벤치마크 스위트.
+
+    python -m benchmarks.suite run --sizes 10k 1m 10m --output results.json
+    python -m benchmarks.suite run --baseline baseline.json
+    python -m benchmarks.suite compare results.json baseline.json
+
+데이터셋 크기(`--sizes`)마다 캐시된 DB(`benchmarks.dataset`)를 복사해 두고,
+`src/api/` 의 모든 엔드포인트를 시나리오 순서대로 호출합니다. 전송 계층은
+두 가지입니다.
+
+- `asgi`: 별도 프로세스에서 앱을 import 해 httpx ASGITransport 로 호출
+  (네트워크, 이벤트 루프 경쟁 없이 앱 자체의 비용)
+- `uvicorn`: 실제 uvicorn 프로세스를 띄우고 TCP 로 호출
+
+시나리오마다 처리량(req/s)과 p50/p95/p99 지연 시간을 JSON 으로 남깁니다.
+요청 순서와 대상 id 는 `--seed` 로 정해지므로, 같은 코드와 같은 인자로
+돌리면 같은 요청이 나갑니다. `--baseline` 또는 `compare` 는 기준 결과보다
+p95 가 `--tolerance` 이상 늘었거나 처리량이 그만큼 줄어든 시나리오를
+회귀로 표시하고 종료 코드 1 을 돌려줍니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from benchmarks.dataset import BENCH_PASSWORD, WORDS, ensure
+
+from src.api.etag import make_etag
+
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+TRANSPORTS = ("asgi", "uvicorn")
+SAMPLE_SIZE = 1000
+
+Request = tuple[str, str, dict[str, Any]]
+
+
+@dataclass
+class Context:
+    """시나리오가 요청을 만들 때 쓰는, 데이터셋에서 고른 대상들."""
+
+    rng: random.Random
+    # (post_id, author_id). 앞 절반은 조회/수정, 뒤 절반은 삭제 시나리오용
+    posts: list[tuple[str, str]]
+    # (user_id, username)
+    users: list[tuple[str, str]]
+    # 내보내기 `since`. 마지막 SAMPLE_SIZE 건 정도만 내보내도록 고른다.
+    export_since: str
+    # post_id -> (revision, comments_revision). 조건부 GET 의 ETag 를 만든다.
+    # 카운터 트리거와 repair 가 revision 을 올리므로 초기값을 가정하지 않는다.
+    revisions: dict[str, tuple[int, int]]
+
+    @property
+    def readable(self) -> list[tuple[str, str]]:
+        return self.posts[: len(self.posts) // 2]
+
+    @property
+    def deletable(self) -> list[tuple[str, str]]:
+        return self.posts[len(self.posts) // 2 :]
+
+
+def load_context(db_path: Path, seed: int) -> Context:
+    rng = random.Random(seed)
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        max_rowid = conn.execute("SELECT max(rowid) FROM post").fetchone()[0]
+        rowids = sorted(rng.sample(range(1, max_rowid + 1), SAMPLE_SIZE * 2))
+        placeholders = ",".join("?" * len(rowids))
+        rows = conn.execute(
+            "SELECT id, author_id, revision, comments_revision FROM post"
+            f" WHERE rowid IN ({placeholders})",
+            rowids,
+        ).fetchall()
+        posts = [(post_id, author_id) for post_id, author_id, *_ in rows]
+        revisions = {post_id: tuple(revs) for post_id, _, *revs in rows}
+        rng.shuffle(posts)
+        users = conn.execute(
+            "SELECT id, username FROM user ORDER BY rowid LIMIT ?",
+            (SAMPLE_SIZE,),
+        ).fetchall()
+        export_since = conn.execute(
+            "SELECT id FROM post ORDER BY id DESC LIMIT 1 OFFSET ?",
+            (min(SAMPLE_SIZE, max_rowid - 1),),
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    return Context(rng, posts, users, export_since, revisions)
+
+
+@dataclass
+class Scenario:
+    name: str
+    build: Callable[[Context, int], Request]
+    ok: tuple[int, ...] = (200,)
+    # 요청 수 상한. 비싼 작업(해시, 대량 쓰기)이나 대상 수가 정해진 시나리오용
+    limit: int | None = None
+
+
+def _post(ctx: Context) -> tuple[str, str]:
+    return ctx.rng.choice(ctx.readable)
+
+
+def _etag(ctx: Context, kind: str, post_id: str) -> str:
+    revision, comments_revision = ctx.revisions[post_id]
+    return make_etag(kind, revision if kind == "post" else comments_revision)
+
+
+def _words(ctx: Context, count: int) -> str:
+    return " ".join(ctx.rng.choices(WORDS, k=count))
+
+
+def _import_body(ctx: Context, i: int) -> bytes:
+    author_id = ctx.rng.choice(ctx.users)[0]
+    rows = (
+        {
+            "author_id": author_id,
+            "title": f"import {i}",
+            "content": _words(ctx, 40),
+        }
+        for _ in range(100)
+    )
+    return "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+
+# 읽기를 먼저, 쓰기를 나중에, 삭제를 마지막에 둔다.
+SCENARIOS = [
+    Scenario("health", lambda ctx, i: ("GET", "/api/health", {})),
+    Scenario(
+        "posts.list",
+        lambda ctx, i: ("GET", "/api/posts", {"params": {"limit": 20}}),
+    ),
+    Scenario(
+        "posts.list_after",
+        lambda ctx, i: (
+            "GET",
+            "/api/posts",
+            {"params": {"limit": 20, "after": _post(ctx)[0]}},
+        ),
+    ),
+    Scenario(
+        "posts.get",
+        lambda ctx, i: ("GET", f"/api/posts/{_post(ctx)[0]}", {}),
+    ),
+    Scenario(
+        "posts.comments",
+        lambda ctx, i: (
+            "GET",
+            f"/api/posts/{_post(ctx)[0]}/comments",
+            {"params": {"limit": 20}},
+        ),
+    ),
+    # 폴링: 쓰기 시나리오보다 앞에 있어, 불러올 때 읽은 revision 이 그대로다.
+    Scenario(
+        "posts.get_304",
+        lambda ctx, i: (
+            "GET",
+            f"/api/posts/{(post_id := _post(ctx)[0])}",
+            {"headers": {"If-None-Match": _etag(ctx, "post", post_id)}},
+        ),
+        ok=(304,),
+    ),
+    Scenario(
+        "posts.comments_304",
+        lambda ctx, i: (
+            "GET",
+            f"/api/posts/{(post_id := _post(ctx)[0])}/comments",
+            {
+                "params": {"limit": 20},
+                "headers": {"If-None-Match": _etag(ctx, "comments", post_id)},
+            },
+        ),
+        ok=(304,),
+    ),
+    Scenario(
+        "posts.search",
+        lambda ctx, i: (
+            "GET",
+            "/api/posts/search",
+            {"params": {"q": _words(ctx, 2)}},
+        ),
+    ),
+    Scenario(
+        "comments.search",
+        lambda ctx, i: (
+            "GET",
+            "/api/posts/search",
+            {"params": {"q": _words(ctx, 1), "target": "comments"}},
+        ),
+    ),
+    Scenario(
+        "auth.posts",
+        lambda ctx, i: (
+            "GET",
+            f"/api/auth/{ctx.rng.choice(ctx.users)[0]}/posts",
+            {"params": {"limit": 20}},
+        ),
+    ),
+    Scenario(
+        "export.posts",
+        lambda ctx, i: (
+            "GET",
+            "/api/export/posts",
+            {"params": {"since": ctx.export_since}},
+        ),
+        limit=100,
+    ),
+    Scenario("metrics", lambda ctx, i: ("GET", "/api/metrics", {})),
+    Scenario(
+        "auth.login",
+        lambda ctx, i: (
+            "POST",
+            "/api/auth/login",
+            {
+                "json": {
+                    "username": ctx.rng.choice(ctx.users)[1],
+                    "password": BENCH_PASSWORD,
+                }
+            },
+        ),
+        limit=200,
+    ),
+    Scenario(
+        "auth.signup",
+        lambda ctx, i: (
+            "POST",
+            "/api/auth",
+            {
+                "json": {
+                    "username": f"bench_new_{i}",
+                    "nickname": f"new_{i}",
+                    "password": BENCH_PASSWORD,
+                }
+            },
+        ),
+        ok=(201,),
+        limit=200,
+    ),
+    Scenario(
+        "posts.create",
+        lambda ctx, i: (
+            "POST",
+            "/api/posts",
+            {
+                "json": {"title": _words(ctx, 6), "content": _words(ctx, 40)},
+                "headers": {"Author": ctx.rng.choice(ctx.users)[0]},
+            },
+        ),
+        ok=(201,),
+    ),
+    Scenario(
+        "posts.update",
+        lambda ctx, i: (
+            "PUT",
+            f"/api/posts/{(post := _post(ctx))[0]}",
+            {
+                "json": {"title": _words(ctx, 6), "content": _words(ctx, 40)},
+                "headers": {"Author": post[1]},
+            },
+        ),
+    ),
+    Scenario(
+        "comments.create",
+        lambda ctx, i: (
+            "POST",
+            "/api/comments",
+            {
+                "json": {"post_id": _post(ctx)[0], "content": _words(ctx, 12)},
+                "headers": {"Author": ctx.rng.choice(ctx.users)[0]},
+            },
+        ),
+        ok=(201,),
+    ),
+    Scenario(
+        "import.posts",
+        lambda ctx, i: (
+            "POST",
+            "/api/import/posts",
+            {"content": _import_body(ctx, i)},
+        ),
+        limit=50,
+    ),
+    Scenario(
+        "posts.delete",
+        lambda ctx, i: (
+            "DELETE",
+            f"/api/posts/{ctx.deletable[i][0]}",
+            {"headers": {"Author": ctx.deletable[i][1]}},
+        ),
+        limit=SAMPLE_SIZE,
+    ),
+]
+
+
+@dataclass
+class Result:
+    size: str
+    transport: str
+    scenario: str
+    requests: int
+    errors: int
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    statuses: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return self.size, self.transport, self.scenario
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: Context,
+    requests: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    if scenario.limit is not None:
+        requests = min(requests, scenario.limit)
+    if scenario.name == "posts.delete":
+        requests = min(requests, len(ctx.deletable))
+
+    # 요청은 미리 만들어, 실행 순서와 무관하게 같은 요청 집합이 나가게 한다.
+    planned = iter([scenario.build(ctx, i) for i in range(requests)])
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for method, url, kwargs in planned:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.HTTPError as exc:
+                statuses[type(exc).__name__] += 1
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            statuses[str(response.status_code)] += 1
+            if response.status_code not in scenario.ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "scenario": scenario.name,
+        "requests": requests,
+        "errors": errors,
+        "duration_s": round(duration, 4),
+        "throughput_rps": round(requests / duration, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "mean_ms": round(sum(latencies) / max(len(latencies), 1) * 1000, 3),
+        "statuses": dict(statuses),
+    }
+
+
+async def run_all(
+    client: httpx.AsyncClient, ctx: Context, args: argparse.Namespace
+) -> list[dict[str, Any]]:
+    results = []
+    for scenario in SCENARIOS:
+        if args.scenarios and scenario.name not in args.scenarios:
+            continue
+        result = await run_scenario(
+            client, scenario, ctx, args.requests, args.concurrency
+        )
+        print(
+            f"  {scenario.name:<18} {result['throughput_rps']:>9.1f} req/s"
+            f"  p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}"
+            f"  p99 {result['p99_ms']:>8.2f} ms  errors {result['errors']}",
+            file=sys.stderr,
+        )
+        results.append(result)
+    return results
+
+
+async def run_asgi(args: argparse.Namespace) -> list[dict[str, Any]]:
+    # DATABASE_PATH 는 부모 프로세스가 환경 변수로 넘긴다.
+    from src.main import app
+
+    ctx = load_context(Path(args.db), args.seed)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            timeout=args.timeout,
+        ) as client:
+            return await run_all(client, ctx, args)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(client: httpx.AsyncClient) -> None:
+    for _ in range(300):
+        try:
+            await client.get("/api/health")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("uvicorn did not start")
+
+
+async def run_uvicorn(
+    db_path: Path, args: argparse.Namespace
+) -> list[dict[str, Any]]:
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app"]
+        + ["--host", "127.0.0.1", "--port", str(port)]
+        + ["--log-level", "warning", "--no-access-log"],
+        env={**os.environ, "DATABASE_PATH": str(db_path)},
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}",
+            limits=httpx.Limits(max_connections=args.concurrency),
+            timeout=args.timeout,
+        ) as client:
+            await wait_ready(client)
+            ctx = load_context(db_path, args.seed)
+            return await run_all(client, ctx, args)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run_in_asgi_process(
+    db_path: Path, args: argparse.Namespace
+) -> list[dict[str, Any]]:
+    # src 의 엔진은 import 시점의 DATABASE_PATH 를 쓰므로 프로세스를 나눈다.
+    command = [sys.executable, "-m", "benchmarks.suite", "_asgi"]
+    command += ["--db", str(db_path), "--seed", str(args.seed)]
+    command += ["--requests", str(args.requests)]
+    command += ["--concurrency", str(args.concurrency)]
+    command += ["--timeout", str(args.timeout)]
+    if args.scenarios:
+        command += ["--scenarios", *args.scenarios]
+    output = subprocess.run(
+        command,
+        env={**os.environ, "DATABASE_PATH": str(db_path)},
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def metadata(args: argparse.Namespace) -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "args": {
+            "sizes": args.sizes,
+            "transports": args.transports,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+        },
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    report: dict[str, Any] = {"meta": metadata(args), "results": []}
+    for size in args.sizes:
+        dataset = ensure(SIZES[size], args.seed)
+        for transport in args.transports:
+            print(f"[{size} / {transport}]", file=sys.stderr)
+            with tempfile.TemporaryDirectory() as tmp:
+                # 쓰기 시나리오가 캐시된 데이터셋을 바꾸지 않도록 복사본을 쓴다.
+                db_path = Path(tmp) / "bench.db"
+                shutil.copyfile(dataset, db_path)
+                if transport == "asgi":
+                    results = run_in_asgi_process(db_path, args)
+                else:
+                    results = asyncio.run(run_uvicorn(db_path, args))
+            for result in results:
+                report["results"].append(
+                    {"size": size, "transport": transport, **result}
+                )
+
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"wrote {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        return compare(report, load(args.baseline), args.tolerance)
+    return 0
+
+
+def load(path: str) -> dict[str, Any]:
+    return json.loads(Path(path).read_text())
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> int:
+    """p95 가 늘었거나 처리량이 줄어든 비율이 `tolerance` 를 넘으면 회귀로 본다."""
+    base = {
+        (r["size"], r["transport"], r["scenario"]): r
+        for r in baseline["results"]
+    }
+    regressions = 0
+    print(
+        f"{'size':>5} {'transport':>9} {'scenario':<18}"
+        f" {'req/s':>16} {'p95 (ms)':>20}"
+    )
+    for result in current["results"]:
+        key = (result["size"], result["transport"], result["scenario"])
+        before = base.get(key)
+        if before is None:
+            continue
+        rps_change = result["throughput_rps"] / before["throughput_rps"] - 1
+        p95_change = result["p95_ms"] / max(before["p95_ms"], 1e-9) - 1
+        regressed = rps_change < -tolerance or p95_change > tolerance
+        regressions += regressed
+        print(
+            f"{key[0]:>5} {key[1]:>9} {key[2]:<18}"
+            f" {result['throughput_rps']:>9.1f} {rps_change:>+6.0%}"
+            f" {result['p95_ms']:>11.2f} {p95_change:>+7.0%}"
+            + ("  REGRESSION" if regressed else "")
+        )
+    print(f"{regressions} regression(s), tolerance {tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_load_options(command: argparse.ArgumentParser) -> None:
+        command.add_argument("--requests", type=int, default=1000)
+        command.add_argument("--concurrency", type=int, default=32)
+        command.add_argument("--timeout", type=float, default=60.0)
+        command.add_argument("--seed", type=int, default=0)
+        command.add_argument(
+            "--scenarios",
+            nargs="+",
+            choices=[scenario.name for scenario in SCENARIOS],
+        )
+
+    run_command = commands.add_parser("run")
+    add_load_options(run_command)
+    run_command.add_argument(
+        "--sizes", nargs="+", choices=list(SIZES), default=["10k"]
+    )
+    run_command.add_argument(
+        "--transports", nargs="+", choices=TRANSPORTS, default=list(TRANSPORTS)
+    )
+    run_command.add_argument("--output", default="bench-results.json")
+    run_command.add_argument("--baseline")
+    run_command.add_argument("--tolerance", type=float, default=0.10)
+
+    compare_command = commands.add_parser("compare")
+    compare_command.add_argument("current")
+    compare_command.add_argument("baseline")
+    compare_command.add_argument("--tolerance", type=float, default=0.10)
+
+    # run 이 ASGI 전송 계층을 돌릴 때 쓰는 내부 명령
+    asgi_command = commands.add_parser("_asgi")
+    add_load_options(asgi_command)
+    asgi_command.add_argument("--db", required=True)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        sys.exit(run(args))
+    elif args.command == "compare":
+        sys.exit(
+            compare(load(args.current), load(args.baseline), args.tolerance)
+        )
+    else:
+        print(json.dumps(asyncio.run(run_asgi(args))))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,45 @@
-from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session
+from fastapi import APIRouter, HTTPException, Query, status
 
+from src.api.routing import FastJSONRoute
+from src.domain.page import ULID_PATTERN, Page
 from src.domain.post import PostResponse
-from src.domain.user import UserCreateRequest, UserResponse
+from src.domain.user import (
+    UserCreateRequest,
+    UserLoginRequest,
+    UserResponse,
+    UserStatsResponse,
+)
+from src.repository.base import DuplicateError
 from src.service.account import (
+    authenticate_user_service,
     check_user,
     check_user_by_nickname,
     create_user_service,
     get_posts_by_author_service,
+    get_user_stats_service,
 )
 from src.service.password import validate_password
-from src.sqlite3.connection import get_session
+from src.service.repository import RepositoriesDep
 
-auth_router = APIRouter()
+auth_router = APIRouter(route_class=FastJSONRoute)
 
 TIME_ZONE = ZoneInfo("Asia/Seoul")
 
-# TODO: 의존성 주입에 대해 설명하기.
-SessionDep = Annotated[Session, Depends(get_session)]
-
 
 # CONSIDERATION: `account.py` 이니, /auth 대신 /account 를 사용하는건 어떨까요?
 @auth_router.post(
     "/auth", response_model=UserResponse, status_code=status.HTTP_201_CREATED
 )
-def create_user(data: UserCreateRequest, session: SessionDep) -> None:
-    if check_user(data.username, session):
+async def create_user(data: UserCreateRequest, repo: RepositoriesDep) -> None:
+    if await check_user(data.username, repo.users):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="User already exists.",
         )
 
-    if check_user_by_nickname(data.nickname, session):
+    if await check_user_by_nickname(data.nickname, repo.users):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Nickname already in use.",
@@ -42,15 +47,40 @@ def create_user(data: UserCreateRequest, session: SessionDep) -> None:
 
     validate_password(data.password)
 
-    return create_user_service(data, session)
+    try:
+        return await create_user_service(data, repo.users)
+    except DuplicateError:
+        # 확인과 INSERT 사이에 같은 username / nickname 으로 가입한 경우
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User already exists.",
+        )
+
+
+@auth_router.post(
+    "/auth/login", response_model=UserResponse, status_code=status.HTTP_200_OK
+)
+async def login(data: UserLoginRequest, repo: RepositoriesDep) -> UserResponse:
+    return await authenticate_user_service(data, repo.users)
 
 
 # TODO: 반환 값 타입 힌팅이 추가 필요. (타입 힌팅을 항상 챙겨주세요!)
-@auth_router.get("/auth/{auth_id}/posts", response_model=list[PostResponse])
-def get_posts_by_user(
+@auth_router.get("/auth/{auth_id}/posts", response_model=Page[PostResponse])
+async def get_posts_by_user(
     auth_id: str,
-    session: SessionDep,
+    repo: RepositoriesDep,
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    after: str | None = Query(None, pattern=ULID_PATTERN),
 ):
-    return get_posts_by_author_service(auth_id, session, limit, offset)
+    return await get_posts_by_author_service(auth_id, repo.posts, limit, after)
+
+
+@auth_router.get(
+    "/auth/{auth_id}/stats",
+    response_model=UserStatsResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_user_stats(
+    auth_id: str, repo: RepositoriesDep
+) -> UserStatsResponse:
+    return await get_user_stats_service(auth_id, repo.posts, repo.comments)
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from collections import deque
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import dev
+from src.metrics.registry import REGISTRY
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# 상태 확인과 메트릭은 과부하일 때 더 필요하므로 막지 않는다.
+EXEMPT_PATHS = frozenset({"/api/health", "/api/metrics"})
+# SSE 구독은 대부분 쉬면서 연결만 붙잡으므로 자리를 차지하지 않게 한다.
+# 구독자 수는 허브(src/service/stream.py)가 따로 제한한다.
+EXEMPT_SUFFIXES = ("/stream",)
+# 본문으로 id 목록을 받느라 POST 지만 읽기만 하는 요청
+READ_SUFFIXES = (":batchGet",)
+
+ADMISSION_WAIT_SECONDS = REGISTRY.histogram(
+    "admission_wait_seconds",
+    "Time admitted requests spent in the admission queue",
+    ("route_class",),
+)
+
+
+class AdmissionGate:
+    """동시에 처리하는 요청 수를 `limit` 개로 제한한다.
+
+    자리가 없으면 최대 `queue_size` 개까지 먼저 온 순서대로 기다리게 하고,
+    `timeout` 초 안에 자리가 나지 않거나 대기열이 가득 차면 바로 거절한다.
+    넘치는 요청을 모두 받아 writer 와 스레드 풀 뒤에 쌓는 대신 일찍 거절해,
+    받아들인 요청의 지연 시간은 과부하에서도 한도 안에 머물게 한다.
+
+    이벤트 루프 스레드에서만 쓰므로 락을 두지 않는다.
+    """
+
+    def __init__(
+        self, name: str, limit: int, queue_size: int, timeout: float
+    ) -> None:
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self.rejected = {"queue_full": 0, "deadline": 0}
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.rejected["queue_full"] += 1
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout):
+                await future
+        except TimeoutError:
+            if not future.cancelled():
+                # 시간이 다 된 순간 자리를 넘겨받았다.
+                return True
+            self._discard(future)
+            self.rejected["deadline"] += 1
+            return False
+        except asyncio.CancelledError:
+            # 기다리던 중 연결이 끊겼다. 넘겨받은 자리가 있으면 돌려준다.
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                self._discard(future)
+            raise
+        ADMISSION_WAIT_SECONDS.observe(
+            time.perf_counter() - started, route_class=self.name
+        )
+        return True
+
+    def release(self) -> None:
+        # 기다리는 요청이 있으면 active 를 줄이지 않고 자리를 그대로 넘긴다.
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def _discard(self, future: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            # release 가 이미 꺼내 갔다.
+            pass
+
+
+class AdmissionMiddleware:
+    """읽기(GET/HEAD/OPTIONS)와 쓰기 요청에 각각 AdmissionGate 를 건다.
+
+    거절하면 라우팅이나 DB 접근 없이 바로 503(또는 설정한 상태 코드)과
+    `Retry-After` 로 답한다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        read: AdmissionGate,
+        write: AdmissionGate,
+        reject_status: int = 503,
+        retry_after: int = 1,
+    ) -> None:
+        self.app = app
+        self.read = read
+        self.write = write
+        self.reject_status = reject_status
+        self.retry_after = str(retry_after)
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] in EXEMPT_PATHS
+            or scope["path"].endswith(EXEMPT_SUFFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] in READ_METHODS or scope["path"].endswith(
+            READ_SUFFIXES
+        ):
+            gate = self.read
+        else:
+            gate = self.write
+        if not await gate.acquire():
+            response = JSONResponse(
+                {"detail": "Server is busy. Please retry later."},
+                status_code=self.reject_status,
+                headers={"Retry-After": self.retry_after},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release()
+
+
+READ_GATE = AdmissionGate(
+    "read",
+    limit=dev.admission_read_limit,
+    queue_size=dev.admission_read_queue,
+    timeout=dev.admission_queue_timeout_s,
+)
+WRITE_GATE = AdmissionGate(
+    "write",
+    limit=dev.admission_write_limit,
+    queue_size=dev.admission_write_queue,
+    timeout=dev.admission_queue_timeout_s,
+)
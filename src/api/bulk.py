@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Request, status
+
+from src.domain.bulk import BulkImportReport
+from src.service.bulk import BulkTarget, bulk_import
+
+bulk_router = APIRouter()
+
+
+# 본문(NDJSON)을 한 번에 읽지 않고 스트림으로 받아 배치 단위로 넣는다.
+@bulk_router.post(
+    "/import/{target}",
+    response_model=BulkImportReport,
+    status_code=status.HTTP_200_OK,
+)
+async def import_rows(target: BulkTarget, request: Request) -> BulkImportReport:
+    return await bulk_import(target, request.stream())
@@ -1,8 +1,6 @@
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, Header, status
-from sqlmodel import Session
+from fastapi import APIRouter, Header, status
 
+from src.api.routing import FastJSONRoute
 from src.domain.comment import (
     CommentCreateRequest,
     CommentResponse,
@@ -10,11 +8,9 @@ from src.domain.comment import (
 from src.service.comment import (
     create_comment_service,
 )
-from src.sqlite3.connection import get_session
-
-SessionDep = Annotated[Session, Depends(get_session)]
+from src.service.repository import RepositoriesDep
 
-comment_router = APIRouter()
+comment_router = APIRouter(route_class=FastJSONRoute)
 
 
 @comment_router.post(
@@ -22,9 +18,9 @@ comment_router = APIRouter()
     response_model=CommentResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_comment(
+async def create_comment(
     data: CommentCreateRequest,
-    session: SessionDep,
+    repo: RepositoriesDep,
     author: str = Header(..., alias="Author"),
 ):
-    return create_comment_service(data, session, author)
+    return await create_comment_service(data, repo.comments, author)
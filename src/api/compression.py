@@ -0,0 +1,274 @@
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from functools import partial
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import dev
+from src.metrics.registry import REGISTRY
+
+# brotli, zstandard 는 선택 의존성이다. 없으면 gzip 만 협상한다.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+# SSE 는 연결마다 압축기 상태(수백 KB)를 오래 붙잡게 되므로 압축하지 않는다.
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+COMPRESSION_BYTES = REGISTRY.counter(
+    "http_compression_bytes_total",
+    "Response body bytes before (in) and after (out) compression",
+    ("encoding", "stage"),
+)
+
+
+class Encoder(ABC):
+    """스트리밍 압축기. 조각마다 지금까지의 입력을 풀 수 있게 흘려보낸다."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes: ...
+
+    @abstractmethod
+    def finish(self, data: bytes) -> bytes:
+        """마지막 조각을 압축하고 스트림을 닫는다."""
+
+
+class GzipEncoder(Encoder):
+    def __init__(self, level: int) -> None:
+        # wbits 31 = gzip 헤더와 트레일러를 붙인 DEFLATE
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        # SYNC_FLUSH 로 조각 경계까지 내보내, 클라이언트가 바로 풀어 읽게 한다.
+        compressor = self._compressor
+        return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class BrotliEncoder(Encoder):
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class ZstdEncoder(Encoder):
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = self._compressor
+        return compressor.compress(data) + compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+ENCODERS: dict[str, type[Encoder]] = {"gzip": GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = BrotliEncoder
+if zstandard is not None:
+    ENCODERS["zstd"] = ZstdEncoder
+
+
+def negotiate(accept_encoding: str, preferred: Sequence[str]) -> str | None:
+    """Accept-Encoding 에서 q 값이 가장 큰 인코딩을 고른다. (RFC 9110 12.5.3)
+
+    q 값이 같으면 `preferred` 순서(서버 선호)를 따른다. q=0 은 거부다.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                continue
+        weights[name] = q
+
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in preferred:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 을 보고 zstd / br / gzip 중 하나로 응답을 압축한다.
+
+    - `minimum_size` 보다 작은 한 번에 끝나는 응답은 그대로 보낸다.
+    - StreamingResponse(NDJSON 내보내기 등)는 본문을 모으지 않고 조각마다
+      압축해 흘려보낸다.
+    - 이미 인코딩된 응답, JSON/텍스트가 아닌 응답, 본문 없는 응답은 건드리지 않는다.
+    - 압축을 협상한 JSON/텍스트 응답은 강한 ETag 를 약한 ETag 로 바꾸고
+      `Vary: Accept-Encoding` 을 붙인다. 압축하면 바이트가 달라지기 때문이다.
+      작아서 그대로 보내는 응답과 304 도 같게 해, 한 표현의 ETag 가 하나다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encoders: dict[str, Callable[[], Encoder]],
+        minimum_size: int = 1024,
+    ) -> None:
+        self.app = app
+        # dict 순서가 서버 선호 순서다.
+        self.encoders = encoders
+        self.minimum_size = minimum_size
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate(accept_encoding, tuple(self.encoders))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingSend(
+            send, encoding, self.encoders[encoding], self.minimum_size
+        )
+        await self.app(scope, receive, responder)
+
+
+def _mark_negotiated(headers: MutableHeaders) -> None:
+    headers.add_vary_header("Accept-Encoding")
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _CompressingSend:
+    def __init__(
+        self,
+        send: Send,
+        encoding: str,
+        make_encoder: Callable[[], Encoder],
+        minimum_size: int,
+    ) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.make_encoder = make_encoder
+        self.minimum_size = minimum_size
+        self.start: Message | None = None
+        self.encoder: Encoder | None = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+        elif message["type"] == "http.response.start":
+            self._on_start(message)
+            if self.passthrough:
+                await self.send(message)
+        elif message["type"] == "http.response.body":
+            await self._on_body(message)
+        else:
+            await self.send(message)
+
+    def _on_start(self, message: Message) -> None:
+        headers = Headers(raw=message["headers"])
+        content_type = headers.get("content-type", "")
+        if message["status"] == 304:
+            # 304 는 200 이 보냈을 ETag 와 Vary 를 실어야 한다. (RFC 9110 15.4.5)
+            _mark_negotiated(MutableHeaders(raw=message["headers"]))
+            self.passthrough = True
+            return
+        if (
+            message["status"] == 204
+            or "content-encoding" in headers
+            or not content_type.startswith(COMPRESSIBLE_TYPES)
+            or content_type.startswith(UNCOMPRESSED_TYPES)
+        ):
+            self.passthrough = True
+            return
+        self.start = message
+
+    async def _on_body(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            headers = MutableHeaders(raw=self.start["headers"])
+            _mark_negotiated(headers)
+            if not more_body and len(body) < self.minimum_size:
+                # 작은 응답은 압축해도 줄어드는 양보다 CPU 와 헤더 비용이 크다.
+                await self.send(self.start)
+                await self.send(message)
+                self.passthrough = True
+                return
+
+            self.encoder = self.make_encoder()
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                # 전체 길이를 미리 알 수 없으므로 chunked 로 보낸다.
+                del headers["Content-Length"]
+            else:
+                compressed = self.encoder.finish(body)
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(self.start)
+                await self._send_body(body, compressed, more_body=False)
+                return
+            await self.send(self.start)
+
+        if more_body:
+            compressed = self.encoder.compress(body)
+        else:
+            compressed = self.encoder.finish(body)
+        await self._send_body(body, compressed, more_body)
+
+    async def _send_body(
+        self, body: bytes, compressed: bytes, more_body: bool
+    ) -> None:
+        COMPRESSION_BYTES.inc(len(body), encoding=self.encoding, stage="in")
+        COMPRESSION_BYTES.inc(
+            len(compressed), encoding=self.encoding, stage="out"
+        )
+        await self.send(
+            {
+                "type": "http.response.body",
+                "body": compressed,
+                "more_body": more_body,
+            }
+        )
+
+
+LEVELS = {
+    "zstd": dev.compression_zstd_level,
+    "br": dev.compression_brotli_quality,
+    "gzip": dev.compression_gzip_level,
+}
+# 설정한 선호 순서 중 설치된 것만 쓴다.
+COMPRESSION_ENCODERS: dict[str, Callable[[], Encoder]] = {
+    name: partial(ENCODERS[name], LEVELS[name])
+    for name in dev.compression_encodings
+    if name in ENCODERS
+}
@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+
+def make_etag(kind: str, revision: int) -> str:
+    # 강한(strong) ETag. revision 이 같으면 본문도 바이트 단위로 같다.
+    return f'"{kind}-{revision}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 는 약한 비교를 한다. (RFC 9110 13.1.2)"""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag.removeprefix("W/") for tag in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def json_with_etag(value: BaseModel, etag: str) -> Response:
+    # `response: Response` 파라미터로 헤더를 붙이면 FastJSONRoute 의 빠른 경로를
+    # 못 쓰므로, 같은 직렬화기로 직접 응답을 만든다.
+    return Response(
+        content=value.model_dump_json(),
+        media_type=JSONResponse.media_type,
+        headers={"ETag": etag},
+    )
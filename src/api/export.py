@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Query, status
+from fastapi.responses import StreamingResponse
+
+from src.domain.comment import Comment, CommentResponse
+from src.domain.page import ULID_PATTERN
+from src.domain.post import Post, PostResponse
+from src.repository.sql import LIVE_COMMENT, LIVE_POST
+from src.service.export import stream_ndjson
+
+export_router = APIRouter()
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+# 전체 목록을 메모리에 만들지 않고, 한 줄에 한 건씩(NDJSON) 흘려보낸다.
+@export_router.get("/export/posts", status_code=status.HTTP_200_OK)
+async def export_posts(
+    since: str | None = Query(None, pattern=ULID_PATTERN),
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_ndjson(Post, Post.id, PostResponse, since, where=LIVE_POST),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+@export_router.get("/export/comments", status_code=status.HTTP_200_OK)
+async def export_comments(
+    since: str | None = Query(None, pattern=ULID_PATTERN),
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_ndjson(
+            Comment, Comment.id, CommentResponse, since, where=LIVE_COMMENT
+        ),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
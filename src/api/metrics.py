@@ -0,0 +1,113 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.api.admission import READ_GATE, WRITE_GATE
+from src.metrics.registry import REGISTRY
+from src.service.cache import CACHE
+from src.service.password import PASSWORD_HASHER
+from src.service.purge import PURGER
+from src.service.stream import COMMENT_HUB
+from src.service.views import VIEW_COUNTER
+
+metrics_router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+CACHE_EVENTS = REGISTRY.counter(
+    "cache_events_total", "Read-through cache events", ("event",)
+)
+CACHE_SIZE = REGISTRY.gauge("cache_size", "Read-through cache size", ("unit",))
+PASSWORD_HASH_PENDING = REGISTRY.gauge(
+    "password_hash_pending", "Password hash jobs running or queued"
+)
+PASSWORD_HASH_REJECTED = REGISTRY.counter(
+    "password_hash_rejected_total",
+    "Password hash jobs rejected because the queue was full",
+)
+
+ADMISSION_ACTIVE = REGISTRY.gauge(
+    "admission_active", "Requests admitted and running", ("route_class",)
+)
+ADMISSION_QUEUED = REGISTRY.gauge(
+    "admission_queued",
+    "Requests waiting in the admission queue",
+    ("route_class",),
+)
+ADMISSION_REJECTED = REGISTRY.counter(
+    "admission_rejected_total",
+    "Requests rejected by admission control",
+    ("route_class", "reason"),
+)
+
+PURGED = REGISTRY.counter(
+    "purge_deleted_total",
+    "Rows of soft-deleted posts removed by the purger",
+    ("table",),
+)
+PURGE_BACKLOG = REGISTRY.gauge(
+    "purge_backlog", "Rows of soft-deleted posts not purged yet", ("table",)
+)
+PURGE_FAILURES = REGISTRY.counter(
+    "purge_failures_total", "Purge runs that failed and will be retried"
+)
+
+COMMENT_STREAM_SUBSCRIBERS = REGISTRY.gauge(
+    "comment_stream_subscribers", "Open comment SSE subscriptions"
+)
+COMMENT_STREAM_EVENTS = REGISTRY.counter(
+    "comment_stream_events_total",
+    "Comments published to subscribers, and subscribers dropped as too slow",
+    ("event",),
+)
+
+POST_VIEWS_BUFFERED = REGISTRY.gauge(
+    "post_views_buffered", "Post views counted in memory and not flushed yet"
+)
+POST_VIEWS_FLUSHED = REGISTRY.counter(
+    "post_views_flushed_total", "Post views written to the database"
+)
+POST_VIEW_FLUSH_FAILURES = REGISTRY.counter(
+    "post_view_flush_failures_total",
+    "View count flushes that failed and will be retried",
+)
+
+
+def _collect() -> None:
+    # 다른 곳에서 누적 중인 값은 수집할 때 옮겨 담는다.
+    stats = CACHE.stats()
+    for event in (
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "invalidations",
+    ):
+        CACHE_EVENTS.set(getattr(stats, event), event=event)
+    CACHE_SIZE.set(stats.entries, unit="entries")
+    CACHE_SIZE.set(stats.bytes, unit="bytes")
+    PASSWORD_HASH_PENDING.set(PASSWORD_HASHER.pending)
+    PASSWORD_HASH_REJECTED.set(PASSWORD_HASHER.rejected)
+    for gate in (READ_GATE, WRITE_GATE):
+        ADMISSION_ACTIVE.set(gate.active, route_class=gate.name)
+        ADMISSION_QUEUED.set(gate.queued, route_class=gate.name)
+        for reason, count in gate.rejected.items():
+            ADMISSION_REJECTED.set(count, route_class=gate.name, reason=reason)
+    PURGED.set(PURGER.purged_posts, table="post")
+    PURGED.set(PURGER.purged_comments, table="comment")
+    PURGE_BACKLOG.set(PURGER.backlog_posts, table="post")
+    PURGE_BACKLOG.set(PURGER.backlog_comments, table="comment")
+    PURGE_FAILURES.set(PURGER.failures)
+    COMMENT_STREAM_SUBSCRIBERS.set(COMMENT_HUB.subscribers)
+    COMMENT_STREAM_EVENTS.set(COMMENT_HUB.published, event="published")
+    COMMENT_STREAM_EVENTS.set(COMMENT_HUB.dropped, event="dropped")
+    POST_VIEWS_BUFFERED.set(VIEW_COUNTER.buffered)
+    POST_VIEWS_FLUSHED.set(VIEW_COUNTER.flushed)
+    POST_VIEW_FLUSH_FAILURES.set(VIEW_COUNTER.failures)
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    _collect()
+    return PlainTextResponse(
+        REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
@@ -3,62 +3,129 @@ from typing import Annotated
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
-from sqlmodel import Session, select
-from ulid import ULID
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.api.etag import etag_matches, json_with_etag, make_etag, not_modified
+from src.api.routing import FastJSONRoute
 from src.domain.comment import CommentResponse
-from src.domain.post import DeletePostResponse, Post, PostRequest, PostResponse
+from src.domain.ids import new_ulid
+from src.domain.page import ULID_PATTERN, Page
+from src.domain.post import (
+    BatchGetPostsRequest,
+    BatchGetPostsResponse,
+    DeletePostResponse,
+    Post,
+    PostRequest,
+    PostResponse,
+    PostViewsResponse,
+)
+from src.domain.search import SEARCH_CURSOR_PATTERN, SearchHit
+from src.service.cache import (
+    invalidate_comments,
+    invalidate_post,
+    post_tag,
+    read_through,
+)
 from src.service.comment import get_comments_by_post_service
-from src.sqlite3.connection import get_session
+from src.service.pagination import to_page
+from src.service.post import batch_get_posts_service
+from src.service.purge import PURGER
+from src.service.repository import (
+    RepositoriesDep,
+    open_repositories,
+    require_sqlite,
+)
+from src.service.revision import get_comments_revision, get_post_revision
+from src.service.search import SearchTarget, search_service
+from src.service.stream import (
+    COMMENT_HUB,
+    SubscriberLimitError,
+    comment_events,
+)
+from src.service.views import VIEW_COUNTER
+from src.sqlite3.connection import get_read_session
 
-post_router = APIRouter()
+post_router = APIRouter(route_class=FastJSONRoute)
 
 TIME_ZONE = ZoneInfo("Asia/Seoul")
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
 
 # TODO: 의존성 주입에 대해 설명하기.
-# ❕ 과제: DB가 바뀌어도, 이 안에있는 코드들은 바뀌지 않도록 설계 해보기
-SessionDep = Annotated[Session, Depends(get_session)]
+# DONE: ❕ 과제: DB가 바뀌어도, 이 안에있는 코드들은 바뀌지 않도록 설계 해보기
+#       저장소는 RepositoriesDep 로 주입받습니다. (src/repository/)
+#       검색만 SQLite FTS5 에 기대므로 세션을 직접 받습니다.
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
 
 
 @post_router.post(
     "/posts", response_model=PostResponse, status_code=status.HTTP_201_CREATED
 )
-def create_post(
+async def create_post(
     post: PostRequest,
-    session: SessionDep,
+    repo: RepositoriesDep,
     author: str = Header(..., alias="Author"),
 ) -> PostResponse:
     # TODO: id를 만드는 여러 방식에 대해 설명하기.
     new_post = Post(
-        id=str(ULID()),
+        id=new_ulid(),
         author_id=author,
         title=post.title,
         content=post.content,
         created_at=datetime.now(TIME_ZONE),
     )
-    session.add(new_post)
-    session.commit()
-
+    # SQLite 에서는 그룹 커밋 writer 가 다른 요청의 INSERT 와 묶어서 커밋한다.
+    # id, created_at 을 여기서 채우므로 커밋 후 refresh(SELECT) 가 필요 없다.
     # TODO: refersh와 flush의 차이 설명하기
-    session.refresh(new_post)
+    new_post = await repo.posts.add(new_post)
 
     return PostResponse.model_validate(new_post, from_attributes=True)
 
 
-# TODO: 페이지네이션 구현 필요.
+# 글을 하나씩 여러 번 조회하는 대신 한 번에 찾는다. (Google API 의 커스텀 메서드 표기)
+# 쓰지 않는 조회지만 id 목록이 길어 본문으로 받으므로 POST 를 쓴다.
+@post_router.post(
+    "/posts:batchGet",
+    response_model=BatchGetPostsResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def batch_get_posts(
+    request: BatchGetPostsRequest, repo: RepositoriesDep
+) -> BatchGetPostsResponse:
+    return await batch_get_posts_service(request, repo)
+
+
+# DONE: 페이지네이션 구현 필요. (ULID 커서 기반)
 # TODO: 페이지네이션 종류 찾아보고 설명하기 (ex. 전통적, 커서 기반)
 @post_router.get(
-    "/posts", response_model=list[PostResponse], status_code=status.HTTP_200_OK
+    "/posts", response_model=Page[PostResponse], status_code=status.HTTP_200_OK
 )
-def get_posts(session: SessionDep) -> list[PostResponse]:
-    stmt = select(Post)
-    results = session.exec(stmt).all()
+async def get_posts(
+    repo: RepositoriesDep,
+    limit: int = Query(10, ge=1, le=100),
+    after: str | None = Query(None, pattern=ULID_PATTERN),
+) -> Page[PostResponse]:
+    results = await repo.posts.list_all(after, limit + 1)
+
+    # DONE: 응답 스키마를 리스트 대신 Page(items, next_cursor)로 감쌌습니다.
+    return to_page(results, limit, PostResponse)
 
-    # TODO: 확장성 있게 응답 스키마를 만드려면, 과연 리스트가 좋을까요? 더 좋은 방법은 없을까요?
-    # ex. 예를 들어 응답에 total, next page 등이 추가가 된다면?
-    return [
-        PostResponse.model_validate(p, from_attributes=True) for p in results
-    ]
+
+# NOTE: `/posts/{post_id}` 보다 먼저 등록해야 "search" 가 post_id 로 잡히지 않습니다.
+@post_router.get(
+    "/posts/search",
+    response_model=Page[SearchHit],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_sqlite)],
+)
+async def search_posts(
+    session: ReadSessionDep,
+    q: str = Query(..., min_length=1, max_length=200),
+    target: SearchTarget = Query("posts"),
+    limit: int = Query(10, ge=1, le=100),
+    after: str | None = Query(None, pattern=SEARCH_CURSOR_PATTERN),
+) -> Page[SearchHit]:
+    return await search_service(q, target, session, limit, after)
 
 
 @post_router.get(
@@ -66,18 +133,61 @@ def get_posts(session: SessionDep) -> list[PostResponse]:
     response_model=PostResponse,  # TODO: 아래 타입 힌팅이 있어서, 이 부분은 필요 없습니다. (이거 지우고 테스트 해보시죠!)
     status_code=status.HTTP_200_OK,
 )
-def get_post(session: SessionDep, post_id: str) -> PostResponse:
-    stmt = select(Post).where(Post.id == post_id)
-    post = session.exec(stmt).first()
+async def get_post(
+    repo: RepositoriesDep,
+    post_id: str,
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+) -> PostResponse:
+    # 바뀌지 않았으면 본문을 읽거나 직렬화하지 않고 304 로 답한다.
+    revision = await get_post_revision(post_id, repo.posts)
+    if revision is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            # TODO: 에러 메시지는 어떻게 작성하는 것이 좋은지 설명하기.
+            detail=f"Post with id '{post_id}' not found.",
+        )
+
+    # 304 도 조회로 센다. DB 에는 VIEW_COUNTER 가 모아서 나중에 더한다.
+    VIEW_COUNTER.record(post_id)
+    etag = make_etag("post", revision)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    async def load() -> PostResponse | None:
+        post = await repo.posts.get(post_id)
+        if post is None:
+            return None
+        return PostResponse.model_validate(post, from_attributes=True)
+
+    key = post_tag(post_id)
+    post = await read_through(key, key, load)
 
     if post is None:
+        # revision 을 읽은 뒤에 지워진 경우
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            # TODO: 에러 메시지는 어떻게 작성하는 것이 좋은지 설명하기.
             detail=f"Post with id '{post_id}' not found.",
         )
 
-    return PostResponse.model_validate(post, from_attributes=True)
+    return json_with_etag(post, etag)
+
+
+# 조회수는 계속 바뀌므로 글 응답(ETag, 캐시)과 나눠 따로 준다.
+@post_router.get(
+    "/posts/{post_id}/views",
+    response_model=PostViewsResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_post_views(
+    post_id: str, repo: RepositoriesDep
+) -> PostViewsResponse:
+    if await get_post_revision(post_id, repo.posts) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Post with id '{post_id}' not found.",
+        )
+    views = await repo.posts.views(post_id) + VIEW_COUNTER.pending(post_id)
+    return PostViewsResponse(post_id=post_id, views=views)
 
 
 @post_router.put(
@@ -85,16 +195,15 @@ def get_post(session: SessionDep, post_id: str) -> PostResponse:
     response_model=PostResponse,
     status_code=status.HTTP_200_OK,
 )
-def update_post(
+async def update_post(
     post_id: str,
     # COMMENT: 이건 팁인데, 저는 보통 헷갈림 방지를 위해 클래스 이름과 인스턴스 이름을 (거의) 동일하게 둡니다.
     # ex. request: PostRequest
     post_data: PostRequest,
-    session: SessionDep,
+    repo: RepositoriesDep,
     author: str = Header(..., alias="Author"),
 ) -> PostResponse:
-    stmt = select(Post).where(Post.id == post_id)
-    post = session.exec(stmt).first()
+    post = await repo.posts.get(post_id)
 
     if post is None:
         raise HTTPException(
@@ -103,18 +212,20 @@ def update_post(
             detail=f"Post with id '{post_id}' not found.",
         )
 
-    if post.author != author:
+    if post.author_id != author:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied: not the post owner.",
         )
 
-    post.title = post_data.title
-    post.content = post_data.content
-
-    session.add(post)
-    session.commit()
-    session.refresh(post)
+    post = await repo.posts.update(post_id, post_data.title, post_data.content)
+    if post is None:
+        # 확인한 뒤에 지워진 경우
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Post with id '{post_id}' not found.",
+        )
+    await invalidate_post(post_id)
 
     return PostResponse.model_validate(post, from_attributes=True)
 
@@ -124,13 +235,12 @@ def update_post(
     response_model=DeletePostResponse,
     status_code=status.HTTP_200_OK,
 )
-def delete_post(
+async def delete_post(
     post_id: str,
-    session: SessionDep,
+    repo: RepositoriesDep,
     author: str = Header(..., alias="Author"),
 ) -> DeletePostResponse:
-    stmt = select(Post).where(Post.id == post_id)
-    post = session.exec(stmt).first()
+    post = await repo.posts.get(post_id)
 
     if post is None:
         raise HTTPException(
@@ -138,15 +248,19 @@ def delete_post(
             detail=f"Post with id '{post_id}' not found.",
         )
 
-    if post.author != author:
+    if post.author_id != author:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied: not the post owner.",
         )
 
-    # TODO: Hard / Soft Delete 차이 설명하기.
-    session.delete(post)
-    session.commit()
+    # DONE: Hard / Soft Delete 차이 설명하기.
+    # 요청에서는 deleted_at 만 채워 바로 응답하고(soft delete), 댓글과 글 행은
+    # purger 가 배경에서 조금씩 지운다(hard delete).
+    await repo.posts.delete(post_id)
+    await invalidate_post(post_id)
+    await invalidate_comments(post_id)
+    PURGER.notify()
 
     # TODO: 함수의 반환 값으로 dict를 사용하는게 왜 좋지 않은지, 클래스를 쓰는게 왜 더 좋은지 설명하기.
     # COMMENT: 이전에 UserCreateResponse를 본적이 있는데, 여기서는 DeletePostRespones 군요.
@@ -154,19 +268,73 @@ def delete_post(
     #          저는 보통 DTO 클래스가 사용되는 함수 이름을 따라서 동사+명사 형태로 짓습니다.
     #          ex. delete_post(request: DeletePostRequest) -> DeletePostResponse
     #          ex. create_user(request: CreateUserRequest) -> CreateUserResponse
-    #          이와 관련해서는 "클린 아키텍처" 책을 읽어보시길 추천드립니다. 
+    #          이와 관련해서는 "클린 아키텍처" 책을 읽어보시길 추천드립니다.
     return DeletePostResponse(message=f"Post '{post_id}' deleted successfully.")
 
 
 @post_router.get(
     "/posts/{post_id}/comments",
-    response_model=list[CommentResponse],
+    response_model=Page[CommentResponse],
     status_code=status.HTTP_200_OK,
 )
-def get_comments_by_post(
+async def get_comments_by_post(
     post_id: str,
-    session: SessionDep,
+    repo: RepositoriesDep,
     limit: int = Query(10, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    after: str | None = Query(None, pattern=ULID_PATTERN),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
 ):
-    return get_comments_by_post_service(post_id, session, limit, offset)
+    # 없는 게시글은 지금처럼 빈 페이지를 돌려주되, ETag 는 붙이지 않는다.
+    revision = await get_comments_revision(post_id, repo.posts)
+    if revision is None:
+        return await get_comments_by_post_service(
+            post_id, repo.comments, limit, after
+        )
+
+    etag = make_etag("comments", revision)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = await get_comments_by_post_service(
+        post_id, repo.comments, limit, after
+    )
+    return json_with_etag(page, etag)
+
+
+# 폴링 대신 새 댓글을 Server-Sent Events 로 받는다. 끊긴 뒤에는 브라우저
+# EventSource 가 마지막으로 받은 id 를 Last-Event-ID 로 보내 이어 받는다.
+@post_router.get(
+    "/posts/{post_id}/comments/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def stream_comments_by_post(
+    post_id: str,
+    last_event_id: str | None = Header(
+        None, alias="Last-Event-ID", pattern=ULID_PATTERN
+    ),
+) -> StreamingResponse:
+    # RepositoriesDep 는 응답이 끝날 때 닫히므로, 스트림 내내 읽기 커넥션과
+    # 스냅샷을 붙잡게 된다. 확인에 쓸 세션만 잠깐 연다.
+    async with open_repositories() as repo:
+        revision = await repo.posts.revision(post_id)
+    if revision is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Post with id '{post_id}' not found.",
+        )
+    # 응답을 시작하기 전에 구독해야 한도 초과를 503 으로 돌려줄 수 있다.
+    try:
+        subscription = COMMENT_HUB.subscribe(post_id)
+    except SubscriberLimitError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many subscribers. Please retry later.",
+            headers={"Retry-After": "5"},
+        ) from None
+
+    return StreamingResponse(
+        comment_events(COMMENT_HUB, subscription, last_event_id),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        # 프록시가 이벤트를 모아 보내거나 캐시하지 않게 한다.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,82 @@
+import inspect
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+
+
+class FastJSONRoute(APIRoute):
+    """응답을 한 번만 직렬화하는 라우트. `APIRouter(route_class=...)` 로 고른다.
+
+    기본 APIRoute 는 엔드포인트가 이미 `PostResponse` 등으로 검증해 돌려준
+    값을 response_model 로 한 번 더 검증하고, dict 로 바꾼 뒤 json.dumps 한다.
+    이 라우트는 반환값이 response_model 인스턴스이면 검증을 건너뛰고,
+    pydantic-core 의 JSON 직렬화기로 바로 bytes 를 만든다.
+
+    ORM 객체 등 다른 타입을 돌려주면 기존처럼 검증(from_attributes)한 뒤
+    직렬화하므로, 응답에 스키마 밖의 필드가 섞이지 않는다.
+    """
+
+    def __init__(
+        self, path: str, endpoint: Callable[..., Any], **kwargs: Any
+    ) -> None:
+        self._adapter: TypeAdapter | None = None
+        self._model_class: type[BaseModel] | None = None
+        super().__init__(path, self._wrap(endpoint), **kwargs)
+
+        if self._supports_fast_path():
+            self._adapter = TypeAdapter(self.response_model)
+            if isinstance(self.response_model, type) and issubclass(
+                self.response_model, BaseModel
+            ):
+                self._model_class = self.response_model
+
+    def _supports_fast_path(self) -> bool:
+        # response_model_* 옵션이나 `response: Response` 파라미터(헤더, 상태 코드
+        # 변경)가 있는 라우트는 FastAPI 의 기본 처리를 그대로 쓴다.
+        response_class = self.response_class
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        return (
+            self.response_model is not None
+            and response_class is JSONResponse
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and self.response_model_by_alias
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+            and self.dependant.response_param_name is None
+        )
+
+    def _wrap(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        # functools.wraps 가 __wrapped__ 를 남기므로 FastAPI 는 원래 엔드포인트의
+        # 시그니처(의존성, 반환 타입)를 그대로 읽는다.
+        @wraps(endpoint)
+        async def fast_endpoint(*args: Any, **kwargs: Any) -> Any:
+            if inspect.iscoroutinefunction(endpoint):
+                value = await endpoint(*args, **kwargs)
+            else:
+                value = await run_in_threadpool(endpoint, *args, **kwargs)
+
+            if self._adapter is None or isinstance(value, Response):
+                return value
+            return Response(
+                content=self.render(value),
+                status_code=self.status_code or 200,
+                media_type=JSONResponse.media_type,
+            )
+
+        return fast_endpoint
+
+    def render(self, value: Any) -> bytes:
+        if self._model_class is None or not isinstance(
+            value, self._model_class
+        ):
+            value = self._adapter.validate_python(value, from_attributes=True)
+        return self._adapter.dump_json(value)
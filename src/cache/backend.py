@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # LRU/메모리 한도로 밀려난 항목 수
+    evictions: int = 0
+    # TTL 이 지나 버려진 항목 수
+    expirations: int = 0
+    # 쓰기로 무효화된 항목 수
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class CacheBackend(ABC):
+    """캐시 저장소 인터페이스.
+
+    모든 항목은 하나의 태그(ex. `post:<id>`)에 속하고, 쓰기가 일어나면 태그
+    단위로 무효화한다. 무효화는 태그의 version 을 올리므로, 무효화 이전에
+    시작된 조회가 뒤늦게 오래된 값을 넣으려 하면 `set` 이 무시한다.
+
+    지금은 프로세스 내 구현(`MemoryCache`)만 있지만, 같은 인터페이스로
+    워커 간에 공유되는 캐시(ex. Redis)를 붙일 수 있도록 모두 async 로 둔다.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, tag: str, version: int) -> None:
+        """`tag` 의 현재 version 이 `version` 과 같을 때만 저장한다."""
+
+    @abstractmethod
+    async def tag_version(self, tag: str) -> int: ...
+
+    @abstractmethod
+    async def invalidate(self, tag: str) -> None:
+        """`tag` 에 속한 항목을 모두 지우고 version 을 올린다."""
+
+    @abstractmethod
+    def stats(self) -> CacheStats: ...
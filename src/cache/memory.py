@@ -0,0 +1,111 @@
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from src.cache.backend import CacheBackend, CacheStats
+
+
+class _Entry(NamedTuple):
+    value: Any
+    tag: str
+    size: int
+    expires_at: float
+
+
+def estimate_size(value: Any) -> int:
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    return sys.getsizeof(value)
+
+
+class MemoryCache(CacheBackend):
+    """항목 수, 메모리(추정 바이트), TTL 로 크기가 제한되는 프로세스 내 LRU 캐시."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        sizeof: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl_seconds
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        # 무효화된 적 있는 태그의 version. 항목 수와 같은 한도로 LRU 관리한다.
+        self._versions: OrderedDict[str, int] = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry.value
+
+    async def set(self, key: str, value: Any, tag: str, version: int) -> None:
+        if self._versions.get(tag, 0) != version:
+            return
+
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(value, tag, size, self._clock() + self.ttl)
+        self._tags.setdefault(tag, set()).add(key)
+        self._bytes += size
+
+        while (
+            len(self._entries) > self.max_entries
+            or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats.evictions += 1
+
+    async def tag_version(self, tag: str) -> int:
+        return self._versions.get(tag, 0)
+
+    async def invalidate(self, tag: str) -> None:
+        for key in self._tags.pop(tag, set()):
+            self._remove(key, untag=False)
+            self._stats.invalidations += 1
+
+        self._versions[tag] = self._versions.get(tag, 0) + 1
+        self._versions.move_to_end(tag)
+        if len(self._versions) > self.max_entries:
+            self._versions.popitem(last=False)
+
+    def stats(self) -> CacheStats:
+        self._stats.entries = len(self._entries)
+        self._stats.bytes = self._bytes
+        return self._stats
+
+    def _remove(self, key: str, untag: bool = True) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        if untag:
+            keys = self._tags.get(entry.tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[entry.tag]
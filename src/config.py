@@ -12,10 +12,171 @@ class ServerConfig(BaseSettings):
 
     model_config = SettingsConfigDict(env_file=".env")
 
-    # TODO: database_type에 따라 실제 사용하는 Database가 달라지게 해보기
+    # `serve` (운영용 실행) 설정. `dev` 는 reload 단일 프로세스로 이 값들을 쓰지 않는다.
+    # workers 가 없으면 CPU 코어 수만큼 띄운다.
+    server_workers: int | None = Field(default=None, alias="SERVER_WORKERS")
+    # auto 는 uvloop / httptools 가 설치되어 있으면 그것을, 없으면 asyncio / h11 을 쓴다.
+    server_loop: Literal["auto", "asyncio", "uvloop"] = Field(
+        default="auto", alias="SERVER_LOOP"
+    )
+    server_http: Literal["auto", "h11", "httptools"] = Field(
+        default="auto", alias="SERVER_HTTP"
+    )
+    server_backlog: int = Field(default=2048, alias="SERVER_BACKLOG")
+    server_keep_alive_s: int = Field(default=5, alias="SERVER_KEEP_ALIVE_S")
+    # 워커당 동시 연결(요청) 한도. 넘으면 uvicorn 이 바로 503 으로 답한다.
+    server_limit_concurrency: int | None = Field(
+        default=None, alias="SERVER_LIMIT_CONCURRENCY"
+    )
+    # 종료 신호 후 처리 중인 요청을 기다리는 최대 시간. 그 뒤 writer 큐를 비우고 내려간다.
+    server_graceful_timeout_s: int = Field(
+        default=30, alias="SERVER_GRACEFUL_TIMEOUT_S"
+    )
+    server_access_log: bool = Field(default=False, alias="SERVER_ACCESS_LOG")
+
+    # DONE: database_type에 따라 실제 사용하는 Database가 달라지게 해보기
+    # sqlite 는 SQL 저장소, in-memory 는 dict 저장소를 쓴다. (src/repository/)
     database_type: Literal["sqlite", "in-memory"] = Field(
         default="sqlite", alias="DATABASE_TYPE"
     )
+    database_path: str = Field(default="echo_board.db", alias="DATABASE_PATH")
+
+    # SQLite PRAGMA. 새 커넥션이 열릴 때마다 적용됩니다.
+    # WAL 에서는 읽기와 쓰기가 서로를 막지 않고, NORMAL 은 WAL 에서 안전한 최소 수준입니다.
+    sqlite_journal_mode: Literal[
+        "WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"
+    ] = Field(default="WAL", alias="SQLITE_JOURNAL_MODE")
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL", alias="SQLITE_SYNCHRONOUS"
+    )
+    # 음수는 KiB 단위 (-64000 = 약 64MB), 양수는 페이지 수입니다.
+    sqlite_cache_size: int = Field(default=-64000, alias="SQLITE_CACHE_SIZE")
+    sqlite_mmap_size: int = Field(default=268435456, alias="SQLITE_MMAP_SIZE")
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000, alias="SQLITE_BUSY_TIMEOUT_MS"
+    )
+
+    # 쓰기 엔진과 읽기 전용 엔진의 커넥션 풀 크기
+    write_pool_size: int = Field(default=5, alias="WRITE_POOL_SIZE")
+    write_max_overflow: int = Field(default=10, alias="WRITE_MAX_OVERFLOW")
+    read_pool_size: int = Field(default=10, alias="READ_POOL_SIZE")
+    read_max_overflow: int = Field(default=10, alias="READ_MAX_OVERFLOW")
+
+    # 실행 시간이 이 값(ms) 이상인 SQL 을 로그로 남깁니다. 0 이면 모든 SQL, 없으면 끕니다.
+    slow_query_ms: float | None = Field(default=None, alias="SLOW_QUERY_MS")
+
+    # 그룹 커밋: 짧은 시간(window) 동안 쌓인 INSERT 들을 하나의 트랜잭션으로 묶습니다.
+    group_commit_enabled: bool = Field(
+        default=True, alias="GROUP_COMMIT_ENABLED"
+    )
+    group_commit_window_ms: float = Field(
+        default=2.0, alias="GROUP_COMMIT_WINDOW_MS"
+    )
+    group_commit_max_batch: int = Field(
+        default=64, alias="GROUP_COMMIT_MAX_BATCH"
+    )
+
+    # 게시글 단건 / 댓글 페이지 조회 캐시
+    cache_enabled: bool = Field(default=True, alias="CACHE_ENABLED")
+    cache_max_entries: int = Field(default=10_000, alias="CACHE_MAX_ENTRIES")
+    cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024, alias="CACHE_MAX_BYTES"
+    )
+    cache_ttl_seconds: float = Field(default=60.0, alias="CACHE_TTL_SECONDS")
+
+    # NDJSON 내보내기: 서버 측 커서에서 한 번에 가져와 직렬화할 행 수
+    export_chunk_size: int = Field(default=1000, alias="EXPORT_CHUNK_SIZE")
+
+    # 대량 가져오기: 한 번의 executemany 로 넣을 행 수, 응답에 담을 최대 에러 수
+    import_batch_size: int = Field(default=5000, alias="IMPORT_BATCH_SIZE")
+    import_max_errors: int = Field(default=100, alias="IMPORT_MAX_ERRORS")
+
+    # 지운 글 정리 (src/service/purge.py). 지운 글의 댓글을 batch_size 개씩 지우고,
+    # 배치 사이에 interval 만큼 쉬어 다른 쓰기가 writer 에 끼어들 틈을 준다.
+    purge_enabled: bool = Field(default=True, alias="PURGE_ENABLED")
+    purge_batch_size: int = Field(default=500, alias="PURGE_BATCH_SIZE")
+    purge_interval_ms: float = Field(default=50.0, alias="PURGE_INTERVAL_MS")
+    # 다른 워커에서 지운 글은 알림을 받지 못하므로 이 주기로 다시 찾아본다.
+    purge_poll_s: float = Field(default=30.0, alias="PURGE_POLL_S")
+
+    # 게시글 댓글 SSE 스트림 (src/service/stream.py). 구독자마다 buffer_size 개까지
+    # 쌓이면 끊고, 클라이언트는 Last-Event-ID 로 다시 붙어 이어 받는다.
+    stream_buffer_size: int = Field(default=64, alias="STREAM_BUFFER_SIZE")
+    # 워커당 구독자 수 한도. 넘으면 503 으로 답한다.
+    stream_max_subscribers: int = Field(
+        default=20_000, alias="STREAM_MAX_SUBSCRIBERS"
+    )
+    # 쉬는 연결에 보내는 주석 줄(`: ping`) 주기. 끊긴 연결은 이때 정리된다.
+    stream_heartbeat_s: float = Field(default=15.0, alias="STREAM_HEARTBEAT_S")
+
+    # 게시글 조회수 (src/service/views.py). 조회마다 UPDATE 하지 않고 워커 메모리에
+    # 모았다가 flush_interval 마다 한 트랜잭션의 UPSERT 로 더한다.
+    view_flush_interval_s: float = Field(
+        default=5.0, alias="VIEW_FLUSH_INTERVAL_S"
+    )
+    # 모인 증가분의 합이 이만큼이면 주기를 기다리지 않고 반영한다.
+    # 비정상 종료로 잃을 수 있는 조회수의 상한이기도 하다.
+    view_max_pending: int = Field(default=10_000, alias="VIEW_MAX_PENDING")
+
+    # 응답 압축 (src/api/compression.py). 앞에 있을수록 먼저 고른다.
+    # br, zstd 는 `brotli`, `zstandard` 패키지가 설치되어 있을 때만 쓴다.
+    compression_enabled: bool = Field(default=True, alias="COMPRESSION_ENABLED")
+    compression_encodings: list[Literal["zstd", "br", "gzip"]] = Field(
+        default=["zstd", "br", "gzip"], alias="COMPRESSION_ENCODINGS"
+    )
+    # 이보다 작은 응답(bytes)은 압축하지 않는다. 스트리밍 응답은 크기와 무관하게 압축한다.
+    compression_min_size: int = Field(
+        default=1024, alias="COMPRESSION_MIN_SIZE"
+    )
+    # 빠른 쪽에 맞춘 기본값. (gzip 1-9, brotli 0-11, zstd 1-22)
+    compression_gzip_level: int = Field(
+        default=5, alias="COMPRESSION_GZIP_LEVEL"
+    )
+    compression_brotli_quality: int = Field(
+        default=4, alias="COMPRESSION_BROTLI_QUALITY"
+    )
+    compression_zstd_level: int = Field(
+        default=3, alias="COMPRESSION_ZSTD_LEVEL"
+    )
+
+    # 동시 처리 한도 (src/api/admission.py). 워커마다 읽기/쓰기 요청을 따로 센다.
+    # 한도를 넘으면 대기열에서 최대 timeout 초 기다리고, 대기열이 차거나 시간이
+    # 지나면 reject_status 와 Retry-After 로 바로 거절한다.
+    admission_enabled: bool = Field(default=True, alias="ADMISSION_ENABLED")
+    admission_read_limit: int = Field(default=64, alias="ADMISSION_READ_LIMIT")
+    admission_read_queue: int = Field(default=256, alias="ADMISSION_READ_QUEUE")
+    # 쓰기는 결국 writer 하나로 모이므로, 그룹 커밋 한 배치 크기 정도만 받는다.
+    admission_write_limit: int = Field(
+        default=64, alias="ADMISSION_WRITE_LIMIT"
+    )
+    admission_write_queue: int = Field(
+        default=128, alias="ADMISSION_WRITE_QUEUE"
+    )
+    admission_queue_timeout_s: float = Field(
+        default=1.0, alias="ADMISSION_QUEUE_TIMEOUT_S"
+    )
+    admission_reject_status: Literal[503, 429] = Field(
+        default=503, alias="ADMISSION_REJECT_STATUS"
+    )
+    admission_retry_after_s: int = Field(
+        default=1, alias="ADMISSION_RETRY_AFTER_S"
+    )
+
+    # 비밀번호 해시 (scrypt / PBKDF2) 작업 강도
+    password_algorithm: Literal["scrypt", "pbkdf2_sha256"] = Field(
+        default="scrypt", alias="PASSWORD_ALGORITHM"
+    )
+    password_scrypt_n: int = Field(default=2**14, alias="PASSWORD_SCRYPT_N")
+    password_scrypt_r: int = Field(default=8, alias="PASSWORD_SCRYPT_R")
+    password_scrypt_p: int = Field(default=1, alias="PASSWORD_SCRYPT_P")
+    password_pbkdf2_iterations: int = Field(
+        default=600_000, alias="PASSWORD_PBKDF2_ITERATIONS"
+    )
+    # 해시 전용 스레드 풀. 실행 중 + 대기 중인 작업이 한도를 넘으면 503 을 돌려준다.
+    password_hash_workers: int = Field(default=4, alias="PASSWORD_HASH_WORKERS")
+    password_hash_queue_limit: int = Field(
+        default=64, alias="PASSWORD_HASH_QUEUE_LIMIT"
+    )
 
 
 dev = ServerConfig()
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class BulkRowError(BaseModel):
+    # NDJSON 입력의 줄 번호 (1부터)
+    line: int
+    error: str
+
+
+class BulkImportReport(BaseModel):
+    inserted: int = 0
+    failed: int = 0
+    # 최대 `IMPORT_MAX_ERRORS` 개까지만 담는다. 전체 개수는 failed 를 본다.
+    errors: list[BulkRowError] = []
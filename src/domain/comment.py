@@ -2,23 +2,32 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel
-from sqlmodel import Field, SQLModel
-from ulid import ULID
+from sqlmodel import Field, Index, SQLModel
+
+from src.domain.ids import new_ulid
 
 TIME_ZONE = ZoneInfo("Asia/Seoul")
 
 
 class Comment(SQLModel, table=True):
-    id: str = Field(default_factory=lambda: str(ULID()), primary_key=True)
+    # 게시글별/작성자별 댓글 목록의 필터 + 커서 정렬에 맞춘 복합 인덱스
+    __table_args__ = (
+        Index("ix_comment_post_id_id", "post_id", "id"),
+        Index("ix_comment_author_id_id", "author_id", "id"),
+    )
+
+    id: str = Field(default_factory=new_ulid, primary_key=True)
     author_id: str = Field(foreign_key="user.id")
     post_id: str = Field(foreign_key="post.id")
     content: str
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(TIME_ZONE), nullable=False
     )
-    # TODO: updated_at 이 없군요!
+    # DONE: updated_at 이 없군요!
     # 보통 created_at은 필수적으로 두고, 수정될 여지가 있는 엔티티들은 updated_at 도 같이 둡니다.
     # 수정될 여지가 없는 (ex. 로그, 이벤트 등)은 updated_at을 두지 않구요.
+    # 수정된 적이 없으면 None 이다.
+    updated_at: datetime | None = None
 
 
 class CommentCreateRequest(BaseModel):
@@ -0,0 +1,47 @@
+import os
+import threading
+import time
+
+from ulid import ULID
+
+# ULID 의 랜덤부(80비트)가 가질 수 있는 가장 큰 값
+_RANDOM_MAX = (1 << 80) - 1
+
+
+def _random() -> int:
+    return int.from_bytes(os.urandom(10), "big")
+
+
+class MonotonicULID:
+    """같은 밀리초에 만든 ULID 도 만든 순서대로 정렬되게 하는 생성기.
+
+    ULID 는 같은 밀리초 안에서는 랜덤부로 순서가 갈려, 먼저 쓴 댓글의 id 가
+    더 클 수 있다. 커서 페이지네이션과 댓글 스트림의 재연결(Last-Event-ID
+    이후)은 id 순서를 작성 순서로 보므로, 같은 밀리초면 직전 랜덤부에 1 을
+    더한다. (ULID 명세의 monotonic 생성)
+
+    NOTE: 워커(프로세스)마다 따로 증가한다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._last_random = 0
+
+    def __call__(self) -> str:
+        with self._lock:
+            ms = time.time_ns() // 1_000_000
+            if ms > self._last_ms:
+                random = _random()
+            elif self._last_random < _RANDOM_MAX:
+                # 같은 밀리초이거나 시계가 뒤로 갔으면 직전 id 에 이어 붙인다.
+                ms, random = self._last_ms, self._last_random + 1
+            else:
+                # 랜덤부가 넘치면 다음 밀리초로 넘긴다.
+                ms, random = self._last_ms + 1, _random()
+            self._last_ms, self._last_random = ms, random
+        raw = ms.to_bytes(6, "big") + random.to_bytes(10, "big")
+        return str(ULID.from_bytes(raw))
+
+
+new_ulid = MonotonicULID()
@@ -0,0 +1,16 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# ULID: Crockford Base32 26자 (I, L, O, U 제외)
+ULID_PATTERN = r"^[0-9A-HJKMNP-TV-Z]{26}$"
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    # 다음 페이지 요청 시 `?after=` 로 넘길 값. 마지막 페이지면 None.
+    next_cursor: str | None = None
+    # 전체 항목 수. 카운터(src/sqlite3/counter.py)로 바로 셀 수 있는 목록만 채운다.
+    total: int | None = None
@@ -2,20 +2,60 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel
-from sqlmodel import Field, SQLModel
-from ulid import ULID
+from sqlalchemy import text
+from sqlmodel import Field, Index, SQLModel
+
+from src.domain.comment import CommentResponse
+from src.domain.ids import new_ulid
 
 TIME_ZONE = ZoneInfo("Asia/Seoul")
 
 
 class Post(SQLModel, table=True):
-    id: str = Field(default_factory=lambda: str(ULID()), primary_key=True)
+    # 작성자별 목록(author_id = ? AND id > ? ORDER BY id)을 인덱스만으로 처리한다.
+    # 전체 목록(deleted_at IS NULL AND id > ?)과 지울 글 찾기(deleted_at IS NOT NULL)는
+    # (deleted_at, id) 인덱스로 처리한다.
+    __table_args__ = (
+        Index("ix_post_author_id_id", "author_id", "id"),
+        Index("ix_post_deleted_at_id", "deleted_at", "id"),
+    )
+
+    id: str = Field(default_factory=new_ulid, primary_key=True)
     author_id: str = Field(foreign_key="user.id", nullable=False)
     title: str
     content: str
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(TIME_ZONE), nullable=False
     )
+    # ETag 용 버전. 트리거가 올린다. (src/sqlite3/revision.py)
+    # 응답에 댓글 수가 들어 있어 댓글이 달리거나 지워져도 올라간다.
+    revision: int = Field(
+        default=1, sa_column_kwargs={"server_default": text("1")}
+    )
+    comments_revision: int = Field(
+        default=0, sa_column_kwargs={"server_default": text("0")}
+    )
+    # 지운 시각. 읽기에서는 바로 빠지고, 댓글과 행은 purger 가 나중에 지운다.
+    # (src/service/purge.py)
+    deleted_at: datetime | None = None
+    # 댓글 수. 트리거가 댓글을 쓰는 트랜잭션에서 함께 고친다. (src/sqlite3/counter.py)
+    comment_count: int = Field(
+        default=0, sa_column_kwargs={"server_default": text("0")}
+    )
+
+
+class PostView(SQLModel, table=True):
+    """게시글 조회수. 워커가 모은 증가분을 주기적으로 더한다. (src/service/views.py)
+
+    조회마다 바뀌는 값이라 post 행과 나눠, 글 행과 revision(ETag)을 건드리지 않는다.
+    """
+
+    __tablename__ = "post_view"
+
+    post_id: str = Field(foreign_key="post.id", primary_key=True)
+    views: int = Field(
+        default=0, sa_column_kwargs={"server_default": text("0")}
+    )
 
 
 class PostResponse(BaseModel):
@@ -25,6 +65,9 @@ class PostResponse(BaseModel):
     content: str
     # TODO: 시각에 대한 표현방법(ISO-8601, unix timestamp 등)이 어떤 것들이 있는지 설명하기.
     created_at: datetime
+    comment_count: int = 0
+
+    model_config = {"from_attributes": True}
 
 
 class PostRequest(BaseModel):
@@ -34,3 +77,32 @@ class PostRequest(BaseModel):
 
 class DeletePostResponse(BaseModel):
     message: str
+
+
+class PostViewsResponse(BaseModel):
+    post_id: str
+    # 반영된 조회수 + 이 워커에서 아직 반영하지 않은 조회수
+    views: int
+
+
+# `POST /api/posts:batchGet` 한 번에 찾을 수 있는 글 수와 글마다 붙일 댓글 수
+BATCH_GET_MAX_IDS = 500
+BATCH_GET_MAX_COMMENTS = 50
+
+
+class BatchGetPostsRequest(BaseModel):
+    ids: list[str] = Field(min_length=1, max_length=BATCH_GET_MAX_IDS)
+    # 글마다 앞에서부터(id 오름차순) 붙일 댓글 수. 0 이면 붙이지 않는다.
+    comments: int = Field(0, ge=0, le=BATCH_GET_MAX_COMMENTS)
+
+
+class BatchPostResponse(PostResponse):
+    # 댓글을 요청하지 않았으면 None
+    comments: list[CommentResponse] | None = None
+
+
+class BatchGetPostsResponse(BaseModel):
+    # 요청한 순서대로. 중복된 id 는 한 번만 담는다.
+    items: list[BatchPostResponse]
+    # 없거나 지운 글의 id. 요청한 순서대로.
+    missing: list[str]
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+# bm25 점수(실수)와 FTS rowid 로 이루어진 검색 커서. ex. "-1.93e-06:42"
+SEARCH_CURSOR_PATTERN = (
+    r"^-?([0-9]+(\.[0-9]*)?|\.[0-9]+)(e[+-]?[0-9]+)?"  # float(rank)
+    r":[0-9]+$"  # FTS rowid
+)
+
+
+class SearchHit(BaseModel):
+    id: str
+    post_id: str
+    author_id: str
+    # 게시글 검색일 때만 채워진다. title, snippet 은 HTML 로 이스케이프되어 있고
+    # 매칭된 단어만 <mark> 로 감싸져 있다.
+    title: str | None = None
+    snippet: str
+    created_at: datetime
+    # bm25 점수. 작을수록 관련도가 높다.
+    rank: float
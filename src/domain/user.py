@@ -2,22 +2,45 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel
+from sqlalchemy import text
 from sqlmodel import Field, SQLModel
-from ulid import ULID
+
+from src.domain.ids import new_ulid
 
 TIME_ZONE = ZoneInfo("Asia/Seoul")
 
 
 class User(SQLModel, table=True):
-    id: str = Field(default_factory=lambda: str(ULID()), primary_key=True)
+    id: str = Field(default_factory=new_ulid, primary_key=True)
     username: str = Field(index=True, unique=True)
     password: str
-    nickname: str = Field(unique=True)
+    nickname: str = Field(index=True, unique=True)
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(TIME_ZONE), nullable=False
     )
 
 
+class UserStats(SQLModel, table=True):
+    """사용자별 글/댓글 수. 트리거가 글/댓글을 쓰는 트랜잭션에서 함께 고친다.
+
+    Author 헤더의 작성자가 user 에 없을 수도 있어 user 에 컬럼을 두지 않고
+    작성자 id 로 따로 둔다. 글이나 댓글을 쓴 적이 없으면 행이 없다.
+    (src/sqlite3/counter.py)
+    """
+
+    __tablename__ = "user_stats"
+
+    user_id: str = Field(primary_key=True)
+    # 지우지 않은 글 수
+    post_count: int = Field(
+        default=0, sa_column_kwargs={"server_default": text("0")}
+    )
+    # 지운 글의 댓글은 purger 가 행을 지울 때 빠진다.
+    comment_count: int = Field(
+        default=0, sa_column_kwargs={"server_default": text("0")}
+    )
+
+
 class UserCreateRequest(BaseModel):
     # TODO: 서비스 레벨에서 값을 검증하는 것과, API 레벨에서 검증하는 것. 섞여있네요.
     # 언제 서비스 레벨에서 검증해야 하고, 언제 API 레벨에서 검증해야할까요?
@@ -33,6 +56,11 @@ class UserCreateRequest(BaseModel):
     )
 
 
+class UserLoginRequest(BaseModel):
+    username: str
+    password: str
+
+
 class UserResponse(BaseModel):
     id: str
     username: str
@@ -41,3 +69,9 @@ class UserResponse(BaseModel):
     model_config = {
         "from_attributes": True,
     }
+
+
+class UserStatsResponse(BaseModel):
+    user_id: str
+    post_count: int
+    comment_count: int
@@ -1,25 +1,84 @@
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from fastapi import Depends, FastAPI
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.api.account import auth_router
+from src.api.admission import READ_GATE, WRITE_GATE, AdmissionMiddleware
+from src.api.bulk import bulk_router
 from src.api.comment import comment_router
+from src.api.compression import COMPRESSION_ENCODERS, CompressionMiddleware
+from src.api.export import export_router
 from src.api.health import health_router
+from src.api.metrics import metrics_router
 from src.api.post import post_router
-from src.sqlite3.connection import get_session, init_db
+from src.metrics.request import MetricsMiddleware
+from src.metrics.startup import mark
+from src.service.password import PASSWORD_HASHER
+from src.service.purge import PURGER
+from src.service.repository import SQLITE, require_sqlite
+from src.service.stream import COMMENT_HUB
+from src.service.views import VIEW_COUNTER
+from src.sqlite3.connection import config, get_session, init_db
+from src.sqlite3.writer import WRITER
 
-SessionDep = Annotated[Session, Depends(get_session)]
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
-def lifespan(app: FastAPI):
-    init_db()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # in-memory 저장소는 스키마도, writer 도 필요 없다.
+    if SQLITE:
+        await init_db()
+        if config.group_commit_enabled:
+            await WRITER.start()
+    if config.purge_enabled:
+        await PURGER.start()
+    await COMMENT_HUB.start()
+    await VIEW_COUNTER.start()
+    mark("ready")
     yield
+    await COMMENT_HUB.stop()
+    # 남은 조회수는 writer 가 멈추기 전에 반영한다.
+    await VIEW_COUNTER.stop()
+    await PURGER.stop()
+    await WRITER.stop()
+    PASSWORD_HASHER.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
 
+# 나중에 추가한 미들웨어가 바깥에 놓인다. 거절된 요청도 지연 시간 메트릭에 남긴다.
+if config.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        encoders=COMPRESSION_ENCODERS,
+        minimum_size=config.compression_min_size,
+    )
+if config.admission_enabled:
+    app.add_middleware(
+        AdmissionMiddleware,
+        read=READ_GATE,
+        write=WRITE_GATE,
+        reject_status=config.admission_reject_status,
+        retry_after=config.admission_retry_after_s,
+    )
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(health_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
 app.include_router(post_router, prefix="/api")
 app.include_router(auth_router, prefix="/api")
 app.include_router(comment_router, prefix="/api")
+# 내보내기와 대량 가져오기는 SQLite 커서 / executemany 에 기대므로 SQLite 에서만 연다.
+app.include_router(
+    export_router, prefix="/api", dependencies=[Depends(require_sqlite)]
+)
+app.include_router(
+    bulk_router, prefix="/api", dependencies=[Depends(require_sqlite)]
+)
+
+# 워커를 자주 늘리고 줄이므로 기동 시간을 /api/metrics 로 남긴다.
+# (process_startup_seconds: import → ready → first_request)
+mark("import")
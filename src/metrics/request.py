@@ -0,0 +1,99 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.metrics.registry import REGISTRY
+from src.metrics.startup import mark_first_request
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RequestStats:
+    scope: Scope
+    sql_statements: int = 0
+    sql_seconds: float = 0.0
+    # 그룹 커밋 writer 에 넘긴 쓰기 수. 그 SQL 은 writer 태스크에서 실행된다.
+    deferred_writes: int = 0
+
+    @property
+    def route(self) -> str:
+        # 라우팅이 끝나면 매칭된 라우트가 scope 에 담긴다.
+        route = self.scope.get("route")
+        return UNMATCHED_ROUTE if route is None else route.path
+
+
+# 현재 요청의 SQL 통계. SQLAlchemy 이벤트(greenlet)에서도 같은 컨텍스트가 보인다.
+# 그룹 커밋 writer 처럼 요청 밖에서 실행되는 SQL 은 None 이다. 여러 요청의 쓰기를
+# 한 트랜잭션에서 실행하므로 요청별로 나눌 수 없다.
+CURRENT_REQUEST: ContextVar[RequestStats | None] = ContextVar(
+    "current_request", default=None
+)
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_SQL_STATEMENTS = REGISTRY.histogram(
+    "http_request_sql_statements",
+    "SQL statements executed per HTTP request",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+HTTP_REQUEST_SQL_SECONDS = REGISTRY.histogram(
+    "http_request_sql_duration_seconds",
+    "Total SQL execution time per HTTP request",
+    ("method", "route"),
+)
+
+
+class MetricsMiddleware:
+    """라우트별 지연 시간, SQL 실행 횟수와 시간을 기록하는 ASGI 미들웨어.
+
+    라벨에는 실제 경로 대신 라우트 템플릿(ex. `/api/posts/{post_id}`)을 써서
+    라벨 조합 수가 늘어나지 않게 한다. 쓰기를 writer 에 넘긴 요청은 SQL 을
+    일부만 보므로, 0 에 가까운 값을 남기지 않고 SQL 통계에서 뺀다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = CURRENT_REQUEST.set(stats)
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            CURRENT_REQUEST.reset(token)
+
+            method, route = scope["method"], stats.route
+            HTTP_REQUEST_SECONDS.observe(
+                elapsed, method=method, route=route, status=str(status)
+            )
+            if not stats.deferred_writes:
+                HTTP_REQUEST_SQL_STATEMENTS.observe(
+                    stats.sql_statements, method=method, route=route
+                )
+                HTTP_REQUEST_SQL_SECONDS.observe(
+                    stats.sql_seconds, method=method, route=route
+                )
+            mark_first_request()
@@ -0,0 +1,41 @@
+import os
+import time
+
+from src.metrics.registry import REGISTRY
+
+STARTUP_SECONDS = REGISTRY.gauge(
+    "process_startup_seconds",
+    "Seconds from process start to each startup phase",
+    ("phase",),
+)
+
+
+def _process_age() -> float:
+    """프로세스가 시작된 뒤 지난 시간(초). 인터프리터 기동과 import 를 포함한다."""
+    try:
+        with open("/proc/self/stat") as file:
+            stat = file.read()
+    except OSError:
+        # /proc 이 없으면(리눅스가 아니면) 이 모듈을 import 한 시점부터 잰다.
+        return 0.0
+    # 두 번째 필드(실행 파일 이름)에 공백이 있을 수 있어 마지막 ')' 뒤부터 센다.
+    # 그 뒤 20번째 값이 부팅 이후 시작 시각(clock tick)이다. (man 5 proc, starttime)
+    start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+    started = start_ticks / os.sysconf("SC_CLK_TCK")
+    return time.clock_gettime(time.CLOCK_BOOTTIME) - started
+
+
+STARTED_AT = time.perf_counter() - _process_age()
+
+_first_request_done = False
+
+
+def mark(phase: str) -> None:
+    STARTUP_SECONDS.set(time.perf_counter() - STARTED_AT, phase=phase)
+
+
+def mark_first_request() -> None:
+    global _first_request_done
+    if not _first_request_done:
+        _first_request_done = True
+        mark("first_request")
@@ -0,0 +1,166 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from src.domain.comment import Comment
+from src.domain.post import Post
+from src.domain.user import User
+
+
+class DuplicateError(Exception):
+    """유일해야 하는 값(id, username, nickname)이 이미 있다."""
+
+
+# 목록 조회는 모두 id(ULID) 오름차순 keyset 페이지다. `after` 보다 큰 id 를
+# 최대 `limit` 개 돌려준다. 다음 페이지가 있는지 알려면 하나 더 요청한다.
+class UserRepository(ABC):
+    @abstractmethod
+    async def add(self, user: User) -> User:
+        """id, username, nickname 중 하나라도 겹치면 DuplicateError."""
+
+    @abstractmethod
+    async def get(self, user_id: str) -> User | None: ...
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> User | None: ...
+
+    @abstractmethod
+    async def get_by_nickname(self, nickname: str) -> User | None: ...
+
+    @abstractmethod
+    async def set_password(self, user_id: str, password: str) -> None:
+        """저장 형식의 해시(`PASSWORD_HASHER.hash` 결과)로 바꾼다."""
+
+
+class PostRepository(ABC):
+    @abstractmethod
+    async def add(self, post: Post) -> Post: ...
+
+    @abstractmethod
+    async def get(self, post_id: str) -> Post | None: ...
+
+    @abstractmethod
+    async def get_many(self, post_ids: Sequence[str]) -> list[Post]:
+        """있는 글만, 순서 없이 돌려준다."""
+
+    @abstractmethod
+    async def list_all(self, after: str | None, limit: int) -> list[Post]: ...
+
+    @abstractmethod
+    async def list_by_author(
+        self, author_id: str, after: str | None, limit: int
+    ) -> list[Post]: ...
+
+    @abstractmethod
+    async def count_by_author(self, author_id: str) -> int:
+        """작성자의 지우지 않은 글 수. 카운터를 읽으므로 글 수와 무관하다."""
+
+    @abstractmethod
+    async def update(
+        self, post_id: str, title: str, content: str
+    ) -> Post | None:
+        """제목과 본문을 바꾸고 revision 을 올린다. 없는 글이면 None."""
+
+    @abstractmethod
+    async def delete(self, post_id: str) -> bool:
+        """deleted_at 만 채운다(soft delete). 이미 지웠거나 없는 글이면 False.
+
+        지운 글과 그 댓글은 곧바로 모든 조회에서 빠지고, 실제 행은
+        `purge` 가 나중에 조금씩 지운다.
+        """
+
+    @abstractmethod
+    async def pending_purge(self, limit: int) -> list[str]:
+        """아직 행이 남아 있는 지운 글 id. 먼저 지운 글부터."""
+
+    @abstractmethod
+    async def purge(self, post_id: str, batch_size: int) -> int:
+        """지운 글의 댓글을 최대 `batch_size` 개 지우고, 지운 수를 돌려준다.
+
+        `batch_size` 보다 적게 지웠으면 남은 댓글이 없으므로 글 행(과 조회수)도
+        지운다.
+        """
+
+    @abstractmethod
+    async def purge_backlog(self) -> tuple[int, int]:
+        """아직 지우지 않은 (지운 글 수, 그 글들의 댓글 수)."""
+
+    @abstractmethod
+    async def add_views(self, views: Mapping[str, int]) -> None:
+        """글별 조회수 증가분을 한 트랜잭션(UPSERT 한 번)으로 더한다.
+
+        없거나 지운 글의 증가분은 버린다.
+        """
+
+    @abstractmethod
+    async def views(self, post_id: str) -> int:
+        """반영된 조회수. 반영된 적이 없으면 0."""
+
+    @abstractmethod
+    async def revision(self, post_id: str) -> int | None:
+        """글이 바뀔 때마다 올라가는 번호. 없는 글이면 None."""
+
+    @abstractmethod
+    async def comments_revision(self, post_id: str) -> int | None:
+        """글의 댓글이 달리거나 바뀌거나 지워질 때마다 올라가는 번호."""
+
+
+class CommentRepository(ABC):
+    @abstractmethod
+    async def add(self, comment: Comment) -> Comment | None:
+        """댓글을 넣고 글의 comments_revision 과 댓글 수 카운터를 올린다.
+
+        글이 없거나 지워졌으면 넣지 않고 None. 넣는 트랜잭션 안에서 확인하므로
+        purger 가 이미 지나간 글에 댓글이 남지 않는다.
+        """
+
+    @abstractmethod
+    async def get(self, comment_id: str) -> Comment | None: ...
+
+    @abstractmethod
+    async def list_by_post(
+        self, post_id: str, after: str | None, limit: int
+    ) -> list[Comment]: ...
+
+    @abstractmethod
+    async def list_by_author(
+        self, author_id: str, after: str | None, limit: int
+    ) -> list[Comment]: ...
+
+    @abstractmethod
+    async def first_by_posts(
+        self, post_ids: Sequence[str], limit: int
+    ) -> dict[str, list[Comment]]:
+        """글마다 앞에서부터(id 오름차순) 최대 `limit` 개. 댓글 없는 글은 빠진다."""
+
+    @abstractmethod
+    async def count_by_post(self, post_id: str) -> int:
+        """글의 댓글 수. 없거나 지운 글이면 0. 카운터를 읽는다."""
+
+    @abstractmethod
+    async def count_by_author(self, author_id: str) -> int:
+        """작성자의 댓글 수. 지운 글의 댓글은 purger 가 지울 때까지 포함된다."""
+
+    @abstractmethod
+    async def update(self, comment_id: str, content: str) -> Comment | None:
+        """본문과 updated_at 을 바꾼다. 없거나 지운 글의 댓글이면 None."""
+
+    @abstractmethod
+    async def delete(self, comment_id: str) -> bool:
+        """댓글을 지우고 글의 comments_revision 을 올리고 카운터를 줄인다.
+
+        없거나 지운 글의 댓글이면 False. 지운 글의 댓글은 purger 가 지운다.
+        """
+
+
+@dataclass(frozen=True)
+class Repositories:
+    """요청 하나가 쓰는 저장소 묶음. 구현은 DATABASE_TYPE 으로 고른다.
+
+    서비스와 API 는 이 인터페이스에만 의존하므로, 저장소를 바꿔도
+    (src/service/repository.py) 코드는 바뀌지 않는다.
+    """
+
+    users: UserRepository
+    posts: PostRepository
+    comments: CommentRepository
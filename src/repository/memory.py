@@ -0,0 +1,308 @@
+from bisect import bisect_right, insort
+from collections import Counter, defaultdict
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from itertools import islice
+
+from src.domain.comment import TIME_ZONE, Comment
+from src.domain.post import Post
+from src.domain.user import User
+from src.repository.base import (
+    CommentRepository,
+    DuplicateError,
+    PostRepository,
+    Repositories,
+    UserRepository,
+)
+
+
+def _remove(ids: list[str], id: str) -> None:
+    index = bisect_right(ids, id) - 1
+    if index >= 0 and ids[index] == id:
+        del ids[index]
+
+
+def _page(ids: list[str], after: str | None, limit: int) -> list[str]:
+    # ULID 는 문자열 순서가 시간 순서라, 정렬된 id 목록에서 이분 탐색으로 커서를 찾는다.
+    start = 0 if after is None else bisect_right(ids, after)
+    return ids[start : start + limit]
+
+
+class MemoryStore:
+    """프로세스 메모리에 두는 저장소. 재시작하면 사라진다.
+
+    행은 id 로 찾는 dict 에, 목록 조회용 보조 인덱스는 정렬된 id 리스트에
+    둔다. 메서드 안에 await 가 없어 이벤트 루프 위에서는 락 없이도 원자적이다.
+    """
+
+    def __init__(self) -> None:
+        self.users: dict[str, User] = {}
+        self.usernames: dict[str, str] = {}
+        self.nicknames: dict[str, str] = {}
+
+        self.posts: dict[str, Post] = {}
+        self.post_ids: list[str] = []
+        self.posts_by_author: defaultdict[str, list[str]] = defaultdict(list)
+        # 지운 글은 posts 와 목록 인덱스에서 빼 여기로 옮긴다. 지운 순서대로다.
+        self.deleted_posts: dict[str, Post] = {}
+
+        self.comments: dict[str, Comment] = {}
+        self.comments_by_post: defaultdict[str, list[str]] = defaultdict(list)
+        self.comments_by_author: defaultdict[str, list[str]] = defaultdict(list)
+
+        # 작성자별 카운터. SQL 쪽 user_stats 와 같은 규칙이다.
+        self.post_counts: Counter[str] = Counter()
+        self.comment_counts: Counter[str] = Counter()
+        self.views: Counter[str] = Counter()
+
+
+class MemoryUserRepository(UserRepository):
+    def __init__(self, store: MemoryStore) -> None:
+        self.store = store
+
+    async def add(self, user: User) -> User:
+        store = self.store
+        if (
+            user.id in store.users
+            or user.username in store.usernames
+            or user.nickname in store.nicknames
+        ):
+            raise DuplicateError(f"user '{user.username}' already exists")
+        store.users[user.id] = user
+        store.usernames[user.username] = user.id
+        store.nicknames[user.nickname] = user.id
+        return user
+
+    async def get(self, user_id: str) -> User | None:
+        return self.store.users.get(user_id)
+
+    async def get_by_username(self, username: str) -> User | None:
+        user_id = self.store.usernames.get(username)
+        return None if user_id is None else self.store.users[user_id]
+
+    async def get_by_nickname(self, nickname: str) -> User | None:
+        user_id = self.store.nicknames.get(nickname)
+        return None if user_id is None else self.store.users[user_id]
+
+    async def set_password(self, user_id: str, password: str) -> None:
+        user = self.store.users.get(user_id)
+        if user is not None:
+            user.password = password
+
+
+class MemoryPostRepository(PostRepository):
+    def __init__(self, store: MemoryStore) -> None:
+        self.store = store
+
+    async def add(self, post: Post) -> Post:
+        store = self.store
+        if post.id in store.posts:
+            raise DuplicateError(f"post '{post.id}' already exists")
+        store.posts[post.id] = post
+        insort(store.post_ids, post.id)
+        insort(store.posts_by_author[post.author_id], post.id)
+        store.post_counts[post.author_id] += 1
+        return post
+
+    async def get(self, post_id: str) -> Post | None:
+        return self.store.posts.get(post_id)
+
+    async def get_many(self, post_ids: Sequence[str]) -> list[Post]:
+        posts = self.store.posts
+        return [posts[id] for id in dict.fromkeys(post_ids) if id in posts]
+
+    async def list_all(self, after: str | None, limit: int) -> list[Post]:
+        ids = _page(self.store.post_ids, after, limit)
+        return [self.store.posts[id] for id in ids]
+
+    async def list_by_author(
+        self, author_id: str, after: str | None, limit: int
+    ) -> list[Post]:
+        ids = self.store.posts_by_author.get(author_id, [])
+        return [self.store.posts[id] for id in _page(ids, after, limit)]
+
+    async def count_by_author(self, author_id: str) -> int:
+        return self.store.post_counts[author_id]
+
+    async def update(
+        self, post_id: str, title: str, content: str
+    ) -> Post | None:
+        post = self.store.posts.get(post_id)
+        if post is None:
+            return None
+        post.title = title
+        post.content = content
+        post.revision += 1
+        return post
+
+    async def delete(self, post_id: str) -> bool:
+        store = self.store
+        post = store.posts.pop(post_id, None)
+        if post is None:
+            return False
+        _remove(store.post_ids, post_id)
+        _remove(store.posts_by_author[post.author_id], post_id)
+        store.post_counts[post.author_id] -= 1
+        post.deleted_at = datetime.now(TIME_ZONE)
+        store.deleted_posts[post_id] = post
+        return True
+
+    async def pending_purge(self, limit: int) -> list[str]:
+        return list(islice(self.store.deleted_posts, limit))
+
+    async def purge(self, post_id: str, batch_size: int) -> int:
+        store = self.store
+        if post_id not in store.deleted_posts:
+            return 0
+        ids = store.comments_by_post.get(post_id, [])
+        batch = ids[:batch_size]
+        for id in batch:
+            comment = store.comments.pop(id)
+            _remove(store.comments_by_author[comment.author_id], id)
+            store.comment_counts[comment.author_id] -= 1
+        del ids[:batch_size]
+        if len(batch) < batch_size:
+            store.comments_by_post.pop(post_id, None)
+            store.views.pop(post_id, None)
+            del store.deleted_posts[post_id]
+        return len(batch)
+
+    async def purge_backlog(self) -> tuple[int, int]:
+        store = self.store
+        comments = sum(
+            len(store.comments_by_post.get(post_id, ()))
+            for post_id in store.deleted_posts
+        )
+        return len(store.deleted_posts), comments
+
+    async def add_views(self, views: Mapping[str, int]) -> None:
+        # SQL 쪽처럼 지운 글의 조회수는 버린다.
+        posts = self.store.posts
+        self.store.views.update(
+            {
+                post_id: count
+                for post_id, count in views.items()
+                if post_id in posts
+            }
+        )
+
+    async def views(self, post_id: str) -> int:
+        return self.store.views[post_id]
+
+    async def revision(self, post_id: str) -> int | None:
+        post = self.store.posts.get(post_id)
+        return None if post is None else post.revision
+
+    async def comments_revision(self, post_id: str) -> int | None:
+        post = self.store.posts.get(post_id)
+        return None if post is None else post.comments_revision
+
+
+class MemoryCommentRepository(CommentRepository):
+    def __init__(self, store: MemoryStore) -> None:
+        self.store = store
+
+    def _touch(self, post_id: str) -> None:
+        # SQL 쪽 트리거(src/sqlite3/revision.py)와 같은 규칙
+        post = self.store.posts.get(post_id)
+        if post is not None:
+            post.comments_revision += 1
+
+    def _count(self, comment: Comment, delta: int) -> None:
+        # SQL 쪽 트리거(src/sqlite3/counter.py)와 같은 규칙
+        post = self.store.posts.get(comment.post_id)
+        if post is not None:
+            post.comment_count += delta
+            post.revision += 1
+        self.store.comment_counts[comment.author_id] += delta
+
+    async def add(self, comment: Comment) -> Comment | None:
+        store = self.store
+        if comment.post_id not in store.posts:
+            return None
+        if comment.id in store.comments:
+            raise DuplicateError(f"comment '{comment.id}' already exists")
+        store.comments[comment.id] = comment
+        insort(store.comments_by_post[comment.post_id], comment.id)
+        insort(store.comments_by_author[comment.author_id], comment.id)
+        self._touch(comment.post_id)
+        self._count(comment, 1)
+        return comment
+
+    async def get(self, comment_id: str) -> Comment | None:
+        comment = self.store.comments.get(comment_id)
+        if comment is None or comment.post_id in self.store.deleted_posts:
+            return None
+        return comment
+
+    async def list_by_post(
+        self, post_id: str, after: str | None, limit: int
+    ) -> list[Comment]:
+        if post_id in self.store.deleted_posts:
+            return []
+        ids = self.store.comments_by_post.get(post_id, [])
+        return [self.store.comments[id] for id in _page(ids, after, limit)]
+
+    async def list_by_author(
+        self, author_id: str, after: str | None, limit: int
+    ) -> list[Comment]:
+        # 지운 글의 댓글은 건너뛰며 limit 개를 채운다.
+        store = self.store
+        ids = store.comments_by_author.get(author_id, [])
+        start = 0 if after is None else bisect_right(ids, after)
+        comments = []
+        for index in range(start, len(ids)):
+            comment = store.comments[ids[index]]
+            if comment.post_id in store.deleted_posts:
+                continue
+            comments.append(comment)
+            if len(comments) == limit:
+                break
+        return comments
+
+    async def first_by_posts(
+        self, post_ids: Sequence[str], limit: int
+    ) -> dict[str, list[Comment]]:
+        store = self.store
+        result = {}
+        for post_id in dict.fromkeys(post_ids):
+            ids = store.comments_by_post.get(post_id)
+            if ids and post_id not in store.deleted_posts:
+                result[post_id] = [store.comments[id] for id in ids[:limit]]
+        return result
+
+    async def count_by_post(self, post_id: str) -> int:
+        post = self.store.posts.get(post_id)
+        return 0 if post is None else post.comment_count
+
+    async def count_by_author(self, author_id: str) -> int:
+        return self.store.comment_counts[author_id]
+
+    async def update(self, comment_id: str, content: str) -> Comment | None:
+        comment = await self.get(comment_id)
+        if comment is None:
+            return None
+        comment.content = content
+        comment.updated_at = datetime.now(TIME_ZONE)
+        self._touch(comment.post_id)
+        return comment
+
+    async def delete(self, comment_id: str) -> bool:
+        store = self.store
+        if await self.get(comment_id) is None:
+            return False
+        comment = store.comments.pop(comment_id)
+        _remove(store.comments_by_post[comment.post_id], comment_id)
+        _remove(store.comments_by_author[comment.author_id], comment_id)
+        self._touch(comment.post_id)
+        self._count(comment, -1)
+        return True
+
+
+def memory_repositories(store: MemoryStore | None = None) -> Repositories:
+    store = MemoryStore() if store is None else store
+    return Repositories(
+        users=MemoryUserRepository(store),
+        posts=MemoryPostRepository(store),
+        comments=MemoryCommentRepository(store),
+    )
@@ -0,0 +1,347 @@
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlalchemy import Integer, bindparam, delete, func, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
+
+from src.domain.comment import TIME_ZONE, Comment
+from src.domain.post import Post, PostView
+from src.domain.user import User, UserStats
+from src.repository.base import (
+    CommentRepository,
+    DuplicateError,
+    PostRepository,
+    Repositories,
+    UserRepository,
+)
+from src.sqlite3.writer import WRITER
+
+T = TypeVar("T")
+M = TypeVar("M", bound=SQLModel)
+
+# 지운 글(soft delete)과 그 댓글은 purger 가 행을 지우기 전까지 조회에서 뺀다.
+# 지운 글 id 는 (deleted_at, id) 인덱스의 deleted_at IS NOT NULL 구간만 읽는다.
+LIVE_POST = Post.deleted_at.is_(None)
+DELETED_POST_IDS = select(Post.id).where(Post.deleted_at.is_not(None))
+LIVE_COMMENT = Comment.post_id.not_in(DELETED_POST_IDS)
+
+# IN (...) 한 번에 바인딩할 id 수. SQLite 3.32 전에는 변수가 최대 999개다.
+IN_CHUNK_SIZE = 500
+
+
+def chunks(ids: Sequence[str], size: int = IN_CHUNK_SIZE) -> list[list[str]]:
+    # 같은 id 를 여러 번 바인딩하지 않도록 순서를 지키며 중복을 뺀다.
+    unique = list(dict.fromkeys(ids))
+    return [unique[i : i + size] for i in range(0, len(unique), size)]
+
+
+def keyset(
+    stmt: SelectOfScalar[T], id_column: Any, after: str | None, limit: int
+) -> SelectOfScalar[T]:
+    # ULID는 시간순으로 정렬되므로, id 자체를 커서로 사용한다.
+    # OFFSET 과 달리 앞 페이지들을 건너뛰며 읽지 않기 때문에 페이지 깊이와 무관하다.
+    if after is not None:
+        stmt = stmt.where(id_column > after)
+    return stmt.order_by(id_column).limit(limit)
+
+
+class _SqlRepository:
+    """읽기는 요청의 읽기 전용 세션으로, 쓰기는 그룹 커밋 writer 로 한다."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def _first(self, stmt: SelectOfScalar[T]) -> T | None:
+        # writer 가 다른 세션에서 고친 행을 identity map 의 옛 객체로 돌려주지 않게 한다.
+        stmt = stmt.execution_options(populate_existing=True)
+        return (await self.session.exec(stmt)).first()
+
+    async def _all(self, stmt: SelectOfScalar[T]) -> list[T]:
+        stmt = stmt.execution_options(populate_existing=True)
+        return list((await self.session.exec(stmt)).all())
+
+    async def _add(self, obj: M) -> M:
+        try:
+            return await WRITER.add(obj)
+        except IntegrityError as exc:
+            raise DuplicateError(str(exc.orig)) from exc
+
+    async def _delete(self, model: type[SQLModel], id: str, *where) -> bool:
+        async def op(session: AsyncSession) -> bool:
+            stmt = delete(model).where(model.id == id, *where)
+            result = await session.exec(stmt)
+            return result.rowcount > 0
+
+        return await WRITER.submit(op)
+
+
+class SqlUserRepository(_SqlRepository, UserRepository):
+    async def add(self, user: User) -> User:
+        return await self._add(user)
+
+    async def get(self, user_id: str) -> User | None:
+        return await self._first(select(User).where(User.id == user_id))
+
+    async def get_by_username(self, username: str) -> User | None:
+        return await self._first(select(User).where(User.username == username))
+
+    async def get_by_nickname(self, nickname: str) -> User | None:
+        return await self._first(select(User).where(User.nickname == nickname))
+
+    async def set_password(self, user_id: str, password: str) -> None:
+        async def op(session: AsyncSession) -> None:
+            await session.exec(
+                update(User).where(User.id == user_id).values(password=password)
+            )
+
+        await WRITER.submit(op)
+
+
+class SqlPostRepository(_SqlRepository, PostRepository):
+    async def add(self, post: Post) -> Post:
+        # id, created_at 을 애플리케이션에서 채우므로 커밋 후 refresh 가 필요 없다.
+        return await self._add(post)
+
+    async def get(self, post_id: str) -> Post | None:
+        return await self._first(
+            select(Post).where(Post.id == post_id, LIVE_POST)
+        )
+
+    async def get_many(self, post_ids: Sequence[str]) -> list[Post]:
+        posts = []
+        for chunk in chunks(post_ids):
+            posts += await self._all(
+                select(Post).where(Post.id.in_(chunk), LIVE_POST)
+            )
+        return posts
+
+    async def list_all(self, after: str | None, limit: int) -> list[Post]:
+        stmt = select(Post).where(LIVE_POST)
+        return await self._all(keyset(stmt, Post.id, after, limit))
+
+    async def list_by_author(
+        self, author_id: str, after: str | None, limit: int
+    ) -> list[Post]:
+        stmt = select(Post).where(Post.author_id == author_id, LIVE_POST)
+        return await self._all(keyset(stmt, Post.id, after, limit))
+
+    async def count_by_author(self, author_id: str) -> int:
+        count = await self._first(
+            select(UserStats.post_count).where(UserStats.user_id == author_id)
+        )
+        return count or 0
+
+    async def update(
+        self, post_id: str, title: str, content: str
+    ) -> Post | None:
+        async def op(session: AsyncSession) -> Post | None:
+            post = await session.get(Post, post_id)
+            if post is None or post.deleted_at is not None:
+                return None
+            post.title = title
+            post.content = content
+            await session.flush()
+            # 트리거가 올린 revision 을 다시 읽는다.
+            await session.refresh(post)
+            return post
+
+        return await WRITER.submit(op)
+
+    async def delete(self, post_id: str) -> bool:
+        # 댓글이 많은 글도 요청 안에서는 한 행만 고쳐, 쓰기 락을 오래 잡지 않는다.
+        async def op(session: AsyncSession) -> bool:
+            result = await session.exec(
+                update(Post)
+                .where(Post.id == post_id, LIVE_POST)
+                .values(deleted_at=datetime.now(TIME_ZONE))
+            )
+            return result.rowcount > 0
+
+        return await WRITER.submit(op)
+
+    async def pending_purge(self, limit: int) -> list[str]:
+        stmt = DELETED_POST_IDS.order_by(Post.deleted_at, Post.id).limit(limit)
+        return await self._all(stmt)
+
+    async def purge(self, post_id: str, batch_size: int) -> int:
+        async def op(session: AsyncSession) -> int:
+            deleted_at = (
+                await session.exec(
+                    select(Post.deleted_at).where(Post.id == post_id)
+                )
+            ).first()
+            if deleted_at is None:
+                # 없거나 지우지 않은 글
+                return 0
+            batch = (
+                select(Comment.id)
+                .where(Comment.post_id == post_id)
+                .limit(batch_size)
+            )
+            result = await session.exec(
+                delete(Comment).where(Comment.id.in_(batch))
+            )
+            if result.rowcount < batch_size:
+                await session.exec(
+                    delete(PostView).where(PostView.post_id == post_id)
+                )
+                await session.exec(delete(Post).where(Post.id == post_id))
+            return result.rowcount
+
+        return await WRITER.submit(op)
+
+    async def purge_backlog(self) -> tuple[int, int]:
+        posts = await self._first(
+            select(func.count()).select_from(Post).where(~LIVE_POST)
+        )
+        comments = await self._first(
+            select(func.count())
+            .select_from(Comment)
+            .where(Comment.post_id.in_(DELETED_POST_IDS))
+        )
+        return posts, comments
+
+    async def add_views(self, views: Mapping[str, int]) -> None:
+        # 버퍼에 있는 동안 지워진(purge 된) 글의 조회수는 버린다.
+        # 그렇지 않으면 글이 없는 post_view 행이 다시 생겨 남는다.
+        live = select(Post.id, bindparam("delta", type_=Integer)).where(
+            Post.id == bindparam("id"), LIVE_POST
+        )
+        # ORM 대량 INSERT 는 INSERT ... SELECT 를 못 만들므로 테이블로 쓴다.
+        table = PostView.__table__
+        stmt = sqlite_insert(table).from_select(["post_id", "views"], live)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.post_id],
+            set_={"views": table.c.views + stmt.excluded.views},
+        )
+        rows = [
+            {"id": post_id, "delta": count} for post_id, count in views.items()
+        ]
+
+        async def op(session: AsyncSession) -> None:
+            # executemany 한 번으로 모든 글의 증가분을 더한다.
+            await session.exec(stmt, params=rows)
+
+        await WRITER.submit(op)
+
+    async def views(self, post_id: str) -> int:
+        count = await self._first(
+            select(PostView.views).where(PostView.post_id == post_id)
+        )
+        return count or 0
+
+    async def revision(self, post_id: str) -> int | None:
+        return await self._first(
+            select(Post.revision).where(Post.id == post_id, LIVE_POST)
+        )
+
+    async def comments_revision(self, post_id: str) -> int | None:
+        return await self._first(
+            select(Post.comments_revision).where(Post.id == post_id, LIVE_POST)
+        )
+
+
+class SqlCommentRepository(_SqlRepository, CommentRepository):
+    async def add(self, comment: Comment) -> Comment | None:
+        # 글의 comments_revision 과 카운터는 트리거가 같은 트랜잭션에서 고친다.
+        async def op(session: AsyncSession) -> Comment | None:
+            stmt = select(Post.id).where(Post.id == comment.post_id, LIVE_POST)
+            if (await session.exec(stmt)).first() is None:
+                return None
+            session.add(comment)
+            return comment
+
+        try:
+            return await WRITER.submit(op)
+        except IntegrityError as exc:
+            raise DuplicateError(str(exc.orig)) from exc
+
+    async def get(self, comment_id: str) -> Comment | None:
+        return await self._first(
+            select(Comment).where(Comment.id == comment_id, LIVE_COMMENT)
+        )
+
+    async def list_by_post(
+        self, post_id: str, after: str | None, limit: int
+    ) -> list[Comment]:
+        stmt = select(Comment).where(Comment.post_id == post_id, LIVE_COMMENT)
+        return await self._all(keyset(stmt, Comment.id, after, limit))
+
+    async def list_by_author(
+        self, author_id: str, after: str | None, limit: int
+    ) -> list[Comment]:
+        stmt = select(Comment).where(
+            Comment.author_id == author_id, LIVE_COMMENT
+        )
+        return await self._all(keyset(stmt, Comment.id, after, limit))
+
+    async def first_by_posts(
+        self, post_ids: Sequence[str], limit: int
+    ) -> dict[str, list[Comment]]:
+        # 글마다 list_by_post 를 부르는 대신, 글별 순번을 매기는 윈도 쿼리 한 번으로
+        # 앞의 limit 개씩 가져온다. (post_id, id) 인덱스 순서로 읽어 정렬이 없다.
+        # NOTE: 순번은 글의 댓글을 모두 훑으며 매기므로, 댓글이 아주 많은 글이
+        #       섞이면 그 글의 댓글 수만큼 읽는다.
+        result: dict[str, list[Comment]] = {}
+        for chunk in chunks(post_ids):
+            ranked = (
+                select(
+                    Comment,
+                    func.row_number()
+                    .over(partition_by=Comment.post_id, order_by=Comment.id)
+                    .label("rank"),
+                )
+                .where(Comment.post_id.in_(chunk), LIVE_COMMENT)
+                .subquery()
+            )
+            comment = aliased(Comment, ranked)
+            stmt = select(comment).where(ranked.c.rank <= limit)
+            for row in await self._all(stmt):
+                result.setdefault(row.post_id, []).append(row)
+        # 바깥 ORDER BY 는 임시 B-tree 정렬이 되므로, 몇 개 안 되는 결과를 여기서 정렬한다.
+        for comments in result.values():
+            comments.sort(key=lambda comment: comment.id)
+        return result
+
+    async def count_by_post(self, post_id: str) -> int:
+        count = await self._first(
+            select(Post.comment_count).where(Post.id == post_id, LIVE_POST)
+        )
+        return count or 0
+
+    async def count_by_author(self, author_id: str) -> int:
+        count = await self._first(
+            select(UserStats.comment_count).where(
+                UserStats.user_id == author_id
+            )
+        )
+        return count or 0
+
+    async def update(self, comment_id: str, content: str) -> Comment | None:
+        async def op(session: AsyncSession) -> Comment | None:
+            stmt = select(Comment).where(Comment.id == comment_id, LIVE_COMMENT)
+            comment = (await session.exec(stmt)).first()
+            if comment is None:
+                return None
+            comment.content = content
+            comment.updated_at = datetime.now(TIME_ZONE)
+            return comment
+
+        return await WRITER.submit(op)
+
+    async def delete(self, comment_id: str) -> bool:
+        return await self._delete(Comment, comment_id, LIVE_COMMENT)
+
+
+def sql_repositories(session: AsyncSession) -> Repositories:
+    return Repositories(
+        users=SqlUserRepository(session),
+        posts=SqlPostRepository(session),
+        comments=SqlCommentRepository(session),
+    )
@@ -1,7 +1,56 @@
+import os
+import sys
+from typing import Any
+
 import uvicorn
 
-from src.config import dev
+from src.config import ServerConfig, dev
+
 
 # COMMENT: 보통 이 로직은 main.py 내 __main__ 안에 두곤 합니다.
 def run():
     uvicorn.run("src.main:app", host=dev.host, port=dev.port, reload=True)
+
+
+def serve_options(config: ServerConfig) -> dict[str, Any]:
+    workers = config.server_workers or os.cpu_count() or 1
+    if workers > 1 and config.database_type == "in-memory":
+        # 워커마다 저장소가 따로 생겨, 요청마다 다른 데이터를 보게 된다.
+        raise ValueError(
+            "DATABASE_TYPE=in-memory keeps data per process;"
+            " run it with SERVER_WORKERS=1"
+        )
+    return {
+        "host": config.host,
+        "port": config.port,
+        "workers": workers,
+        "loop": config.server_loop,
+        "http": config.server_http,
+        "backlog": config.server_backlog,
+        "timeout_keep_alive": config.server_keep_alive_s,
+        "limit_concurrency": config.server_limit_concurrency,
+        # 신호를 받으면 새 연결을 끊고 처리 중인 요청을 기다린 뒤 lifespan 을 닫는다.
+        # lifespan 종료에서 WRITER.stop() 이 큐에 남은 쓰기를 커밋한다.
+        "timeout_graceful_shutdown": config.server_graceful_timeout_s,
+        "access_log": config.server_access_log,
+    }
+
+
+def serve():
+    """운영용 실행. 여러 워커 프로세스가 같은 SQLite 파일을 나눠 쓴다.
+
+    - 스키마 생성/마이그레이션은 BEGIN IMMEDIATE 로 한 워커씩 실행된다.
+    - 쓰기는 워커마다 writer 가 묶어 커밋하고, 워커 사이는 busy_timeout 으로
+      SQLite 의 쓰기 락을 기다린다. WAL 이라 읽기는 쓰기를 막지 않는다.
+    - 조회 캐시는 프로세스마다 따로라 다른 워커의 쓰기로 무효화되지 않으므로,
+      워커가 여럿이면 CACHE_ENABLED 를 따로 주지 않는 한 끈다.
+    """
+    options = serve_options(dev)
+    if options["workers"] > 1 and "CACHE_ENABLED" not in os.environ:
+        # 워커 프로세스는 환경 변수를 물려받아 설정을 다시 읽는다.
+        os.environ["CACHE_ENABLED"] = "false"
+        print(
+            f"cache disabled: not shared across {options['workers']} workers",
+            file=sys.stderr,
+        )
+    uvicorn.run("src.main:app", **options)
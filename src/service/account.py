@@ -1,51 +1,85 @@
-from typing import Annotated
+from fastapi import HTTPException, status
 
-from fastapi import Depends
-from sqlmodel import Session, select
+from src.domain.page import Page
+from src.domain.post import PostResponse
+from src.domain.user import (
+    User,
+    UserCreateRequest,
+    UserLoginRequest,
+    UserResponse,
+    UserStatsResponse,
+)
+from src.repository.base import (
+    CommentRepository,
+    PostRepository,
+    UserRepository,
+)
+from src.service.pagination import to_page
+from src.service.password import PASSWORD_HASHER, needs_rehash
 
-from src.domain.post import Post, PostResponse
-from src.domain.user import User, UserCreateRequest, UserResponse
-from src.service.password import hash_password
-from src.sqlite3.connection import get_session
 
-SessionDep = Annotated[Session, Depends(get_session)]
+# DONE: username 으로 가입하는데 id 로 중복을 확인하고 있었습니다.
+async def check_user(username: str, users: UserRepository) -> bool:
+    return await users.get_by_username(username) is not None
 
 
-def check_user(user_id: str, session: SessionDep) -> bool:
-    stmt = select(User).where(User.id == user_id)
-    user = session.exec(stmt).first()
-    return user is not None
+async def check_user_by_nickname(nickname: str, users: UserRepository) -> bool:
+    return await users.get_by_nickname(nickname) is not None
 
 
-def check_user_by_nickname(nickname: str, session: SessionDep) -> bool:
-    stmt = select(User).where(User.nickname == nickname)
-    user = session.exec(stmt).first()
-    return user is not None
-
-
-def create_user_service(
-    data: UserCreateRequest, session: SessionDep
+async def create_user_service(
+    data: UserCreateRequest, users: UserRepository
 ) -> UserResponse:
     new_user = User(
         username=data.username,
         nickname=data.nickname,
-        password=hash_password(data.password),
+        # 느린 KDF 라서 이벤트 루프가 아닌 전용 스레드 풀에서 해시한다.
+        password=await PASSWORD_HASHER.hash(data.password),
     )
-    session.add(new_user)
-    session.commit()
-    session.refresh(new_user)
+    new_user = await users.add(new_user)
 
     return UserResponse.model_validate(new_user)
 
 
-def get_posts_by_author_service(
-    author_id: str, session: Session, limit: int, offset: int
-) -> list[PostResponse]:
-    stmt = (
-        select(Post)
-        .where(Post.author_id == author_id)
-        .offset(offset)
-        .limit(limit)
+async def authenticate_user_service(
+    data: UserLoginRequest, users: UserRepository
+) -> UserResponse:
+    user = await users.get_by_username(data.username)
+
+    if user is None or not await PASSWORD_HASHER.verify(
+        data.password, user.password
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid username or password.",
+        )
+
+    # 이전 방식(SHA-512)이거나 작업 강도가 바뀐 해시는 로그인 시점에 다시 해시한다.
+    # 평문 비밀번호를 알 수 있는 때가 로그인뿐이기 때문이다.
+    if needs_rehash(user.password):
+        rehashed = await PASSWORD_HASHER.hash(data.password)
+        await users.set_password(user.id, rehashed)
+
+    return UserResponse.model_validate(user)
+
+
+async def get_posts_by_author_service(
+    author_id: str,
+    posts: PostRepository,
+    limit: int,
+    after: str | None = None,
+) -> Page[PostResponse]:
+    rows = await posts.list_by_author(author_id, after, limit + 1)
+    total = await posts.count_by_author(author_id)
+    return to_page(rows, limit, PostResponse, total)
+
+
+async def get_user_stats_service(
+    user_id: str, posts: PostRepository, comments: CommentRepository
+) -> UserStatsResponse:
+    # COUNT(*) 대신 카운터를 읽는다. 글이나 댓글을 쓴 적이 없으면 0 이다.
+    return UserStatsResponse(
+        user_id=user_id,
+        post_count=await posts.count_by_author(user_id),
+        comment_count=await comments.count_by_author(user_id),
     )
-    posts = session.exec(stmt).all()
-    return [PostResponse.model_validate(p) for p in posts]
@@ -0,0 +1,223 @@
+import argparse
+import asyncio
+import copy
+import sys
+from collections.abc import AsyncIterable, AsyncIterator
+from functools import cache
+from typing import Any, BinaryIO, Literal
+
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import dev
+from src.domain.bulk import BulkImportReport, BulkRowError
+from src.domain.comment import Comment
+from src.domain.post import Post
+from src.domain.user import User
+from src.service.cache import invalidate_comments, invalidate_post
+from src.service.password import is_password_hash
+from src.sqlite3.connection import get_engine, init_db
+from src.sqlite3.writer import WRITER
+
+BulkTarget = Literal["users", "posts", "comments"]
+
+BULK_MODELS: dict[str, type[SQLModel]] = {
+    "users": User,
+    "posts": Post,
+    "comments": Comment,
+}
+
+# 가져올 때 받는 컬럼. revision, comment_count, deleted_at 같은 내부 컬럼은
+# 트리거와 `repair-counters` 가 채우므로 받지 않고, 모르는 키가 있으면 그 행을 거절한다.
+BULK_FIELDS: dict[type[SQLModel], tuple[str, ...]] = {
+    User: ("id", "username", "password", "nickname", "created_at"),
+    Post: ("id", "author_id", "title", "content", "created_at"),
+    Comment: ("id", "author_id", "post_id", "content", "created_at"),
+}
+
+READ_CHUNK_BYTES = 1024 * 1024
+
+Row = tuple[int, dict[str, Any]]
+
+
+@cache
+def _row_schema(model: type[SQLModel]) -> type[BaseModel]:
+    # table=True 모델을 그대로 검증하면 ORM 인스턴스까지 만들어 행당 ~90µs 가 든다.
+    # 같은 필드(타입, 기본값)를 가진 일반 Pydantic 모델로 JSON 을 바로 검증한다.
+    source = model.model_fields
+    fields = {
+        name: (source[name].annotation, copy.copy(source[name]))
+        for name in BULK_FIELDS[model]
+    }
+    return create_model(
+        f"{model.__name__}Row",
+        __config__=ConfigDict(extra="forbid"),
+        **fields,
+    )
+
+
+def parse_row(model: type[SQLModel], line: bytes) -> dict[str, Any]:
+    row = _row_schema(model).model_validate_json(line).model_dump()
+    if model is User and not is_password_hash(row["password"]):
+        # 평문 비밀번호가 그대로 저장되지 않도록, 저장 형식의 해시만 받는다.
+        raise ValueError("password must be a stored password hash")
+    return row
+
+
+async def _lines(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[tuple[int, bytes]]:
+    buffer = b""
+    number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            if line.strip():
+                yield number, line
+        # 청크마다 이벤트 루프에 양보해, 검증이 길어져도 다른 요청과
+        # 진행 중인 INSERT 가 멈추지 않게 한다.
+        await asyncio.sleep(0)
+    if buffer.strip():
+        yield number + 1, buffer
+
+
+def _error_message(exc: Exception) -> str:
+    if isinstance(exc, ValidationError):
+        error = exc.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        return f"{location}: {error['msg']}" if location else error["msg"]
+    if isinstance(exc, DBAPIError):
+        return str(exc.orig)
+    return str(exc)
+
+
+class _Importer:
+    def __init__(self, model: type[SQLModel], max_errors: int) -> None:
+        self.model = model
+        self.table = model.__table__
+        self.max_errors = max_errors
+        self.report = BulkImportReport()
+        self.post_ids: set[str] = set()
+
+    def fail(self, line: int, exc: Exception) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < self.max_errors:
+            self.report.errors.append(
+                BulkRowError(line=line, error=_error_message(exc))
+            )
+
+    async def insert(self, batch: list[Row]) -> None:
+        rows = [row for _, row in batch]
+
+        async def insert_many(session: AsyncSession) -> None:
+            # executemany 한 번으로 배치 전체를 넣는다.
+            await session.exec(insert(self.table), params=rows)
+
+        try:
+            await WRITER.submit(insert_many)
+        except DBAPIError:
+            # 제약 조건 위반 등으로 배치가 실패하면 행 단위로 다시 넣어,
+            # 실패한 행만 골라낸다. writer 가 이 작업들을 다시 묶어 커밋한다.
+            results = await asyncio.gather(
+                *(self._insert_one(row) for row in rows),
+                return_exceptions=True,
+            )
+            for (line, row), result in zip(batch, results):
+                if isinstance(result, DBAPIError):
+                    self.fail(line, result)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    self._inserted([row])
+        else:
+            self._inserted(rows)
+
+    async def _insert_one(self, row: dict[str, Any]) -> None:
+        async def insert_one(session: AsyncSession) -> None:
+            await session.exec(insert(self.table), params=[row])
+
+        await WRITER.submit(insert_one)
+
+    def _inserted(self, rows: list[dict[str, Any]]) -> None:
+        self.report.inserted += len(rows)
+        if self.model is Comment:
+            self.post_ids.update(row["post_id"] for row in rows)
+
+
+async def bulk_import(
+    target: BulkTarget,
+    chunks: AsyncIterable[bytes],
+    batch_size: int = dev.import_batch_size,
+    max_errors: int = dev.import_max_errors,
+) -> BulkImportReport:
+    """NDJSON 을 한 줄에 한 행씩 검증해 `batch_size` 행씩 INSERT 한다.
+
+    잘못된 행은 건너뛰고 줄 번호와 이유를 리포트에 남긴다.
+    """
+    importer = _Importer(BULK_MODELS[target], max_errors)
+
+    batch: list[Row] = []
+    inserting: asyncio.Task | None = None
+    async for line, raw in _lines(chunks):
+        try:
+            batch.append((line, parse_row(importer.model, raw)))
+        except ValueError as exc:
+            # ValidationError 도 ValueError 의 하위 클래스다.
+            importer.fail(line, exc)
+            continue
+        if len(batch) >= batch_size:
+            # sqlite3 는 쿼리 실행 중 GIL 을 풀기 때문에, 이전 배치가 INSERT 되는
+            # 동안 다음 배치를 검증한다. 진행 중인 배치는 하나로 제한한다.
+            if inserting is not None:
+                await inserting
+            inserting = asyncio.create_task(importer.insert(batch))
+            batch = []
+    if inserting is not None:
+        await inserting
+    if batch:
+        await importer.insert(batch)
+
+    for post_id in importer.post_ids:
+        # 댓글 목록과 글의 comment_count 가 바뀌었다.
+        await invalidate_post(post_id)
+        await invalidate_comments(post_id)
+    return importer.report
+
+
+async def _read_file(file: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := file.read(READ_CHUNK_BYTES):
+        yield chunk
+
+
+async def _import_file(target: BulkTarget, file: BinaryIO) -> BulkImportReport:
+    await init_db()
+    await WRITER.start()
+    try:
+        return await bulk_import(target, _read_file(file))
+    finally:
+        await WRITER.stop()
+        await get_engine().dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="NDJSON 파일을 echo_board DB 로 대량 가져옵니다."
+    )
+    parser.add_argument("target", choices=list(BULK_MODELS))
+    parser.add_argument("path", help="NDJSON 파일 경로. '-' 이면 표준 입력")
+    args = parser.parse_args()
+
+    if args.path == "-":
+        report = asyncio.run(_import_file(args.target, sys.stdin.buffer))
+    else:
+        with open(args.path, "rb") as file:
+            report = asyncio.run(_import_file(args.target, file))
+
+    print(report.model_dump_json(indent=2))
+    if report.failed:
+        sys.exit(1)
@@ -0,0 +1,52 @@
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from src.cache.backend import CacheBackend
+from src.cache.memory import MemoryCache
+from src.config import dev
+
+T = TypeVar("T")
+
+CACHE: CacheBackend = MemoryCache(
+    max_entries=dev.cache_max_entries,
+    max_bytes=dev.cache_max_bytes,
+    ttl_seconds=dev.cache_ttl_seconds,
+)
+
+
+def post_tag(post_id: str) -> str:
+    return f"post:{post_id}"
+
+
+def comments_tag(post_id: str) -> str:
+    return f"comments:{post_id}"
+
+
+async def read_through(
+    key: str, tag: str, loader: Callable[[], Awaitable[T | None]]
+) -> T | None:
+    """캐시에 있으면 돌려주고, 없으면 `loader` 로 읽어 캐시에 넣는다.
+
+    `loader` 가 None 을 돌려주면(ex. 없는 게시글) 캐시하지 않는다.
+    """
+    if not dev.cache_enabled:
+        return await loader()
+
+    value = await CACHE.get(key)
+    if value is not None:
+        return value
+
+    # 조회 도중 무효화가 일어나면 오래된 값을 넣지 않도록 version 을 먼저 읽어 둔다.
+    version = await CACHE.tag_version(tag)
+    value = await loader()
+    if value is not None:
+        await CACHE.set(key, value, tag, version)
+    return value
+
+
+async def invalidate_post(post_id: str) -> None:
+    await CACHE.invalidate(post_tag(post_id))
+
+
+async def invalidate_comments(post_id: str) -> None:
+    await CACHE.invalidate(comments_tag(post_id))
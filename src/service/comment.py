@@ -1,5 +1,4 @@
 from fastapi import HTTPException
-from sqlmodel import Session, select
 
 from src.domain.comment import (
     Comment,
@@ -7,70 +6,88 @@ from src.domain.comment import (
     CommentResponse,
     CommentUpdateRequest,
 )
+from src.domain.page import Page
+from src.repository.base import CommentRepository
+from src.service.cache import (
+    comments_tag,
+    invalidate_comments,
+    invalidate_post,
+    read_through,
+)
+from src.service.pagination import to_page
+from src.service.stream import COMMENT_HUB
 
 
-def create_comment_service(
-    data: CommentCreateRequest, session: Session, author: str
+async def create_comment_service(
+    data: CommentCreateRequest, comments: CommentRepository, author: str
 ) -> CommentResponse:
-    comment = Comment(author_id=author, **data.model_dump())
-    session.add(comment)
-    session.commit()
-    session.refresh(comment)
-    return CommentResponse.model_validate(comment)
-
-
-def get_comments_by_author_service(
-    author_id: str, session: Session, limit: int, offset: int
-) -> list[CommentResponse]:
-    stmt = (
-        select(Comment)
-        .where(Comment.author_id == author_id)
-        .offset(offset)
-        .limit(limit)
-    )
-    comments = session.exec(stmt).all()
-    return [CommentResponse.model_validate(c) for c in comments]
-
-
-def get_comments_by_post_service(
-    post_id: str, session: Session, limit: int, offset: int
-) -> list[CommentResponse]:
-    stmt = (
-        select(Comment)
-        .where(Comment.post_id == post_id)
-        .offset(offset)
-        .limit(limit)
-    )
-    comments = session.exec(stmt).all()
-    return [CommentResponse.model_validate(c) for c in comments]
-
-
-def delete_comment_service(
-    comment_id: str, session: Session, author: str
+    comment = await comments.add(Comment(author_id=author, **data.model_dump()))
+    if comment is None:
+        raise HTTPException(status_code=404, detail="Post not found")
+    # 글 응답의 comment_count 도 바뀐다.
+    await invalidate_post(comment.post_id)
+    await invalidate_comments(comment.post_id)
+    response = CommentResponse.model_validate(comment)
+    # add 는 커밋된 뒤에 돌아오므로, 구독자는 DB 에 있는 댓글만 받는다.
+    COMMENT_HUB.publish(response)
+    return response
+
+
+async def get_comments_by_author_service(
+    author_id: str,
+    comments: CommentRepository,
+    limit: int,
+    after: str | None = None,
+) -> Page[CommentResponse]:
+    rows = await comments.list_by_author(author_id, after, limit + 1)
+    total = await comments.count_by_author(author_id)
+    return to_page(rows, limit, CommentResponse, total)
+
+
+async def get_comments_by_post_service(
+    post_id: str,
+    comments: CommentRepository,
+    limit: int,
+    after: str | None = None,
+) -> Page[CommentResponse]:
+    async def load() -> Page[CommentResponse]:
+        rows = await comments.list_by_post(post_id, after, limit + 1)
+        total = await comments.count_by_post(post_id)
+        return to_page(rows, limit, CommentResponse, total)
+
+    tag = comments_tag(post_id)
+    return await read_through(f"{tag}:{after or ''}:{limit}", tag, load)
+
+
+async def delete_comment_service(
+    comment_id: str, comments: CommentRepository, author: str
 ) -> None:
-    comment = session.get(Comment, comment_id)
+    comment = await comments.get(comment_id)
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     if comment.author_id != author:
         raise HTTPException(status_code=403, detail="Not authorized")
-    session.delete(comment)
-    session.commit()
+    await comments.delete(comment_id)
+    await invalidate_post(comment.post_id)
+    await invalidate_comments(comment.post_id)
 
 
-def update_comment_service(
+async def update_comment_service(
     comment_id: str,
     data: CommentUpdateRequest,
-    session: Session,
+    comments: CommentRepository,
     author: str,
 ) -> CommentResponse:
-    comment = session.get(Comment, comment_id)
+    comment = await comments.get(comment_id)
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     if comment.author_id != author:
         raise HTTPException(status_code=403, detail="Not authorized")
-    comment.content = data.content
-    session.commit()
-    session.refresh(comment)
+    comment = await comments.update(comment_id, data.content)
+    if comment is None:
+        # 확인한 뒤에 지워진 경우
+        raise HTTPException(status_code=404, detail="Comment not found")
+    await invalidate_comments(comment.post_id)
     return CommentResponse.model_validate(comment)
 
 
@@ -0,0 +1,38 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from pydantic import BaseModel
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import dev
+from src.sqlite3.connection import get_read_engine
+
+
+async def stream_ndjson(
+    model: type[SQLModel],
+    id_column: Any,
+    schema: type[BaseModel],
+    since: str | None = None,
+    chunk_size: int = dev.export_chunk_size,
+    where: Any = None,
+) -> AsyncIterator[bytes]:
+    # StreamingResponse 는 의존성 정리 이후에도 본문을 보낼 수 있으므로
+    # 제너레이터가 세션을 직접 열고, 스트림이 끝나거나 끊길 때 닫는다.
+    async with AsyncSession(get_read_engine()) as session:
+        stmt = select(model).order_by(id_column)
+        if since is not None:
+            # ULID 는 시간순이므로 마지막으로 받은 id 이후만 내보내면 증분 내보내기가 된다.
+            stmt = stmt.where(id_column > since)
+        if where is not None:
+            stmt = stmt.where(where)
+        # yield_per: 결과 전체를 버퍼링하지 않고 커서에서 chunk_size 행씩 가져온다.
+        # identity map 은 약한 참조라 내보낸 객체는 청크가 끝나면 해제된다.
+        result = await session.stream_scalars(
+            stmt.execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions():
+            yield b"".join(
+                schema.model_validate(row).model_dump_json().encode() + b"\n"
+                for row in rows
+            )
@@ -0,0 +1,16 @@
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from src.domain.page import Page
+
+S = TypeVar("S", bound=BaseModel)
+
+
+def to_page(
+    rows: list[Any], limit: int, schema: type[S], total: int | None = None
+) -> Page[S]:
+    # 다음 페이지 존재 여부를 알기 위해 저장소에서 limit + 1 건을 읽어 온다.
+    items = [schema.model_validate(row) for row in rows[:limit]]
+    next_cursor = items[-1].id if len(rows) > limit else None
+    return Page[schema](items=items, next_cursor=next_cursor, total=total)
@@ -1,19 +1,206 @@
+import asyncio
+import base64
 import hashlib
+import hmac
 import re
+import secrets
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 
 from fastapi import HTTPException, status
 
+from src.config import dev
+
+T = TypeVar("T")
+
+SALT_BYTES = 16
+SCRYPT_DKLEN = 64
+PBKDF2_DKLEN = 32
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data.encode("ascii"))
+
 
 def hash_password(password: str) -> str:
-    return hashlib.sha512(password.encode("utf-8")).hexdigest()
+    """설정된 KDF 와 사용자별 salt 로 비밀번호를 해시한다.
 
+    결과는 `알고리즘$파라미터...$salt$hash` 형태라, 작업 강도를 바꿔도
+    이전에 저장된 해시를 그대로 검증할 수 있다.
+    """
+    salt = secrets.token_bytes(SALT_BYTES)
+    encoded = password.encode("utf-8")
 
-def check_password(input_password: str, stored_hashed_password: str) -> None:
-    if hash_password(input_password) != stored_hashed_password:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid username or password.",
+    if dev.password_algorithm == "scrypt":
+        n, r, p = (
+            dev.password_scrypt_n,
+            dev.password_scrypt_r,
+            dev.password_scrypt_p,
+        )
+        digest = hashlib.scrypt(
+            encoded,
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=_scrypt_maxmem(n, r, p),
+            dklen=SCRYPT_DKLEN,
+        )
+        return f"scrypt${n}${r}${p}${_b64encode(salt)}${_b64encode(digest)}"
+
+    iterations = dev.password_pbkdf2_iterations
+    digest = hashlib.pbkdf2_hmac(
+        "sha256", encoded, salt, iterations, dklen=PBKDF2_DKLEN
+    )
+    return f"pbkdf2_sha256${iterations}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def verify_password(password: str, stored: str) -> bool:
+    try:
+        digest, expected = _digest(password.encode("utf-8"), stored)
+    except (ValueError, OverflowError):
+        # 잘리거나 망가진 해시(접두어, salt, 파라미터). 로그인 실패로 다룬다.
+        return False
+    return hmac.compare_digest(digest, expected)
+
+
+def _digest(encoded: bytes, stored: str) -> tuple[bytes, bytes]:
+    """저장된 해시의 방식대로 해시해 (계산한 값, 저장된 값)을 돌려준다.
+
+    파라미터는 저장된 해시(가져오기로도 들어온다)에서 읽으므로, 현재 설정보다
+    센 작업 강도는 망가진 해시로 본다. 해시 하나로 로그인마다 메모리나 CPU 를
+    얼마든지 쓰게 만들 수 있기 때문이다. 작업 강도를 낮추면 그보다 센 해시로는
+    로그인할 수 없다.
+    """
+    algorithm, _, params = stored.partition("$")
+
+    if algorithm == "scrypt":
+        n, r, p, salt, expected = params.split("$")
+        n, r, p = int(n), int(r), int(p)
+        expected = _b64decode(expected)
+        if (
+            n > dev.password_scrypt_n
+            or r > dev.password_scrypt_r
+            or p > dev.password_scrypt_p
+            or len(expected) > SCRYPT_DKLEN
+        ):
+            raise ValueError("scrypt parameters above the configured limit")
+        digest = hashlib.scrypt(
+            encoded,
+            salt=_b64decode(salt),
+            n=n,
+            r=r,
+            p=p,
+            maxmem=_scrypt_maxmem(n, r, p),
+            dklen=len(expected),
+        )
+    elif algorithm == "pbkdf2_sha256":
+        iterations, salt, expected = params.split("$")
+        iterations = int(iterations)
+        expected = _b64decode(expected)
+        if (
+            iterations > dev.password_pbkdf2_iterations
+            or len(expected) > PBKDF2_DKLEN
+        ):
+            raise ValueError("pbkdf2 parameters above the configured limit")
+        digest = hashlib.pbkdf2_hmac(
+            "sha256", encoded, _b64decode(salt), iterations, len(expected)
+        )
+    else:
+        # 이전 방식: salt 없는 SHA-512 hex
+        expected = stored.encode("ascii")
+        digest = hashlib.sha512(encoded).hexdigest().encode("ascii")
+
+    return digest, expected
+
+
+def needs_rehash(stored: str) -> bool:
+    """저장된 해시가 현재 설정(알고리즘, 작업 강도)과 다르면 True."""
+    if dev.password_algorithm == "scrypt":
+        current = (
+            f"scrypt${dev.password_scrypt_n}"
+            f"${dev.password_scrypt_r}${dev.password_scrypt_p}$"
         )
+    else:
+        current = f"pbkdf2_sha256${dev.password_pbkdf2_iterations}$"
+    return not stored.startswith(current)
+
+
+# 저장 형식의 해시. 가져오기(bulk import)에서 평문 비밀번호를 걸러내는 데 쓴다.
+_B64 = r"[A-Za-z0-9+/]+={0,2}"
+PASSWORD_HASH_PATTERN = re.compile(
+    rf"^(scrypt\$\d+\$\d+\$\d+\${_B64}\${_B64}"
+    rf"|pbkdf2_sha256\$\d+\${_B64}\${_B64}"
+    r"|[0-9a-f]{128})$"
+)
+
+
+def is_password_hash(value: str) -> bool:
+    return PASSWORD_HASH_PATTERN.match(value) is not None
+
+
+def _scrypt_maxmem(n: int, r: int, p: int) -> int:
+    # scrypt 가 쓰는 메모리(128 * n * r * p)에 여유를 둔다. 기본 한도는 32MB.
+    return 128 * n * r * (p + 2)
+
+
+class PasswordHasher:
+    """요청 처리 경로 밖(전용 스레드 풀)에서 비밀번호를 해시/검증한다.
+
+    hashlib 의 scrypt/pbkdf2 는 계산 중 GIL 을 풀기 때문에 스레드 풀로도
+    이벤트 루프를 막지 않고 병렬로 돌릴 수 있다. 실행 중이거나 대기 중인
+    작업이 `workers + queue_limit` 개에 이르면 즉시 503 으로 거절한다.
+    """
+
+    def __init__(self, workers: int, queue_limit: int) -> None:
+        self.workers = workers
+        self.capacity = workers + queue_limit
+        self.pending = 0
+        self.rejected = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, password)
+
+    async def verify(self, password: str, stored: str) -> bool:
+        return await self._submit(verify_password, password, stored)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _submit(self, fn: Callable[..., T], *args) -> T:
+        if self.pending >= self.capacity:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password requests. Please retry later.",
+                headers={"Retry-After": "1"},
+            )
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password"
+            )
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+
+PASSWORD_HASHER = PasswordHasher(
+    workers=dev.password_hash_workers,
+    queue_limit=dev.password_hash_queue_limit,
+)
 
 
 def validate_password(password: str) -> None:
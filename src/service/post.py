@@ -0,0 +1,34 @@
+from src.domain.comment import CommentResponse
+from src.domain.post import (
+    BatchGetPostsRequest,
+    BatchGetPostsResponse,
+    BatchPostResponse,
+)
+from src.repository.base import Repositories
+
+
+async def batch_get_posts_service(
+    request: BatchGetPostsRequest, repo: Repositories
+) -> BatchGetPostsResponse:
+    """여러 글을 한 번에 찾는다. 글은 IN 쿼리로, 댓글은 윈도 쿼리로 한 번씩."""
+    posts = {post.id: post for post in await repo.posts.get_many(request.ids)}
+    comments = {}
+    if request.comments and posts:
+        comments = await repo.comments.first_by_posts(
+            list(posts), request.comments
+        )
+
+    items, missing = [], []
+    for post_id in dict.fromkeys(request.ids):
+        post = posts.get(post_id)
+        if post is None:
+            missing.append(post_id)
+            continue
+        item = BatchPostResponse.model_validate(post, from_attributes=True)
+        if request.comments:
+            item.comments = [
+                CommentResponse.model_validate(comment)
+                for comment in comments.get(post_id, ())
+            ]
+        items.append(item)
+    return BatchGetPostsResponse(items=items, missing=missing)
@@ -0,0 +1,120 @@
+import asyncio
+import contextlib
+import logging
+
+from src.config import dev
+from src.repository.base import PostRepository
+from src.service.repository import open_repositories
+
+logger = logging.getLogger("src.service.purge")
+
+
+class Purger:
+    """지운 글(soft delete)의 댓글과 글 행을 배경에서 조금씩 지운다.
+
+    댓글이 수십만 개인 글을 한 트랜잭션으로 지우면 그동안 SQLite 쓰기 락을
+    쥐고 있게 된다. 대신 `batch_size` 개씩 writer 에 넘기고 배치 사이에
+    `interval_ms` 만큼 쉬어, 다른 요청의 쓰기가 사이사이 커밋되게 한다.
+
+    글을 지우면 `notify()` 로 깨우고, 다른 워커에서 지운 글은 `poll_s` 마다
+    다시 찾아본다. 진행 상황(`purged_*`)과 남은 양(`backlog_*`)은
+    /api/metrics 로 나간다.
+    """
+
+    def __init__(
+        self, batch_size: int, interval_ms: float, poll_s: float
+    ) -> None:
+        self.batch_size = batch_size
+        self.interval = interval_ms / 1000
+        self.poll = poll_s
+        self.purged_posts = 0
+        self.purged_comments = 0
+        self.failures = 0
+        self.backlog_posts = 0
+        self.backlog_comments = 0
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """진행 중인 배치까지만 지우고 멈춘다. 남은 일은 다음 기동에서 잇는다.
+
+        쿼리 도중에 취소하면 드라이버 스레드가 닫힌 이벤트 루프에 결과를
+        돌려주려 할 수 있어, 취소하지 않고 배치 사이에서 멈추게 한다.
+        """
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        await self._task
+        self._task = None
+        self._wake = None
+        self._stopping = False
+
+    def notify(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    async def run_once(self) -> int:
+        """지금 남아 있는 지운 글을 모두 정리하고, 정리한 글 수를 돌려준다."""
+        purged = 0
+        while not self._stopping:
+            # 읽기 세션은 스냅샷을 붙잡으므로 한 바퀴마다 새로 연다.
+            async with open_repositories() as repo:
+                backlog = await repo.posts.purge_backlog()
+                post_ids = await repo.posts.pending_purge(self.batch_size)
+            self.backlog_posts, self.backlog_comments = backlog
+            if not post_ids:
+                return purged
+
+            for post_id in post_ids:
+                async with open_repositories() as repo:
+                    if not await self._purge_post(repo.posts, post_id):
+                        return purged
+                purged += 1
+        return purged
+
+    async def _purge_post(self, posts: PostRepository, post_id: str) -> bool:
+        """글 하나를 끝까지 지우면 True, 그 전에 멈추면 False."""
+        while True:
+            deleted = await posts.purge(post_id, self.batch_size)
+            self.purged_comments += deleted
+            self.backlog_comments = max(self.backlog_comments - deleted, 0)
+            finished = deleted < self.batch_size
+            if self._stopping and not finished:
+                return False
+            await asyncio.sleep(self.interval)
+            if finished:
+                break
+        self.purged_posts += 1
+        self.backlog_posts = max(self.backlog_posts - 1, 0)
+        return True
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            self._wake.clear()
+            try:
+                await self.run_once()
+            except Exception:
+                # 다음 알림이나 주기에 다시 시도한다.
+                self.failures += 1
+                logger.exception("purge failed")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.poll)
+
+
+PURGER = Purger(
+    batch_size=dev.purge_batch_size,
+    interval_ms=dev.purge_interval_ms,
+    poll_s=dev.purge_poll_s,
+)
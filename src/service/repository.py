@@ -0,0 +1,42 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import dev
+from src.repository.base import Repositories
+from src.repository.memory import memory_repositories
+from src.repository.sql import sql_repositories
+from src.sqlite3.connection import get_read_engine
+
+# DONE: database_type 에 따라 실제 사용하는 저장소가 달라집니다.
+# 서비스와 API 는 Repositories 인터페이스만 알고, 구현은 여기서만 고릅니다.
+SQLITE = dev.database_type == "sqlite"
+
+MEMORY_REPOSITORIES = memory_repositories()
+
+
+async def get_repositories() -> AsyncGenerator[Repositories, None]:
+    if not SQLITE:
+        yield MEMORY_REPOSITORIES
+        return
+    # 읽기는 요청마다 여는 읽기 전용 세션으로, 쓰기는 그룹 커밋 writer 로 간다.
+    async with AsyncSession(get_read_engine()) as session:
+        yield sql_repositories(session)
+
+
+def require_sqlite() -> None:
+    """SQL 에 기대는 기능(검색, 내보내기, 대량 가져오기)을 in-memory 에서 막는다."""
+    if not SQLITE:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Not available with DATABASE_TYPE=in-memory.",
+        )
+
+
+RepositoriesDep = Annotated[Repositories, Depends(get_repositories)]
+
+# 요청 밖(배경 작업)에서 쓰는 `async with open_repositories() as repo:`
+open_repositories = asynccontextmanager(get_repositories)
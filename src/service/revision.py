@@ -0,0 +1,24 @@
+from src.repository.base import PostRepository
+from src.service.cache import comments_tag, post_tag, read_through
+
+
+# revision 은 본문과 같은 태그로 캐시해, 본문이 무효화될 때 함께 무효화된다.
+# 본문보다 revision 을 먼저 읽어야 한다. 그래야 둘 사이에 쓰기가 끼어들어도
+# ETag 가 본문보다 오래될 뿐(다음 요청이 다시 받아 감), 새 ETag 에 옛 본문이
+# 붙어 클라이언트가 바뀐 내용을 놓치는 일이 없다.
+async def get_post_revision(post_id: str, posts: PostRepository) -> int | None:
+    async def load() -> int | None:
+        return await posts.revision(post_id)
+
+    tag = post_tag(post_id)
+    return await read_through(f"{tag}:revision", tag, load)
+
+
+async def get_comments_revision(
+    post_id: str, posts: PostRepository
+) -> int | None:
+    async def load() -> int | None:
+        return await posts.comments_revision(post_id)
+
+    tag = comments_tag(post_id)
+    return await read_through(f"{tag}:revision", tag, load)
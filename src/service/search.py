@@ -0,0 +1,122 @@
+import html
+from typing import Literal
+
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.page import Page
+from src.domain.search import SearchHit
+
+SearchTarget = Literal["posts", "comments"]
+
+MARK_OPEN = "<mark>"
+MARK_CLOSE = "</mark>"
+# 제목과 본문은 사용자가 쓴 텍스트라 HTML 로 그대로 내보내면 안 된다.
+# FTS 에는 글에 쓰이지 않는 제어 문자로 매칭 구간을 표시하게 하고,
+# 이스케이프한 뒤 그 자리만 <mark> 로 바꾼다.
+_MATCH_OPEN = "\x02"
+_MATCH_CLOSE = "\x03"
+SNIPPET_TOKENS = 16
+
+_SEARCH_SQL = {
+    "posts": f"""
+        SELECT p.id, p.id AS post_id, p.author_id, p.created_at,
+               highlight(post_fts, 0, :open, :close) AS title,
+               snippet(post_fts, 1, :open, :close, '…',
+                       {SNIPPET_TOKENS}) AS snippet,
+               post_fts.rank AS rank, post_fts.rowid AS fts_rowid
+        FROM post_fts JOIN post p ON p.rowid = post_fts.rowid
+        WHERE post_fts MATCH :query AND p.deleted_at IS NULL {{cursor}}
+        ORDER BY post_fts.rank, post_fts.rowid
+        LIMIT :limit
+    """,
+    "comments": f"""
+        SELECT c.id, c.post_id, c.author_id, c.created_at,
+               NULL AS title,
+               snippet(comment_fts, 0, :open, :close, '…',
+                       {SNIPPET_TOKENS}) AS snippet,
+               comment_fts.rank AS rank, comment_fts.rowid AS fts_rowid
+        FROM comment_fts JOIN comment c ON c.rowid = comment_fts.rowid
+        WHERE comment_fts MATCH :query
+          AND c.post_id NOT IN (
+              SELECT id FROM post WHERE deleted_at IS NOT NULL)
+          {{cursor}}
+        ORDER BY comment_fts.rank, comment_fts.rowid
+        LIMIT :limit
+    """,
+}
+
+_CURSOR_SQL = {
+    "posts": "AND (post_fts.rank > :rank"
+    " OR (post_fts.rank = :rank AND post_fts.rowid > :rowid))",
+    "comments": "AND (comment_fts.rank > :rank"
+    " OR (comment_fts.rank = :rank AND comment_fts.rowid > :rowid))",
+}
+
+
+def to_match_query(q: str) -> str:
+    """사용자 입력을 FTS5 쿼리로 바꾼다.
+
+    각 단어를 따옴표로 감싼 구(phrase)로 만들어 FTS5 문법 오류를 막고,
+    모든 단어가 포함된 문서만 찾는다(AND). 단어 끝의 `*` 는 접두어 검색으로 둔다.
+    """
+    terms = []
+    for word in q.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def _mark(value: str | None) -> str | None:
+    if value is None:
+        return None
+    escaped = html.escape(value)
+    return escaped.replace(_MATCH_OPEN, MARK_OPEN).replace(
+        _MATCH_CLOSE, MARK_CLOSE
+    )
+
+
+async def search_service(
+    q: str,
+    target: SearchTarget,
+    session: AsyncSession,
+    limit: int,
+    after: str | None = None,
+) -> Page[SearchHit]:
+    query = to_match_query(q)
+    if not query:
+        return Page[SearchHit](items=[])
+
+    params = {
+        "query": query,
+        "limit": limit + 1,
+        "open": _MATCH_OPEN,
+        "close": _MATCH_CLOSE,
+    }
+    cursor = ""
+    if after is not None:
+        rank, rowid = after.rsplit(":", 1)
+        params.update(rank=float(rank), rowid=int(rowid))
+        cursor = _CURSOR_SQL[target]
+
+    stmt = text(_SEARCH_SQL[target].format(cursor=cursor))
+    rows = (await session.exec(stmt, params=params)).mappings().all()
+
+    items = [
+        SearchHit.model_validate(
+            {
+                **row,
+                "title": _mark(row["title"]),
+                "snippet": _mark(row["snippet"]),
+            }
+        )
+        for row in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        # repr 은 float 을 손실 없이 되돌릴 수 있는 문자열로 만든다.
+        next_cursor = f"{last['rank']!r}:{last['fts_rowid']}"
+    return Page[SearchHit](items=items, next_cursor=next_cursor)
@@ -0,0 +1,219 @@
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import AsyncIterator
+
+from src.config import dev
+from src.domain.comment import CommentResponse
+from src.service.repository import open_repositories
+
+# (댓글 id, SSE 이벤트 바이트). 하트비트는 id 가 None 이다.
+Event = tuple[str | None, bytes]
+
+HEARTBEAT: Event = (None, b": ping\n\n")
+
+
+class SubscriberLimitError(Exception):
+    """워커의 구독자 수가 한도에 찼다."""
+
+
+def encode_event(comment: CommentResponse) -> Event:
+    # id 가 Last-Event-ID 로 돌아오므로, ULID 순서대로 이어 받을 수 있다.
+    data = comment.model_dump_json()
+    return (
+        comment.id,
+        f"id: {comment.id}\nevent: comment\ndata: {data}\n\n".encode(),
+    )
+
+
+class Subscription:
+    """구독자 하나. 버퍼가 가득 찰 만큼 느린 구독자는 끊는다.
+
+    끊긴 구독자는 Last-Event-ID 로 다시 붙어 놓친 댓글을 DB 에서 받는다.
+    쉬고 있는 구독자가 많아도 가볍도록 __slots__ 에 deque 하나와
+    기다리는 동안의 Future 하나만 둔다.
+    """
+
+    __slots__ = ("post_id", "limit", "closed", "_buffer", "_waiter")
+
+    def __init__(self, post_id: str, limit: int) -> None:
+        self.post_id = post_id
+        self.limit = limit
+        self.closed = False
+        self._buffer: deque[Event] = deque()
+        self._waiter: asyncio.Future | None = None
+
+    def put(self, event: Event) -> bool:
+        """버퍼에 넣는다. 넘치면 구독을 닫고 False."""
+        if self.closed:
+            return False
+        if len(self._buffer) >= self.limit:
+            self.close()
+            return False
+        self._buffer.append(event)
+        self._wake()
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+        self._buffer.clear()
+        self._wake()
+
+    @property
+    def idle(self) -> bool:
+        return not self._buffer
+
+    async def get(self) -> Event | None:
+        """다음 이벤트. 구독이 닫혔으면 None."""
+        while not self._buffer:
+            if self.closed:
+                return None
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._buffer.popleft()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+class CommentHub:
+    """게시글별 새 댓글을 이 워커의 구독자들에게 나눠 주는 pub/sub.
+
+    댓글은 한 번만 직렬화해 모든 구독자의 버퍼에 같은 바이트를 넣는다.
+    하트비트도 구독자마다 타이머를 두지 않고 허브가 한꺼번에 보낸다.
+    보낼 때 연결이 끊긴 것을 알게 되므로, 쉬는 연결도 주기 안에 정리된다.
+
+    NOTE: 워커 사이에는 공유되지 않는다. 워커가 여럿이면 다른 워커에서 단
+          댓글은 다음 재연결 때 Last-Event-ID 로 DB 에서 받는다.
+    """
+
+    def __init__(
+        self, buffer_size: int, max_subscribers: int, heartbeat_s: float
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self.heartbeat = heartbeat_s
+        self.subscribers = 0
+        self.published = 0
+        self.dropped = 0
+        self._topics: dict[str, set[Subscription]] = {}
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._beat())
+
+    async def stop(self) -> None:
+        """남은 구독을 모두 닫는다.
+
+        uvicorn 은 처리 중인 요청이 끝나기를 graceful timeout 동안 기다린 뒤
+        lifespan 을 닫으므로, 열린 스트림은 그 시간이 지나야 끊긴다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for subscriptions in self._topics.values():
+            for subscription in subscriptions:
+                subscription.close()
+
+    @property
+    def full(self) -> bool:
+        return self.subscribers >= self.max_subscribers
+
+    def subscribe(self, post_id: str) -> Subscription:
+        if self.full:
+            raise SubscriberLimitError(post_id)
+        subscription = Subscription(post_id, self.buffer_size)
+        self._topics.setdefault(post_id, set()).add(subscription)
+        self.subscribers += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscription.close()
+        subscriptions = self._topics.get(subscription.post_id)
+        if subscriptions is None or subscription not in subscriptions:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._topics[subscription.post_id]
+        self.subscribers -= 1
+
+    def publish(self, comment: CommentResponse) -> int:
+        """커밋된 댓글을 구독자들에게 넣고, 받은 구독자 수를 돌려준다."""
+        subscriptions = self._topics.get(comment.post_id)
+        if not subscriptions:
+            return 0
+        event = encode_event(comment)
+        self.published += 1
+        delivered = 0
+        for subscription in subscriptions:
+            if subscription.closed:
+                # 이미 끊겨 스트림이 정리되기를 기다리는 중
+                continue
+            if subscription.put(event):
+                delivered += 1
+            else:
+                self.dropped += 1
+        return delivered
+
+    async def _beat(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            for subscriptions in self._topics.values():
+                for subscription in subscriptions:
+                    # 보낼 것이 쌓여 있으면 그 자체로 연결을 확인한다.
+                    if subscription.idle:
+                        subscription.put(HEARTBEAT)
+
+
+async def comment_events(
+    hub: CommentHub,
+    subscription: Subscription,
+    last_event_id: str | None,
+    replay_page_size: int = 100,
+) -> AsyncIterator[bytes]:
+    """SSE 본문. `last_event_id` 이후의 댓글을 DB 에서 보낸 뒤 새 댓글을 흘린다.
+
+    놓치는 댓글이 없도록 호출하는 쪽이 DB 를 읽기 전에(응답 전에) 구독해
+    넘기고, DB 에서 이미 보낸 댓글은 건너뛴다. 연결이 끊기면
+    StreamingResponse 가 제너레이터를 닫고, 그때 구독을 푼다.
+    """
+    post_id = subscription.post_id
+    try:
+        last = last_event_id
+        if last is not None:
+            while True:
+                # 읽기 세션이 스냅샷을 붙잡지 않도록 페이지마다 열고 닫는다.
+                async with open_repositories() as repo:
+                    page = await repo.comments.list_by_post(
+                        post_id, last, replay_page_size
+                    )
+                if not page:
+                    break
+                for comment in page:
+                    _, data = encode_event(
+                        CommentResponse.model_validate(comment)
+                    )
+                    yield data
+                last = page[-1].id
+
+        while (event := await subscription.get()) is not None:
+            event_id, data = event
+            if event_id is not None and last is not None and event_id <= last:
+                continue
+            yield data
+    finally:
+        hub.unsubscribe(subscription)
+
+
+COMMENT_HUB = CommentHub(
+    buffer_size=dev.stream_buffer_size,
+    max_subscribers=dev.stream_max_subscribers,
+    heartbeat_s=dev.stream_heartbeat_s,
+)
@@ -0,0 +1,124 @@
+import asyncio
+import contextlib
+import logging
+
+from src.config import dev
+from src.service.repository import open_repositories
+
+logger = logging.getLogger("src.service.views")
+
+
+class ViewCounter:
+    """게시글 조회수를 워커 메모리에 모았다가 주기적으로 한 번에 더한다 (write-behind).
+
+    조회마다 UPDATE 하면 모든 GET 이 SQLite writer 앞에 줄을 선다. 대신 글 id 별
+    증가분을 dict 에 더해 두고, `flush_interval_s` 마다(모인 증가분이
+    `max_pending` 에 닿으면 바로) UPSERT 한 번, 한 트랜잭션으로 더한다.
+    워커마다 따로 모아 더하기만 하므로 워커 사이에 맞출 것이 없다.
+
+    조회수를 읽을 때는 반영된 값에 `pending(post_id)` 를 더한다. 정상 종료하면
+    `stop` 이 남은 증가분을 반영하고, 비정상 종료하면 그만큼(최대 `max_pending`)
+    잃는다.
+    """
+
+    def __init__(self, flush_interval_s: float, max_pending: int) -> None:
+        self.interval = flush_interval_s
+        self.max_pending = max_pending
+        self.flushed = 0
+        self.failures = 0
+        self.buffered = 0
+        self._pending: dict[str, int] = {}
+        # 반영 중인 증가분. 커밋될 때까지 읽기에 더해, 그동안 조회수가 줄어 보이지 않게 한다.
+        self._flushing: dict[str, int] = {}
+        # 주기 반영과 stop/테스트의 반영이 겹치지 않게 한다.
+        self._lock = asyncio.Lock()
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def record(self, post_id: str) -> None:
+        self._pending[post_id] = self._pending.get(post_id, 0) + 1
+        self.buffered += 1
+        if self.buffered >= self.max_pending and self._wake is not None:
+            self._wake.set()
+
+    def pending(self, post_id: str) -> int:
+        """이 워커에서 아직 DB 에 더하지 않은 조회수"""
+        return self._pending.get(post_id, 0) + self._flushing.get(post_id, 0)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        # 락과 이벤트는 만든 이벤트 루프에 묶이므로 기동할 때 새로 만든다.
+        self._lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """남은 증가분을 반영하고 멈춘다. writer 를 멈추기 전에 불러야 한다."""
+        if self._task is not None:
+            # 반영 도중에 취소하면 커밋됐는지 알 수 없으므로, 끝나기를 기다린다.
+            self._stopping = True
+            self._wake.set()
+            await self._task
+            self._task = None
+            self._wake = None
+            self._stopping = False
+        try:
+            await self.flush()
+        except Exception:
+            self.failures += 1
+            logger.exception("view flush failed, %d views lost", self.buffered)
+
+    async def flush(self) -> int:
+        """모인 증가분을 DB 에 더하고, 더한 조회수를 돌려준다.
+
+        실패하면 증가분을 버퍼에 되돌려 다음 반영에서 다시 더한다.
+        """
+        async with self._lock:
+            return await self._flush()
+
+    async def _flush(self) -> int:
+        if not self._pending:
+            return 0
+        # 반영하는 동안 들어오는 조회는 새 버퍼에 모인다.
+        views, self._pending = self._pending, {}
+        count, self.buffered = self.buffered, 0
+        self._flushing = views
+        try:
+            async with open_repositories() as repo:
+                await repo.posts.add_views(views)
+        except Exception:
+            for post_id, delta in views.items():
+                self._pending[post_id] = self._pending.get(post_id, 0) + delta
+            self.buffered += count
+            raise
+        finally:
+            self._flushing = {}
+        self.flushed += count
+        return count
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            self._wake.clear()
+            if self._stopping:
+                # 마지막 반영은 stop 이 한다.
+                break
+            try:
+                await self.flush()
+            except Exception:
+                # 증가분은 버퍼에 남아 있으므로 다음 주기에 다시 시도한다.
+                self.failures += 1
+                logger.exception("view flush failed")
+
+
+VIEW_COUNTER = ViewCounter(
+    flush_interval_s=dev.view_flush_interval_s,
+    max_pending=dev.view_max_pending,
+)
@@ -1,39 +1,139 @@
-from sqlmodel import Session, SQLModel, StaticPool, create_engine
+from functools import cache
 
-from src.config import ServerConfig
-
-config = ServerConfig()
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, StaticPool
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.config import dev as config
+from src.sqlite3.counter import COUNTER_SCHEMA
+from src.sqlite3.fts import FTS_SCHEMA
+from src.sqlite3.instrument import InstrumentedPool, install_metrics
+from src.sqlite3.migration import (
+    LATEST_VERSION,
+    get_version,
+    migrate,
+    set_version,
+)
+from src.sqlite3.revision import REVISION_SCHEMA
 
 if config.database_type == "sqlite":
-    DATABASE_URL = "sqlite:///echo_board.db"
+    DATABASE_URL = f"sqlite+aiosqlite:///{config.database_path}"
+    # 읽기 전용(mode=ro) 커넥션. GET 요청은 이 풀을 사용해 writer 와 풀 슬롯을 다투지 않는다.
+    READ_DATABASE_URL = (
+        f"sqlite+aiosqlite:///file:{config.database_path}?mode=ro&uri=true"
+    )
+    # 커넥션을 빌려오기까지 기다린 시간을 메트릭으로 남기는 풀을 쓴다.
     pool_options = {
-        "pool_size": 5,
-        "max_overflow": 10,
+        "poolclass": InstrumentedPool,
+        "pool_logging_name": "write",
+        "pool_size": config.write_pool_size,
+        "max_overflow": config.write_max_overflow,
+    }
+    read_pool_options = {
+        "poolclass": InstrumentedPool,
+        "pool_logging_name": "read",
+        "pool_size": config.read_pool_size,
+        "max_overflow": config.read_max_overflow,
     }
 elif config.database_type == "in-memory":
-    DATABASE_URL = "sqlite:///:memory:"
+    # 요청은 dict 저장소(src/repository/memory.py)가 처리해 엔진을 만들 일이 없다.
+    # 인메모리 DB는 커넥션마다 별개의 DB가 되므로 읽기 엔진을 따로 두지 않는다.
+    DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+    READ_DATABASE_URL = None
     pool_options = {"poolclass": StaticPool}
 
 else:
     raise ValueError(f"database_type: {config.database_type}")
 
 
+def _pragmas(readonly: bool) -> list[str]:
+    pragmas = [
+        f"PRAGMA busy_timeout = {config.sqlite_busy_timeout_ms}",
+        f"PRAGMA cache_size = {config.sqlite_cache_size}",
+        f"PRAGMA mmap_size = {config.sqlite_mmap_size}",
+    ]
+    if not readonly:
+        # journal_mode 는 DB 파일에 기록되는 설정이라 읽기 전용 커넥션에서는 바꿀 수 없다.
+        pragmas += [
+            f"PRAGMA journal_mode = {config.sqlite_journal_mode}",
+            f"PRAGMA synchronous = {config.sqlite_synchronous}",
+        ]
+    return pragmas
+
+
+def _install_pragmas(engine: AsyncEngine, readonly: bool) -> None:
+    pragmas = _pragmas(readonly)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
 # TODO: 커넥션 풀에 대해 설명하기.
 # TODO: create_engine의 주요 파라미터들에 대해 설명하기.
-# TODO: 현재 주입받는 엔드포인트 함수들은 비동기(async)로 되어있는데, DB는 sync 엔진으로 되어 있음. 어떤 문제가 있는지 설명하고 적절하게 수정하기.
-ENGINE = create_engine(
-    DATABASE_URL,
-    echo=True,
-    connect_args={"check_same_thread": False},
-    **pool_options,
-)
+# DONE: 엔드포인트가 async 인데 DB가 sync 엔진이라 스레드풀 크기에 동시성이 묶여 있던 문제.
+#       aiosqlite 드라이버 기반의 async 엔진과 AsyncSession 으로 교체했습니다.
+# DONE: echo=True 는 모든 SQL 을 동기적으로 로그에 남겨 처리량을 깎아 먹었습니다.
+#       SQL 통계는 /api/metrics 로, 로그는 SLOW_QUERY_MS 이상 걸린 SQL 만 남깁니다.
+# DONE: 엔진을 import 시점이 아니라 처음 쓸 때 만듭니다. (드라이버 import 도 그때)
+@cache
+def get_engine() -> AsyncEngine:
+    engine = create_async_engine(DATABASE_URL, **pool_options)
+    _install_pragmas(engine, readonly=False)
+    install_metrics(engine, "write", config.slow_query_ms)
+    return engine
 
 
-def init_db():
-    SQLModel.metadata.create_all(ENGINE)
+@cache
+def get_read_engine() -> AsyncEngine:
+    if READ_DATABASE_URL is None:
+        return get_engine()
+    engine = create_async_engine(READ_DATABASE_URL, **read_pool_options)
+    _install_pragmas(engine, readonly=True)
+    install_metrics(engine, "read", config.slow_query_ms)
+    return engine
+
+
+def _has_tables(sync_conn) -> bool:
+    return bool(inspect(sync_conn).get_table_names())
+
+
+async def init_db():
+    engine = get_engine()
+    # 이미 최신 스키마면 쓰기 락도, DDL 도 없이 끝낸다. 워커를 자주 늘리고
+    # 줄일 때, 새 워커가 쓰기 락을 잡아 다른 워커의 쓰기를 막지 않게 한다.
+    # 그래서 모델에 테이블을 추가할 때도 마이그레이션(버전)을 함께 추가해야 한다.
+    async with engine.connect() as conn:
+        if await get_version(conn) == LATEST_VERSION:
+            return
+
+    async with engine.begin() as conn:
+        # sqlite3 드라이버는 DDL 앞에 BEGIN 을 붙이지 않으므로 직접 연다.
+        # IMMEDIATE 로 쓰기 락을 먼저 잡아, 여러 프로세스가 동시에 스키마를 만들지 않게 한다.
+        await conn.exec_driver_sql("BEGIN IMMEDIATE")
+        fresh = not await conn.run_sync(_has_tables)
+        await conn.run_sync(SQLModel.metadata.create_all)
+        if fresh:
+            # 새 DB는 create_all 이 최신 스키마를 만들었으므로 버전만 기록한다.
+            # FTS 가상 테이블과 트리거는 SQLModel 모델로 표현되지 않아 따로 만든다.
+            for statement in FTS_SCHEMA + REVISION_SCHEMA + COUNTER_SCHEMA:
+                await conn.exec_driver_sql(statement)
+            await set_version(conn, LATEST_VERSION)
+        else:
+            # 기존 DB는 create_all 이 인덱스/컬럼을 추가하지 않으므로 마이그레이션한다.
+            await migrate(conn)
+
+
+async def get_session():
+    # commit 이후 속성 접근이 암묵적인 I/O 를 일으키지 않도록 expire 하지 않는다.
+    async with AsyncSession(get_engine(), expire_on_commit=False) as session:
+        yield session
 
 
-def get_session():
-    with Session(ENGINE) as session:
+async def get_read_session():
+    async with AsyncSession(get_read_engine()) as session:
         yield session
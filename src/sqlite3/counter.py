@@ -0,0 +1,107 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 글의 댓글 수(post.comment_count)와 사용자별 글/댓글 수(user_stats) 카운터.
+# revision 카운터(src/sqlite3/revision.py)처럼 트리거라서, 어떤 경로로 쓰든
+# 글/댓글을 쓰는 트랜잭션 안에서 함께 바뀐다. 목록의 total 과 사용자 통계를
+# COUNT(*) 없이 한 행만 읽어 답한다.
+#
+# - 글 수는 지우지 않은 글만 센다. soft delete 할 때 줄인다.
+# - 댓글 수는 남아 있는 댓글 행을 센다. 지운 글의 댓글은 purger 가 행을
+#   지울 때 줄어든다.
+# - 댓글 수가 바뀌면 글 응답(comment_count)도 바뀌므로 post.revision 도 올린다.
+COUNTER_SCHEMA: tuple[str, ...] = (
+    "CREATE TRIGGER IF NOT EXISTS post_count_ai"
+    " AFTER INSERT ON post WHEN new.deleted_at IS NULL BEGIN"
+    " INSERT INTO user_stats (user_id, post_count) VALUES (new.author_id, 1)"
+    " ON CONFLICT (user_id) DO UPDATE SET post_count = post_count + 1;"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS post_count_au"
+    " AFTER UPDATE OF deleted_at ON post"
+    " WHEN old.deleted_at IS NULL AND new.deleted_at IS NOT NULL BEGIN"
+    " UPDATE user_stats SET post_count = post_count - 1"
+    " WHERE user_id = old.author_id;"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS post_count_ad"
+    " AFTER DELETE ON post WHEN old.deleted_at IS NULL BEGIN"
+    " UPDATE user_stats SET post_count = post_count - 1"
+    " WHERE user_id = old.author_id;"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS comment_count_ai"
+    " AFTER INSERT ON comment BEGIN"
+    " UPDATE post"
+    " SET comment_count = comment_count + 1, revision = revision + 1"
+    " WHERE id = new.post_id;"
+    " INSERT INTO user_stats (user_id, comment_count) VALUES (new.author_id, 1)"
+    " ON CONFLICT (user_id) DO UPDATE SET comment_count = comment_count + 1;"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS comment_count_ad"
+    " AFTER DELETE ON comment BEGIN"
+    " UPDATE post"
+    " SET comment_count = comment_count - 1, revision = revision + 1"
+    " WHERE id = old.post_id;"
+    " UPDATE user_stats SET comment_count = comment_count - 1"
+    " WHERE user_id = old.author_id;"
+    " END",
+)
+
+_POST_COMMENTS = "(SELECT count(*) FROM comment WHERE post_id = post.id)"
+_USER_POSTS = (
+    "(SELECT count(*) FROM post"
+    " WHERE author_id = user_stats.user_id AND deleted_at IS NULL)"
+)
+_USER_COMMENTS = (
+    "(SELECT count(*) FROM comment WHERE author_id = user_stats.user_id)"
+)
+
+# 카운터를 원본 테이블에서 다시 세어, 값이 다른 행만 고친다. 이름은 리포트용이다.
+# 상관 서브쿼리는 (post_id, id), (author_id, id) 인덱스 범위만 센다.
+REPAIR_STATEMENTS: dict[str, str] = {
+    # 응답이 바뀌므로 revision 도 올려, 클라이언트가 옛 ETag 로 304 를 받지 않게 한다.
+    "post.comment_count": (
+        f"UPDATE post SET comment_count = {_POST_COMMENTS},"
+        " revision = revision + 1"
+        f" WHERE comment_count != {_POST_COMMENTS}"
+    ),
+    # 트리거를 거치지 않고 들어간 작성자(ex. 데이터 생성)의 행을 먼저 만든다.
+    "user_stats.rows": (
+        "INSERT OR IGNORE INTO user_stats (user_id)"
+        " SELECT author_id FROM post UNION SELECT author_id FROM comment"
+    ),
+    "user_stats.counts": (
+        f"UPDATE user_stats SET post_count = {_USER_POSTS},"
+        f" comment_count = {_USER_COMMENTS}"
+        f" WHERE post_count != {_USER_POSTS}"
+        f" OR comment_count != {_USER_COMMENTS}"
+    ),
+}
+
+
+async def repair(conn: AsyncConnection) -> dict[str, int]:
+    """어긋난 카운터를 고치고, 문장별로 고친 행 수를 돌려준다.
+
+    호출하는 쪽이 쓰기 락(BEGIN IMMEDIATE)을 잡고 불러야, 세는 동안 들어온
+    쓰기가 빠지지 않는다.
+    """
+    fixed = {}
+    for name, statement in REPAIR_STATEMENTS.items():
+        result = await conn.exec_driver_sql(statement)
+        fixed[name] = result.rowcount
+    return fixed
+
+
+async def _repair_counters() -> dict[str, int]:
+    from src.sqlite3.connection import get_engine, init_db
+
+    await init_db()
+    async with get_engine().begin() as conn:
+        await conn.exec_driver_sql("BEGIN IMMEDIATE")
+        fixed = await repair(conn)
+    await get_engine().dispose()
+    return fixed
+
+
+def repair_counters():
+    for name, rows in asyncio.run(_repair_counters()).items():
+        print(f"{name}: {rows} rows fixed")
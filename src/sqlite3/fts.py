@@ -0,0 +1,76 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 게시글/댓글 전문 검색용 FTS5 인덱스.
+# 원본 텍스트는 post/comment 테이블에만 두고(external content), FTS 테이블은
+# rowid 로 원본 행을 가리키는 역색인만 가진다. 트리거가 INSERT/UPDATE/DELETE 를 따라간다.
+#
+# NOTE: 외부 콘텐츠 테이블은 원본의 rowid 에 의존한다. VACUUM 은 명시적인
+#       INTEGER PRIMARY KEY 가 없는 테이블의 rowid 를 바꿀 수 있으므로,
+#       VACUUM 이후에는 `poetry run reindex` 로 인덱스를 다시 만드세요.
+FTS_SCHEMA: tuple[str, ...] = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS post_fts USING fts5("
+    "title, content, content='post', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS post_fts_ai AFTER INSERT ON post BEGIN"
+    " INSERT INTO post_fts(rowid, title, content)"
+    " VALUES (new.rowid, new.title, new.content);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS post_fts_ad AFTER DELETE ON post BEGIN"
+    " INSERT INTO post_fts(post_fts, rowid, title, content)"
+    " VALUES ('delete', old.rowid, old.title, old.content);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS post_fts_au"
+    " AFTER UPDATE OF title, content ON post BEGIN"
+    " INSERT INTO post_fts(post_fts, rowid, title, content)"
+    " VALUES ('delete', old.rowid, old.title, old.content);"
+    " INSERT INTO post_fts(rowid, title, content)"
+    " VALUES (new.rowid, new.title, new.content);"
+    " END",
+    # 제목에 매칭된 경우를 본문보다 10배 높게 친다.
+    # NOTE: FTS 설정(rank 등)이 바뀌면 이미 열려 있던 읽기 전용 커넥션이
+    #       "SQL logic error" 를 내므로, 스키마를 만들 때 한 번만 실행한다.
+    "INSERT INTO post_fts(post_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS comment_fts USING fts5("
+    "content, content='comment', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS comment_fts_ai AFTER INSERT ON comment BEGIN"
+    " INSERT INTO comment_fts(rowid, content) VALUES (new.rowid, new.content);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS comment_fts_ad AFTER DELETE ON comment BEGIN"
+    " INSERT INTO comment_fts(comment_fts, rowid, content)"
+    " VALUES ('delete', old.rowid, old.content);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS comment_fts_au"
+    " AFTER UPDATE OF content ON comment BEGIN"
+    " INSERT INTO comment_fts(comment_fts, rowid, content)"
+    " VALUES ('delete', old.rowid, old.content);"
+    " INSERT INTO comment_fts(rowid, content) VALUES (new.rowid, new.content);"
+    " END",
+)
+
+FTS_TABLES = ("post_fts", "comment_fts")
+
+
+async def rebuild(conn: AsyncConnection) -> None:
+    """원본 테이블로부터 FTS 인덱스를 처음부터 다시 만든다."""
+    for table in FTS_TABLES:
+        await conn.exec_driver_sql(
+            f"INSERT INTO {table}({table}) VALUES ('rebuild')"
+        )
+        await conn.exec_driver_sql(
+            f"INSERT INTO {table}({table}) VALUES ('optimize')"
+        )
+
+
+async def _reindex() -> None:
+    from src.sqlite3.connection import get_engine, init_db
+
+    await init_db()
+    async with get_engine().begin() as conn:
+        await conn.exec_driver_sql("BEGIN IMMEDIATE")
+        await rebuild(conn)
+    await get_engine().dispose()
+
+
+def reindex():
+    asyncio.run(_reindex())
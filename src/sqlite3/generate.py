@@ -0,0 +1,404 @@
+"""재현 가능한 대용량 게시판 데이터를 DB 에 채웁니다.
+
+    DATABASE_PATH=big.db poetry run generate-data --rows 10000000 --seed 1
+
+실제 서비스처럼 분포가 치우친 데이터를 만듭니다.
+
+- 작성자: 소수의 사용자가 글/댓글 대부분을 쓰는 멱법칙(Zipf) 분포
+- 댓글: 댓글이 `--hot-comments` 개씩 달린 인기 글 몇 개, 나머지는 Zipf 분포라
+  대부분의 글은 댓글이 거의 없다.
+- 시각: 글은 `--days` 일 동안 고르게, 댓글은 글이 올라온 뒤 지수 분포로 늦게
+  달린다. id(ULID)의 시각 부분도 이 시각을 따른다.
+
+같은 `--seed` 와 크기로 만들면 비밀번호 해시(salt)를 제외하고 같은 데이터가
+만들어집니다. 속도를 위해 sqlite3 로 직접 넣으며, 넣는 동안에는 보조 인덱스와
+트리거(FTS, 카운터)를 내려 두었다가 마지막에 한 번에 다시 만듭니다.
+"""
+
+import argparse
+import asyncio
+import random
+import sqlite3
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import accumulate, islice
+
+from sqlmodel import SQLModel
+from ulid import ULID
+
+from src.config import dev
+from src.domain.comment import Comment
+from src.domain.post import TIME_ZONE, Post
+from src.domain.user import User
+from src.service.password import hash_password
+from src.sqlite3.counter import REPAIR_STATEMENTS
+from src.sqlite3.fts import FTS_TABLES
+
+DEFAULT_PASSWORD = "Password1"
+BATCH_SIZE = 50_000
+CORPUS_WORDS = 1 << 16
+# 끝 시각을 고정해야 같은 seed 로 같은 id 가 나온다.
+PERIOD_END = datetime(2025, 1, 1, tzinfo=TIME_ZONE)
+# 사용자는 게시 기간이 시작되기 전 30일 동안 가입한다.
+SIGNUP_PERIOD = timedelta(days=30)
+# 순위 r 인 사용자/글이 뽑힐 가중치를 1 / r^s 로 둔다.
+AUTHOR_SKEW = 1.1
+POST_SKEW = 0.8
+# 글이 올라온 뒤 댓글이 달리기까지 걸리는 평균 시간
+COMMENT_DELAY_MEAN = timedelta(days=1)
+
+WORDS = (
+    "fastapi sqlite python async await cursor index query page cache "
+    "commit writer search token thread pool latency throughput benchmark "
+    "게시판 댓글 검색 성능 인덱스 캐시 트랜잭션 페이지 비동기 서버"
+).split()
+
+USER_FIELDS = ("id", "username", "password", "nickname", "created_at")
+POST_FIELDS = ("id", "author_id", "title", "content", "created_at")
+COMMENT_FIELDS = ("id", "author_id", "post_id", "content", "created_at")
+
+# 넣는 동안 내려 둘 인덱스와 트리거가 걸린 테이블
+TABLES = (User, Post, Comment)
+
+
+@dataclass(frozen=True)
+class DatasetShape:
+    users: int
+    posts: int
+    comments: int
+    hot_posts: int = 10
+    hot_comments: int = 100_000
+    days: int = 180
+
+    @classmethod
+    def from_rows(cls, rows: int, **overrides: int) -> "DatasetShape":
+        """글 + 댓글이 `rows` 개인 모양. 1/4 이 글, 사용자는 1000 행당 한 명이다."""
+        posts = rows // 4
+        shape = {
+            "users": max(10, rows // 1000),
+            "posts": posts,
+            "comments": rows - posts,
+        }
+        return cls(**{**shape, **overrides})
+
+
+def insert_sql(
+    model: type[SQLModel], fields: tuple[str, ...], into: str | None = None
+) -> str:
+    """모델 테이블의 `fields` 컬럼에 넣는 INSERT 문. 모델에 없는 컬럼이면 실패한다."""
+    table = model.__table__
+    unknown = [name for name in fields if name not in table.columns]
+    if unknown:
+        raise ValueError(f"{table.name} has no columns: {unknown}")
+    placeholders = ", ".join("?" * len(fields))
+    return (
+        f"INSERT INTO {into or table.name} ({', '.join(fields)})"
+        f" VALUES ({placeholders})"
+    )
+
+
+def sql_datetime(ms: int) -> str:
+    # SQLAlchemy 가 SQLite DATETIME 컬럼에 저장하는 형식(시간대 없는 KST)과 맞춘다.
+    at = datetime.fromtimestamp(ms / 1000, TIME_ZONE)
+    return at.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def zipf_cum_weights(
+    rng: random.Random, count: int, skew: float
+) -> list[float]:
+    # 순위를 섞어, 인기 있는 대상이 id(시각) 순서와 상관없이 흩어지게 한다.
+    ranks = list(range(1, count + 1))
+    rng.shuffle(ranks)
+    return list(accumulate(rank**-skew for rank in ranks))
+
+
+def batched(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Generator:
+    """DatasetShape 대로 행을 만든다. 모든 난수는 `seed` 하나에서 나온다."""
+
+    def __init__(self, shape: DatasetShape, seed: int) -> None:
+        self.shape = shape
+        self.rng = random.Random(seed)
+        self.end_ms = int(PERIOD_END.timestamp() * 1000)
+        self.start_ms = self.end_ms - shape.days * 86_400_000
+        self.user_ids: list[str] = []
+        self.author_weights: list[float] = []
+        # 본문은 미리 뽑아 둔 단어열에서 임의 위치를 잘라 쓴다. (단어마다 뽑는 것보다 빠름)
+        self.corpus = self.rng.choices(WORDS, k=CORPUS_WORDS)
+        # 글 id 는 행 수가 많아 문자열 대신 ULID 16바이트를 이어 붙여 둔다.
+        self.post_ids = bytearray()
+
+    def _ulid_bytes(self, ms: int) -> bytes:
+        return ms.to_bytes(6, "big") + self.rng.randbytes(10)
+
+    def _ulid(self, ms: int) -> str:
+        return str(ULID.from_bytes(self._ulid_bytes(ms)))
+
+    def _text(self, median_words: int, max_words: int) -> str:
+        words = int(self.rng.lognormvariate(0, 0.8) * median_words)
+        words = min(max(words, 1), max_words)
+        start = self.rng.randrange(CORPUS_WORDS - words)
+        return " ".join(self.corpus[start : start + words])
+
+    def _timeline(
+        self, start_ms: int, end_ms: int, count: int
+    ) -> Iterator[int]:
+        # 구간 안에 고르게 퍼진 시각(ms)을 오름차순으로 만든다.
+        step = (end_ms - start_ms) / max(count, 1)
+        for i in range(count):
+            yield start_ms + int(step * i)
+
+    def _authors(self, count: int) -> list[str]:
+        return self.rng.choices(
+            self.user_ids, cum_weights=self.author_weights, k=count
+        )
+
+    def users(self, password_hash: str) -> Iterator[tuple]:
+        signup_ms = int(SIGNUP_PERIOD.total_seconds() * 1000)
+        timeline = self._timeline(
+            self.start_ms - signup_ms, self.start_ms, self.shape.users
+        )
+        for i, ms in enumerate(timeline):
+            user_id = self._ulid(ms)
+            self.user_ids.append(user_id)
+            yield (
+                user_id,
+                f"user_{i}",
+                password_hash,
+                f"nick_{i}",
+                sql_datetime(ms),
+            )
+        self.author_weights = zipf_cum_weights(
+            self.rng, len(self.user_ids), AUTHOR_SKEW
+        )
+
+    def posts(self) -> Iterator[tuple]:
+        timeline = self._timeline(self.start_ms, self.end_ms, self.shape.posts)
+        for batch in batched(timeline, BATCH_SIZE):
+            for ms, author_id in zip(batch, self._authors(len(batch))):
+                raw = self._ulid_bytes(ms)
+                self.post_ids += raw
+                yield (
+                    str(ULID.from_bytes(raw)),
+                    author_id,
+                    self._text(6, 20),
+                    self._text(30, 500),
+                    sql_datetime(ms),
+                )
+
+    def _comment(self, post: int, author_id: str) -> tuple:
+        raw = self.post_ids[post * 16 : post * 16 + 16]
+        post_ms = int.from_bytes(raw[:6], "big")
+        delay = self.rng.expovariate(1 / COMMENT_DELAY_MEAN.total_seconds())
+        ms = post_ms + int(delay * 1000)
+        if ms > self.end_ms:
+            # 기간을 넘기면 남은 구간 안에 고르게 다시 뽑는다.
+            ms = post_ms + int(self.rng.random() * (self.end_ms - post_ms))
+        return (
+            self._ulid(ms),
+            author_id,
+            str(ULID.from_bytes(bytes(raw))),
+            self._text(10, 200),
+            sql_datetime(ms),
+        )
+
+    def comment_post_indexes(self) -> Iterator[list[int]]:
+        """댓글이 달릴 글의 인덱스를 배치 단위로 돌려준다. 순서는 시각과 무관하다."""
+        shape, total = self.shape, len(self.post_ids) // 16
+        if total == 0:
+            return
+
+        # 인기 글은 충분히 댓글이 쌓이도록 기간 앞쪽 절반에서 고른다.
+        candidates = range(max(total // 2, 1))
+        hot = self.rng.sample(candidates, min(shape.hot_posts, len(candidates)))
+        # 인기 글이 전체 댓글의 절반을 넘지 않게 한다.
+        per_hot = min(
+            shape.hot_comments, shape.comments // 2 // max(len(hot), 1)
+        )
+        for post in hot:
+            for start in range(0, per_hot, BATCH_SIZE):
+                yield [post] * min(BATCH_SIZE, per_hot - start)
+
+        remaining = shape.comments - per_hot * len(hot)
+        weights = zipf_cum_weights(self.rng, total, POST_SKEW)
+        for start in range(0, remaining, BATCH_SIZE):
+            count = min(BATCH_SIZE, remaining - start)
+            yield self.rng.choices(range(total), cum_weights=weights, k=count)
+
+    def comments(self) -> Iterator[tuple]:
+        for posts in self.comment_post_indexes():
+            for post, author_id in zip(posts, self._authors(len(posts))):
+                yield self._comment(post, author_id)
+
+
+def insert_all(
+    conn: sqlite3.Connection, sql: str, rows: Iterable[tuple]
+) -> int:
+    count = 0
+    for batch in batched(rows, BATCH_SIZE):
+        conn.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+
+def _drop_indexes_and_triggers(conn: sqlite3.Connection) -> list[str]:
+    """보조 인덱스와 트리거를 지우고, 다시 만들 때 쓸 DDL 을 돌려준다.
+
+    PK/UNIQUE 제약이 만든 자동 인덱스(sql 이 NULL)는 지울 수 없어 남긴다.
+    """
+    tables = [model.__tablename__ for model in TABLES]
+    rows = conn.execute(
+        "SELECT type, name, sql FROM sqlite_master"
+        " WHERE type IN ('index', 'trigger') AND sql IS NOT NULL"
+        f" AND tbl_name IN ({', '.join('?' * len(tables))})",
+        tables,
+    ).fetchall()
+    for kind, name, _ in rows:
+        conn.execute(f'DROP {kind.upper()} "{name}"')
+    return [sql for _, _, sql in rows]
+
+
+def _is_empty(conn: sqlite3.Connection) -> bool:
+    return not any(
+        conn.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {model.__tablename__})"
+        ).fetchone()[0]
+        for model in TABLES
+    )
+
+
+def _log(message: str, started: float) -> None:
+    print(f"{message} ({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+
+
+def generate(
+    path: str,
+    shape: DatasetShape,
+    seed: int = 0,
+    password: str = DEFAULT_PASSWORD,
+) -> dict[str, int]:
+    """`path` 의 빈 DB 에 데이터를 채우고, 테이블별로 넣은 행 수를 돌려준다.
+
+    스키마는 `init_db` 로 만든 뒤이어야 한다. (`main` 참고)
+    """
+    generator = Generator(shape, seed)
+    counts = {}
+    started = time.perf_counter()
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        if not _is_empty(conn):
+            raise ValueError(f"{path} already has rows")
+
+        # 실패하면 다시 만들면 되는 DB 라 저널과 fsync 를 끈다.
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA cache_size = -262144")
+        conn.execute("BEGIN")
+        schema = _drop_indexes_and_triggers(conn)
+
+        # 모든 사용자가 같은 비밀번호를 쓰므로 해시는 한 번만 한다.
+        counts["users"] = insert_all(
+            conn,
+            insert_sql(User, USER_FIELDS),
+            generator.users(hash_password(password)),
+        )
+        counts["posts"] = insert_all(
+            conn, insert_sql(Post, POST_FIELDS), generator.posts()
+        )
+        _log(f"users {counts['users']}, posts {counts['posts']}", started)
+
+        # 댓글은 글 단위로 만들어 시각 순서가 뒤섞여 있다. 정렬 없이 넣으면
+        # PK 인덱스에 무작위로 끼워 넣게 되므로, 임시 테이블에 모은 뒤
+        # id 순으로 옮겨 인덱스 끝에만 붙게 한다.
+        conn.execute(
+            "CREATE TEMP TABLE comment_stage AS SELECT"
+            f" {', '.join(COMMENT_FIELDS)} FROM comment WHERE 0"
+        )
+        counts["comments"] = insert_all(
+            conn,
+            insert_sql(Comment, COMMENT_FIELDS, into="temp.comment_stage"),
+            generator.comments(),
+        )
+        conn.execute(
+            f"INSERT INTO comment ({', '.join(COMMENT_FIELDS)})"
+            f" SELECT * FROM temp.comment_stage ORDER BY id"
+        )
+        conn.execute("DROP TABLE temp.comment_stage")
+        _log(f"comments {counts['comments']}", started)
+
+        for statement in schema:
+            conn.execute(statement)
+        for table in FTS_TABLES:
+            conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+        # 카운터 트리거도 내려 두었으므로 한 번에 센다.
+        for statement in REPAIR_STATEMENTS.values():
+            conn.execute(statement)
+        conn.execute("COMMIT")
+        _log("indexes, full-text search and counters rebuilt", started)
+
+        conn.execute("ANALYZE")
+        conn.execute(f"PRAGMA journal_mode = {dev.sqlite_journal_mode}")
+    finally:
+        conn.close()
+    return counts
+
+
+async def create_schema() -> None:
+    """DATABASE_PATH 에 스키마를 만든다."""
+    # 엔진은 import 시점의 DATABASE_PATH 를 쓰므로 호출할 때 import 한다.
+    import src.main  # noqa: F401 (모든 모델을 metadata 에 등록)
+    from src.sqlite3.connection import get_engine, init_db
+
+    await init_db()
+    await get_engine().dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="DATABASE_PATH 의 빈 DB 에 합성 데이터를 채웁니다."
+    )
+    parser.add_argument(
+        "--rows", type=int, default=100_000, help="글 + 댓글 수"
+    )
+    parser.add_argument("--users", type=int)
+    parser.add_argument("--posts", type=int)
+    parser.add_argument("--comments", type=int)
+    parser.add_argument("--hot-posts", type=int)
+    parser.add_argument("--hot-comments", type=int)
+    parser.add_argument("--days", type=int, help="글이 올라온 기간")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    args = parser.parse_args()
+
+    if dev.database_type != "sqlite":
+        parser.error("DATABASE_TYPE must be sqlite")
+
+    overrides = {
+        name: value
+        for name in (
+            "users",
+            "posts",
+            "comments",
+            "hot_posts",
+            "hot_comments",
+            "days",
+        )
+        if (value := getattr(args, name)) is not None
+    }
+    shape = DatasetShape.from_rows(args.rows, **overrides)
+
+    asyncio.run(create_schema())
+    try:
+        counts = generate(dev.database_path, shape, args.seed, args.password)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(counts)
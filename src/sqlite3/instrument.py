@@ -0,0 +1,92 @@
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.metrics.registry import REGISTRY
+from src.metrics.request import CURRENT_REQUEST
+
+logger = logging.getLogger("src.sqlite3.slow_query")
+
+DB_STATEMENT_SECONDS = REGISTRY.histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time",
+    ("engine",),
+)
+DB_POOL_CHECKOUT_SECONDS = REGISTRY.histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time spent waiting for a pooled connection",
+    ("engine",),
+)
+DB_SLOW_QUERIES = REGISTRY.counter(
+    "db_slow_queries_total",
+    "SQL statements slower than SLOW_QUERY_MS",
+    ("engine",),
+)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """커넥션을 빌려올 때까지 기다린 시간을 기록하는 풀.
+
+    풀이 가득 차면 `connect()` 가 반납을 기다리므로, 이 시간이 길면
+    풀 크기(WRITE_POOL_SIZE / READ_POOL_SIZE)가 부족하다는 뜻이다.
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(
+                time.perf_counter() - started, engine=self.logging_name
+            )
+
+
+def install_metrics(
+    engine: AsyncEngine, name: str, slow_query_ms: float | None
+) -> None:
+    """SQL 실행 시간을 메트릭과 현재 요청의 통계에 더하고, 느린 SQL 을 로그로 남긴다.
+
+    echo=True 와 달리 모든 SQL 을 동기적으로 출력하지 않고, `slow_query_ms`
+    이상 걸린 SQL 만 남긴다. (0 이면 모든 SQL)
+    """
+    threshold = None if slow_query_ms is None else slow_query_ms / 1000
+    if threshold is not None and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _error(context):
+        # 실패한 SQL 은 after_cursor_execute 가 불리지 않는다.
+        conn = context.connection
+        if conn is not None and conn.info.get("query_started"):
+            conn.info["query_started"].pop()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        DB_STATEMENT_SECONDS.observe(elapsed, engine=name)
+
+        stats = CURRENT_REQUEST.get()
+        if stats is not None:
+            stats.sql_statements += 1
+            stats.sql_seconds += elapsed
+
+        if threshold is not None and elapsed >= threshold:
+            DB_SLOW_QUERIES.inc(engine=name)
+            route = stats.route if stats is not None else "-"
+            logger.info(
+                "slow query %.1fms engine=%s route=%s: %s",
+                elapsed * 1000,
+                name,
+                route,
+                " ".join(statement.split()),
+            )
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.sqlite3.counter import COUNTER_SCHEMA, REPAIR_STATEMENTS
+from src.sqlite3.fts import FTS_SCHEMA
+from src.sqlite3.revision import REVISION_SCHEMA
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+# 버전은 SQLite 의 `PRAGMA user_version` 에 기록됩니다.
+# 새 마이그레이션은 항상 목록 끝에, 이전 버전 + 1 로 추가하세요.
+# 버전이 최신이면 init_db 가 DDL(create_all 포함)을 건너뛰므로, 새 테이블도 여기에 추가합니다.
+MIGRATIONS: list[Migration] = [
+    Migration(
+        version=1,
+        description="composite indexes for filter + keyset queries",
+        statements=(
+            "CREATE INDEX IF NOT EXISTS ix_post_author_id_id"
+            " ON post (author_id, id)",
+            "CREATE INDEX IF NOT EXISTS ix_comment_post_id_id"
+            " ON comment (post_id, id)",
+            "CREATE INDEX IF NOT EXISTS ix_comment_author_id_id"
+            " ON comment (author_id, id)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_user_nickname"
+            " ON user (nickname)",
+        ),
+    ),
+    Migration(
+        version=2,
+        description="FTS5 full-text index over posts and comments",
+        statements=FTS_SCHEMA
+        + (
+            "INSERT INTO post_fts(post_fts) VALUES ('rebuild')",
+            "INSERT INTO comment_fts(comment_fts) VALUES ('rebuild')",
+        ),
+    ),
+    Migration(
+        version=3,
+        description="revision counters for conditional GET, comment.updated_at",
+        statements=(
+            "ALTER TABLE post ADD COLUMN revision INTEGER NOT NULL DEFAULT 1",
+            "ALTER TABLE post"
+            " ADD COLUMN comments_revision INTEGER NOT NULL DEFAULT 0",
+            "ALTER TABLE comment ADD COLUMN updated_at DATETIME",
+        )
+        + REVISION_SCHEMA,
+    ),
+    Migration(
+        version=4,
+        description="soft delete for posts",
+        statements=(
+            "ALTER TABLE post ADD COLUMN deleted_at DATETIME",
+            "CREATE INDEX IF NOT EXISTS ix_post_deleted_at_id"
+            " ON post (deleted_at, id)",
+        ),
+    ),
+    Migration(
+        version=5,
+        description="comment count per post, post/comment counts per user",
+        statements=(
+            "ALTER TABLE post"
+            " ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0",
+            "CREATE TABLE IF NOT EXISTS user_stats ("
+            "user_id VARCHAR NOT NULL,"
+            " post_count INTEGER DEFAULT 0 NOT NULL,"
+            " comment_count INTEGER DEFAULT 0 NOT NULL,"
+            " PRIMARY KEY (user_id))",
+        )
+        + COUNTER_SCHEMA
+        # 이미 있는 글/댓글로 채운다.
+        + tuple(REPAIR_STATEMENTS.values()),
+    ),
+    Migration(
+        version=6,
+        description="write-behind view counts for posts",
+        statements=(
+            "CREATE TABLE IF NOT EXISTS post_view ("
+            "post_id VARCHAR NOT NULL,"
+            " views INTEGER DEFAULT 0 NOT NULL,"
+            " PRIMARY KEY (post_id),"
+            " FOREIGN KEY(post_id) REFERENCES post (id))",
+        ),
+    ),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+async def get_version(conn: AsyncConnection) -> int:
+    return (await conn.exec_driver_sql("PRAGMA user_version")).scalar()
+
+
+async def set_version(conn: AsyncConnection, version: int) -> None:
+    # PRAGMA 는 바인드 파라미터를 받지 않는다.
+    await conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
+
+async def migrate(conn: AsyncConnection) -> list[Migration]:
+    """아직 적용되지 않은 마이그레이션을 순서대로 적용하고, 적용한 목록을 돌려준다.
+
+    호출하는 쪽의 트랜잭션 안에서 실행되므로, 중간에 실패하면 함께 롤백된다.
+    """
+    current = await get_version(conn)
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+        for statement in migration.statements:
+            await conn.exec_driver_sql(statement)
+        await set_version(conn, migration.version)
+        applied.append(migration)
+    return applied
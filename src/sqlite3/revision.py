@@ -0,0 +1,25 @@
+# 조건부 GET(ETag) 용 revision 카운터.
+# 게시글을 고치면 post.revision 을, 댓글이 달리거나 바뀌거나 지워지면 그 글의
+# post.comments_revision 을 올린다. 트리거라서 어떤 경로(그룹 커밋 writer,
+# 대량 가져오기 등)로 쓰든 같은 트랜잭션 안에서 함께 올라간다.
+REVISION_SCHEMA: tuple[str, ...] = (
+    "CREATE TRIGGER IF NOT EXISTS post_revision_au"
+    " AFTER UPDATE OF title, content ON post BEGIN"
+    " UPDATE post SET revision = revision + 1 WHERE rowid = new.rowid;"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS comment_revision_ai"
+    " AFTER INSERT ON comment BEGIN"
+    " UPDATE post SET comments_revision = comments_revision + 1"
+    " WHERE id = new.post_id;"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS comment_revision_au"
+    " AFTER UPDATE OF content ON comment BEGIN"
+    " UPDATE post SET comments_revision = comments_revision + 1"
+    " WHERE id = new.post_id;"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS comment_revision_ad"
+    " AFTER DELETE ON comment BEGIN"
+    " UPDATE post SET comments_revision = comments_revision + 1"
+    " WHERE id = old.post_id;"
+    " END",
+)
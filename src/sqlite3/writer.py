@@ -0,0 +1,167 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.metrics.request import CURRENT_REQUEST
+from src.sqlite3.connection import config, get_engine
+
+T = TypeVar("T")
+M = TypeVar("M", bound=SQLModel)
+
+WriteOp = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class WriteQueue:
+    """단일 writer 가 쓰기 작업을 모아 한 트랜잭션으로 커밋하는 큐 (그룹 커밋).
+
+    SQLite 는 writer 가 하나뿐이라 요청마다 커밋(fsync)하면 쓰기 처리량이
+    커밋 횟수에 묶인다. `window_ms` 동안, 혹은 `max_batch` 개가 찰 때까지
+    들어온 작업을 하나의 트랜잭션에서 실행하고 한 번만 커밋한다.
+
+    배치 중 하나라도 실패하면 배치 전체를 롤백한 뒤 작업을 하나씩 다시
+    실행해, 각 호출자가 자기 결과와 자기 에러만 받도록 한다.
+    """
+
+    def __init__(
+        self, engine: AsyncEngine | None, window_ms: float, max_batch: int
+    ) -> None:
+        self._engine = engine
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[tuple[WriteOp, asyncio.Future]] | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        # None 이면 앱의 쓰기 엔진을 처음 쓸 때 만든다.
+        return self._engine or get_engine()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """큐에 남은 작업을 모두 커밋한 뒤 writer 를 멈춘다."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def submit(self, op: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        if self._task is None:
+            # writer 가 없으면(비활성화, lifespan 밖) 단건 트랜잭션으로 실행한다.
+            return await self._run_one(op)
+
+        stats = CURRENT_REQUEST.get()
+        if stats is not None:
+            stats.deferred_writes += 1
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, future))
+        return await future
+
+    async def add(self, obj: M) -> M:
+        """객체 하나를 INSERT 하고, 커밋된 객체를 그대로 돌려준다.
+
+        id 와 created_at 은 애플리케이션에서 채우므로 refresh 가 필요 없다.
+        """
+
+        async def op(session: AsyncSession) -> M:
+            session.add(obj)
+            return obj
+
+        return await self.submit(op)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                try:
+                    if timeout > 0:
+                        item = await asyncio.wait_for(
+                            self._queue.get(), timeout
+                        )
+                    else:
+                        item = self._queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._commit(batch)
+
+        # stop() 이후 남은 작업까지 비운다.
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                await self._commit([item])
+
+    async def _commit(
+        self, batch: list[tuple[WriteOp, asyncio.Future]]
+    ) -> None:
+        try:
+            async with AsyncSession(
+                self.engine, expire_on_commit=False
+            ) as session:
+                results = [await op(session) for op, _ in batch]
+                await session.commit()
+        except Exception as exc:
+            if len(batch) == 1:
+                _set_exception(batch[0][1], exc)
+                return
+            for op, future in batch:
+                try:
+                    result = await self._run_one(op)
+                except Exception as exc:
+                    _set_exception(future, exc)
+                else:
+                    _set_result(future, result)
+            return
+
+        for (_, future), result in zip(batch, results):
+            _set_result(future, result)
+
+    async def _run_one(self, op: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        async with AsyncSession(self.engine, expire_on_commit=False) as session:
+            result = await op(session)
+            await session.commit()
+            return result
+
+
+def _set_result(future: asyncio.Future, result: Any) -> None:
+    # 호출자가 이미 취소됐을 수 있다. (ex. 클라이언트 연결 종료)
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exc: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exc)
+
+
+WRITER = WriteQueue(
+    None,
+    window_ms=config.group_commit_window_ms,
+    max_batch=config.group_commit_max_batch,
+)
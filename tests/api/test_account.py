@@ -0,0 +1,54 @@
+import hashlib
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.user import User
+from src.sqlite3.connection import get_engine
+from src.sqlite3.writer import WRITER
+
+
+@pytest.mark.asyncio
+async def test_create_user_and_login(client: AsyncClient):
+    payload = {
+        "username": "signup_user",
+        "nickname": "signup",
+        "password": "Password1",
+    }
+    response = await client.post("/api/auth", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    user_id = response.json()["id"]
+
+    login = await client.post(
+        "/api/auth/login",
+        json={"username": "signup_user", "password": "Password1"},
+    )
+    assert login.status_code == status.HTTP_200_OK
+    assert login.json()["id"] == user_id
+
+    wrong = await client.post(
+        "/api/auth/login",
+        json={"username": "signup_user", "password": "Password2"},
+    )
+    assert wrong.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_legacy_password(client: AsyncClient):
+    legacy = hashlib.sha512(b"Password1").hexdigest()
+    user = await WRITER.add(
+        User(username="legacy_user", nickname="legacy", password=legacy)
+    )
+
+    response = await client.post(
+        "/api/auth/login",
+        json={"username": "legacy_user", "password": "Password1"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    async with AsyncSession(get_engine()) as session:
+        stored = await session.get(User, user.id)
+    assert stored.password != legacy
+    assert stored.password.startswith("scrypt$")
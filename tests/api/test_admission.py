@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api.admission import AdmissionGate, AdmissionMiddleware
+
+
+@pytest.mark.asyncio
+async def test_gate_queues_then_rejects():
+    gate = AdmissionGate("write", limit=1, queue_size=1, timeout=1.0)
+    assert await gate.acquire()
+
+    waiting = asyncio.create_task(gate.acquire())
+    await asyncio.sleep(0)
+    assert gate.queued == 1
+
+    # 대기열이 가득 차면 기다리지 않고 바로 거절한다.
+    assert not await gate.acquire()
+    assert gate.rejected["queue_full"] == 1
+
+    # 자리는 기다리던 요청에 그대로 넘어간다.
+    gate.release()
+    assert await waiting
+    assert (gate.active, gate.queued) == (1, 0)
+    gate.release()
+    assert gate.active == 0
+
+
+@pytest.mark.asyncio
+async def test_gate_rejects_after_deadline():
+    gate = AdmissionGate("write", limit=1, queue_size=10, timeout=0.01)
+    assert await gate.acquire()
+
+    assert not await gate.acquire()
+    assert gate.rejected["deadline"] == 1
+    assert gate.queued == 0
+
+    gate.release()
+    assert await gate.acquire()
+
+
+@pytest.mark.asyncio
+async def test_middleware_sheds_writes_but_not_reads_or_health():
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.post("/api/slow")
+    async def slow() -> dict:
+        await release.wait()
+        return {}
+
+    @app.get("/api/health")
+    async def health() -> dict:
+        return {}
+
+    app.add_middleware(
+        AdmissionMiddleware,
+        read=AdmissionGate("read", limit=1, queue_size=0, timeout=1.0),
+        write=AdmissionGate("write", limit=1, queue_size=0, timeout=1.0),
+        retry_after=2,
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        running = asyncio.create_task(client.post("/api/slow"))
+        await asyncio.sleep(0.05)
+
+        rejected = await client.post("/api/slow")
+        assert rejected.status_code == 503
+        assert rejected.headers["Retry-After"] == "2"
+        assert (await client.get("/api/health")).status_code == 200
+
+        release.set()
+        assert (await running).status_code == 200
+        assert (await client.post("/api/slow")).status_code == 200
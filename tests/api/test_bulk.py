@@ -0,0 +1,108 @@
+import hashlib
+import json
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from ulid import ULID
+
+
+def ndjson(*rows) -> bytes:
+    return "\n".join(
+        row if isinstance(row, str) else json.dumps(row) for row in rows
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_import_posts_reports_invalid_rows(client: AsyncClient):
+    body = ndjson(
+        {"author_id": "bulk", "title": "first", "content": "body"},
+        "{not json",
+        {"author_id": "bulk", "title": 1, "content": "body"},
+        "",
+        {"author_id": "bulk", "title": "second", "content": "body"},
+    )
+
+    response = await client.post("/api/import/posts", content=body)
+    report = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert report["inserted"] == 2
+    assert report["failed"] == 2
+    assert [error["line"] for error in report["errors"]] == [2, 3]
+    assert report["errors"][1]["error"].startswith("title:")
+
+
+@pytest.mark.asyncio
+async def test_import_falls_back_to_rows_when_batch_fails(
+    client: AsyncClient,
+):
+    duplicated = str(ULID())
+    body = ndjson(
+        {"id": duplicated, "author_id": "bulk", "title": "a", "content": "x"},
+        {"author_id": "bulk", "title": "b", "content": "x"},
+        {"id": duplicated, "author_id": "bulk", "title": "c", "content": "x"},
+    )
+
+    response = await client.post("/api/import/posts", content=body)
+    report = response.json()
+
+    assert report["inserted"] == 2
+    assert report["failed"] == 1
+    assert report["errors"][0]["line"] == 3
+    assert "UNIQUE" in report["errors"][0]["error"]
+
+    post = await client.get(f"/api/posts/{duplicated}")
+    assert post.json()["title"] == "a"
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_internal_columns(client: AsyncClient):
+    body = ndjson(
+        {"author_id": "bulk", "title": "a", "content": "x", "revision": 9},
+        {"author_id": "bulk", "title": "b", "content": "x", "comment_count": 9},
+        {
+            "author_id": "bulk",
+            "title": "c",
+            "content": "x",
+            "deleted_at": "2024-01-01T00:00:00",
+        },
+        {"author_id": "bulk", "title": "d", "content": "x"},
+    )
+
+    response = await client.post("/api/import/posts", content=body)
+    report = response.json()
+
+    assert report["inserted"] == 1
+    assert [error["error"].split(":")[0] for error in report["errors"]] == [
+        "revision",
+        "comment_count",
+        "deleted_at",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_users_requires_hashed_password(client: AsyncClient):
+    legacy = hashlib.sha512(b"Password1").hexdigest()
+    body = ndjson(
+        {"username": "bulk_hashed", "nickname": "bh", "password": legacy},
+        {"username": "bulk_plain", "nickname": "bp", "password": "Password1"},
+    )
+
+    response = await client.post("/api/import/users", content=body)
+    report = response.json()
+
+    assert report["inserted"] == 1
+    assert report["errors"][0]["line"] == 2
+
+    login = await client.post(
+        "/api/auth/login",
+        json={"username": "bulk_hashed", "password": "Password1"},
+    )
+    assert login.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unknown_target(client: AsyncClient):
+    response = await client.post("/api/import/votes", content=b"")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
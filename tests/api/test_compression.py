@@ -0,0 +1,160 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI, Header
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from starlette.responses import Response
+
+from src.api.compression import (
+    ENCODERS,
+    CompressionMiddleware,
+    GzipEncoder,
+    negotiate,
+)
+
+BIG = [{"id": i, "content": "게시글 본문 " * 20} for i in range(50)]
+
+
+def test_negotiate_uses_q_values_then_server_preference():
+    preferred = ("zstd", "br", "gzip")
+    assert negotiate("gzip, br", preferred) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", preferred) == "gzip"
+    assert negotiate("br;q=0, *", preferred) == "zstd"
+    assert negotiate("identity", preferred) is None
+    assert negotiate("", preferred) is None
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/big")
+    async def big(if_none_match: str | None = Header(None)) -> Response:
+        if if_none_match is not None:
+            return Response(status_code=304, headers={"ETag": '"big-1"'})
+        return Response(
+            content=str(BIG),
+            media_type="application/json",
+            headers={"ETag": '"big-1"'},
+        )
+
+    @app.get("/small")
+    async def small() -> dict:
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def lines():
+            for item in BIG:
+                yield f"{item}\n".encode()
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    app.add_middleware(
+        CompressionMiddleware,
+        encoders={"gzip": lambda: GzipEncoder(5)},
+        minimum_size=500,
+    )
+    return app
+
+
+@pytest.mark.asyncio
+async def test_compresses_large_responses_only():
+    async with AsyncClient(
+        transport=ASGITransport(app=make_app()), base_url="http://test"
+    ) as client:
+        headers = {"Accept-Encoding": "gzip"}
+        big = await client.get("/big", headers=headers)
+        assert big.headers["Content-Encoding"] == "gzip"
+        assert big.headers["ETag"] == 'W/"big-1"'
+        assert big.headers["Vary"] == "Accept-Encoding"
+        assert int(big.headers["Content-Length"]) < len(big.content) / 5
+        assert big.text == str(BIG)
+
+        small = await client.get("/small", headers=headers)
+        assert "Content-Encoding" not in small.headers
+        assert small.json() == {"ok": True}
+
+        plain = await client.get("/big", headers={"Accept-Encoding": ""})
+        assert "Content-Encoding" not in plain.headers
+        assert plain.headers["ETag"] == '"big-1"'
+
+
+@pytest.mark.asyncio
+async def test_not_modified_matches_compressed_representation():
+    async with AsyncClient(
+        transport=ASGITransport(app=make_app()), base_url="http://test"
+    ) as client:
+        cached = await client.get(
+            "/big",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": 'W/"big-1"'},
+        )
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == 'W/"big-1"'
+        assert cached.headers["Vary"] == "Accept-Encoding"
+
+        plain = await client.get(
+            "/big",
+            headers={"Accept-Encoding": "", "If-None-Match": '"big-1"'},
+        )
+        assert plain.status_code == 304
+        assert plain.headers["ETag"] == '"big-1"'
+        assert "Vary" not in plain.headers
+
+
+@pytest.mark.asyncio
+async def test_streams_each_chunk_compressed():
+    # httpx 는 본문을 모아 돌려주므로, ASGI 메시지를 직접 받아 조각을 본다.
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # 연결 끊김을 기다리는 쪽은 응답이 끝나면 취소된다.
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    await make_app()(scope, receive, send)
+
+    start, *bodies = messages
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    chunks = [m["body"] for m in bodies]
+    assert len(chunks) > len(BIG) / 2
+
+    # 각 조각은 받는 즉시 풀 수 있다. (SYNC_FLUSH)
+    decoder = zlib.decompressobj(31)
+    assert decoder.decompress(chunks[0]) == f"{BIG[0]}\n".encode()
+    assert gzip.decompress(b"".join(chunks)).decode().count("\n") == len(BIG)
+
+
+@pytest.mark.parametrize("encoding", ["br", "zstd"])
+def test_optional_encoders_round_trip(encoding: str):
+    if encoding not in ENCODERS:
+        pytest.skip(f"{encoding} encoder is not installed")
+    encoder = ENCODERS[encoding](3)
+    data = str(BIG).encode()
+    compressed = encoder.compress(data[:1000]) + encoder.finish(data[1000:])
+
+    if encoding == "br":
+        import brotli
+
+        assert brotli.decompress(compressed) == data
+    else:
+        import zstandard
+
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        assert decompressor.decompress(compressed) == data
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.api.etag import etag_matches
+
+
+def test_etag_matches_uses_weak_comparison():
+    assert etag_matches('"post-2"', '"post-2"')
+    assert etag_matches('"post-1", W/"post-2"', '"post-2"')
+    assert etag_matches("*", '"post-2"')
+    assert not etag_matches('"post-1"', '"post-2"')
+    assert not etag_matches(None, '"post-2"')
+
+
+async def create_post(client: AsyncClient) -> str:
+    response = await client.post(
+        "/api/posts",
+        json={"title": "Polled", "content": "often"},
+        headers={"Author": "poller"},
+    )
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_get_post_answers_if_none_match(client: AsyncClient):
+    post_id = await create_post(client)
+
+    first = await client.get(f"/api/posts/{post_id}")
+    etag = first.headers["ETag"]
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["content-type"] == "application/json"
+    assert first.json()["title"] == "Polled"
+
+    cached = await client.get(
+        f"/api/posts/{post_id}", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    await client.put(
+        f"/api/posts/{post_id}",
+        json={"title": "Edited", "content": "often"},
+        headers={"Author": "poller"},
+    )
+    changed = await client.get(
+        f"/api/posts/{post_id}", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["title"] == "Edited"
+
+
+@pytest.mark.asyncio
+async def test_comment_page_etag_changes_with_new_comment(client: AsyncClient):
+    post_id = await create_post(client)
+    url = f"/api/posts/{post_id}/comments"
+
+    empty = await client.get(url)
+    etag = empty.headers["ETag"]
+    assert (
+        await client.get(url, headers={"If-None-Match": etag})
+    ).status_code == status.HTTP_304_NOT_MODIFIED
+
+    await client.post(
+        "/api/comments",
+        json={"post_id": post_id, "content": "new"},
+        headers={"Author": "commenter"},
+    )
+    changed = await client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == status.HTTP_200_OK
+    assert [c["content"] for c in changed.json()["items"]] == ["new"]
+    new_etag = changed.headers["ETag"]
+    assert new_etag != etag
+
+    # 대량 가져오기로 달린 댓글도 같은 트랜잭션에서 revision 을 올린다.
+    row = {"author_id": "bulk", "post_id": post_id, "content": "imported"}
+    await client.post("/api/import/comments", content=json.dumps(row))
+    imported = await client.get(url, headers={"If-None-Match": new_etag})
+    assert imported.status_code == status.HTTP_200_OK
+    assert len(imported.json()["items"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_post_has_no_etag(client: AsyncClient):
+    missing = await client.get("/api/posts/missing")
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+    comments = await client.get("/api/posts/missing/comments")
+    assert comments.status_code == status.HTTP_200_OK
+    assert "ETag" not in comments.headers
+    assert comments.json()["items"] == []
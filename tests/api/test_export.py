@@ -0,0 +1,78 @@
+import json
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.domain.post import Post, PostResponse
+from src.service.export import stream_ndjson
+
+
+async def export(client: AsyncClient, path: str, **params) -> list[dict]:
+    response = await client.get(path, params=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_export_posts_streams_every_row_in_id_order(
+    client: AsyncClient,
+):
+    created = []
+    for i in range(5):
+        response = await client.post(
+            "/api/posts",
+            json={"title": f"export {i}", "content": "body"},
+            headers={"Author": "exporter"},
+        )
+        created.append(response.json()["id"])
+
+    rows = await export(client, "/api/export/posts")
+    ids = [row["id"] for row in rows]
+
+    assert ids == sorted(ids)
+    assert set(created) <= set(ids)
+
+
+@pytest.mark.asyncio
+async def test_export_posts_since_is_incremental(client: AsyncClient):
+    for i in range(2):
+        await client.post(
+            "/api/posts",
+            json={"title": f"since {i}", "content": "body"},
+            headers={"Author": "exporter"},
+        )
+    rows = await export(client, "/api/export/posts")
+    since = rows[-2]["id"]
+
+    newer = await export(client, "/api/export/posts", since=since)
+
+    assert [row["id"] for row in newer] == [rows[-1]["id"]]
+
+
+@pytest.mark.asyncio
+async def test_export_comments_rejects_invalid_since(client: AsyncClient):
+    response = await client.get(
+        "/api/export/comments", params={"since": "not-a-ulid"}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_stream_ndjson_yields_one_chunk_per_partition(
+    client: AsyncClient,
+):
+    rows = await export(client, "/api/export/posts")
+
+    chunks = [
+        chunk
+        async for chunk in stream_ndjson(
+            Post, Post.id, PostResponse, chunk_size=2
+        )
+    ]
+
+    assert len(chunks) == (len(rows) + 1) // 2
+    assert b"".join(chunks).decode().splitlines() == [
+        PostResponse.model_validate(row).model_dump_json() for row in rows
+    ]
@@ -0,0 +1,99 @@
+import logging
+import re
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.sqlite3.instrument import install_metrics
+
+
+def sample(body: str, name: str, **labels: str) -> float:
+    """`labels` 를 모두 가진 첫 샘플의 값을 돌려준다."""
+    for line in body.splitlines():
+        series, _, value = line.rpartition(" ")
+        if series.partition("{")[0] != name:
+            continue
+        if all(f'{key}="{label}"' in series for key, label in labels.items()):
+            return float(value)
+    raise AssertionError(f"{name} {labels} not found")
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_route_latency_and_sql(client: AsyncClient):
+    created = await client.post(
+        "/api/posts",
+        json={"title": "metrics", "content": "body"},
+        headers={"Author": "metrics"},
+    )
+    response = await client.get(f"/api/posts/{created.json()['id']}")
+    assert response.status_code == status.HTTP_200_OK
+
+    metrics = await client.get("/api/metrics")
+    body = metrics.text
+
+    assert metrics.status_code == status.HTTP_200_OK
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert (
+        sample(
+            body,
+            "http_request_duration_seconds_count",
+            method="GET",
+            status="200",
+        )
+        >= 1
+    )
+    # 라우트 템플릿 라벨은 FastAPI 버전에 따라 prefix(/api) 포함 여부가 다르다.
+    route = re.search(r'route="((/api)?/posts/\{post_id\})"', body).group(1)
+    assert (
+        sample(
+            body, "http_request_sql_statements_sum", method="GET", route=route
+        )
+        >= 1
+    )
+    assert (
+        sample(body, "db_statement_duration_seconds_count", engine="read") >= 1
+    )
+    assert sample(body, "db_pool_checkout_duration_seconds_count") >= 1
+    # 글 작성의 SQL 은 writer 태스크에서 돌므로 요청별 SQL 통계에 0 으로 남기지 않는다.
+    assert not re.search(
+        r"http_request_sql_statements_count"
+        r'\{method="POST",route="(/api)?/posts"',
+        body,
+    )
+    assert "cache_events_total" in body
+    assert "password_hash_pending" in body
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log(caplog: pytest.LogCaptureFixture):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    install_metrics(engine, "test", slow_query_ms=0)
+
+    with caplog.at_level(logging.INFO, logger="src.sqlite3.slow_query"):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    await engine.dispose()
+
+    assert any(
+        "engine=test" in record.message and "SELECT 1" in record.message
+        for record in caplog.records
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_statement_does_not_leak_timer():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    install_metrics(engine, "test", slow_query_ms=None)
+
+    async with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            await conn.execute(text("SELECT * FROM missing"))
+        assert conn.info["query_started"] == []
+        await conn.execute(text("SELECT 1"))
+        assert conn.info["query_started"] == []
+    await engine.dispose()
@@ -2,6 +2,9 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from src.service.purge import PURGER
+from src.sqlite3.connection import get_read_engine
+
 
 @pytest.mark.parametrize(
     "author, payload",
@@ -25,12 +28,12 @@ from httpx import AsyncClient
 @pytest.mark.asyncio
 async def test_create_post(client: AsyncClient, author: str, payload: dict):
     response = await client.post(
-        "/api/posts", json=payload, headers={"X-Author": author}
+        "/api/posts", json=payload, headers={"Author": author}
     )
     data = response.json()
 
     assert response.status_code == status.HTTP_201_CREATED
-    assert data["author"] == author
+    assert data["author_id"] == author
     assert data["title"] == payload["title"]
     assert data["content"] == payload["content"]
     assert "id" in data
@@ -43,8 +46,8 @@ async def test_get_post_list_persists(client: AsyncClient):
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
 
-    assert isinstance(data, list)
-    assert len(data) >= 2
+    assert isinstance(data["items"], list)
+    assert len(data["items"]) >= 2
 
 
 @pytest.mark.asyncio
@@ -55,7 +58,7 @@ async def test_get_post_by_id_persists(client: AsyncClient):
         "content": "This is the third test post.",
     }
     create_response = await client.post(
-        "/api/posts", json=payload, headers={"X-Author": author}
+        "/api/posts", json=payload, headers={"Author": author}
     )
     post_id = create_response.json()["id"]
 
@@ -64,7 +67,7 @@ async def test_get_post_by_id_persists(client: AsyncClient):
     assert response.status_code == status.HTTP_200_OK
 
     assert data["id"] == post_id
-    assert data["author"] == author
+    assert data["author_id"] == author
     assert data["title"] == payload["title"]
     assert data["content"] == payload["content"]
 
@@ -75,7 +78,9 @@ async def test_get_post_not_found(client: AsyncClient):
     response = await client.get(f"/api/posts/{invalid_id}")
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json()["detail"] == "Post not found"
+    assert (
+        response.json()["detail"] == f"Post with id '{invalid_id}' not found."
+    )
 
 
 @pytest.mark.asyncio
@@ -86,7 +91,7 @@ async def test_update_post_success(client: AsyncClient):
         "content": "This is the first test post.",
     }
     create_response = await client.post(
-        "/api/posts", json=post_data, headers={"X-Author": author}
+        "/api/posts", json=post_data, headers={"Author": author}
     )
     post_id = create_response.json()["id"]
 
@@ -94,14 +99,14 @@ async def test_update_post_success(client: AsyncClient):
     response = await client.put(
         f"/api/posts/{post_id}",
         json=updated_data,
-        headers={"X-Author": author},
+        headers={"Author": author},
     )
     data = response.json()
 
     assert response.status_code == status.HTTP_200_OK
     assert data["title"] == updated_data["title"]
     assert data["content"] == updated_data["content"]
-    assert data["author"] == author
+    assert data["author_id"] == author
 
 
 @pytest.mark.asyncio
@@ -110,13 +115,284 @@ async def test_delete_post_success(client: AsyncClient):
     create_response = await client.post(
         "/api/posts",
         json={"title": "Post to delete", "content": "soon gone"},
-        headers={"X-Author": author},
+        headers={"Author": author},
     )
     post_id = create_response.json()["id"]
 
     response = await client.delete(
         f"/api/posts/{post_id}",
-        headers={"X-Author": author},
+        headers={"Author": author},
     )
     assert response.status_code == status.HTTP_200_OK
     assert "deleted successfully" in response.json()["message"]
+
+
+@pytest.mark.asyncio
+async def test_delete_post_hides_comments_until_purged(client: AsyncClient):
+    headers = {"Author": "purge-author"}
+    post_id = (
+        await client.post(
+            "/api/posts", json={"title": "t", "content": "c"}, headers=headers
+        )
+    ).json()["id"]
+    for i in range(3):
+        await client.post(
+            "/api/comments",
+            json={"post_id": post_id, "content": f"c{i}"},
+            headers=headers,
+        )
+
+    response = await client.delete(f"/api/posts/{post_id}", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert (await client.get(f"/api/posts/{post_id}")).status_code == 404
+    comments = await client.get(f"/api/posts/{post_id}/comments")
+    assert comments.json()["items"] == []
+    again = await client.delete(f"/api/posts/{post_id}", headers=headers)
+    assert again.status_code == status.HTTP_404_NOT_FOUND
+
+    await PURGER.run_once()
+    async with get_read_engine().connect() as conn:
+        rows = await conn.exec_driver_sql(
+            "SELECT (SELECT count(*) FROM post WHERE id = ?),"
+            " (SELECT count(*) FROM comment WHERE post_id = ?)",
+            (post_id, post_id),
+        )
+        assert rows.one() == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_create_comment_on_deleted_post_not_found(client: AsyncClient):
+    headers = {"Author": "purge-author"}
+    post_id = (
+        await client.post(
+            "/api/posts", json={"title": "t", "content": "c"}, headers=headers
+        )
+    ).json()["id"]
+    await client.delete(f"/api/posts/{post_id}", headers=headers)
+
+    response = await client.post(
+        "/api/comments",
+        json={"post_id": post_id, "content": "late"},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    await PURGER.run_once()
+    async with get_read_engine().connect() as conn:
+        rows = await conn.exec_driver_sql(
+            "SELECT count(*) FROM comment WHERE post_id = ?", (post_id,)
+        )
+        assert rows.scalar_one() == 0
+
+
+@pytest.mark.asyncio
+async def test_get_post_list_cursor_pagination(client: AsyncClient):
+    for i in range(5):
+        await client.post(
+            "/api/posts",
+            json={"title": f"Paged {i}", "content": "paging"},
+            headers={"Author": "pager"},
+        )
+
+    ids: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["after"] = cursor
+        response = await client.get("/api/posts", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+
+        assert len(data["items"]) <= 2
+        ids.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+        assert cursor == data["items"][-1]["id"]
+
+    assert len(ids) >= 5
+    assert ids == sorted(ids)
+    assert len(ids) == len(set(ids))
+
+
+@pytest.mark.asyncio
+async def test_get_post_list_invalid_cursor(client: AsyncClient):
+    response = await client.get("/api/posts", params={"after": "not-a-ulid"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_get_comments_by_post_cursor_pagination(client: AsyncClient):
+    create_response = await client.post(
+        "/api/posts",
+        json={"title": "Commented", "content": "with comments"},
+        headers={"Author": "commenter"},
+    )
+    post_id = create_response.json()["id"]
+    for i in range(3):
+        await client.post(
+            "/api/comments",
+            json={"post_id": post_id, "content": f"comment {i}"},
+            headers={"Author": "commenter"},
+        )
+
+    first = await client.get(
+        f"/api/posts/{post_id}/comments", params={"limit": 2}
+    )
+    first_page = first.json()
+    assert len(first_page["items"]) == 2
+
+    second = await client.get(
+        f"/api/posts/{post_id}/comments",
+        params={"limit": 2, "after": first_page["next_cursor"]},
+    )
+    second_page = second.json()
+    assert len(second_page["items"]) == 1
+    assert second_page["next_cursor"] is None
+
+    comments = first_page["items"] + second_page["items"]
+    assert {c["content"] for c in comments} == {
+        "comment 0",
+        "comment 1",
+        "comment 2",
+    }
+    assert [c["id"] for c in comments] == sorted(c["id"] for c in comments)
+
+
+@pytest.mark.asyncio
+async def test_update_post_invalidates_cached_post(client: AsyncClient):
+    author = "cache_author"
+    create_response = await client.post(
+        "/api/posts",
+        json={"title": "Cached", "content": "before"},
+        headers={"Author": author},
+    )
+    post_id = create_response.json()["id"]
+
+    first = await client.get(f"/api/posts/{post_id}")
+    assert first.json()["content"] == "before"
+
+    await client.put(
+        f"/api/posts/{post_id}",
+        json={"title": "Cached", "content": "after"},
+        headers={"Author": author},
+    )
+
+    second = await client.get(f"/api/posts/{post_id}")
+    assert second.json()["content"] == "after"
+
+
+@pytest.mark.asyncio
+async def test_create_comment_invalidates_cached_comment_page(
+    client: AsyncClient,
+):
+    create_response = await client.post(
+        "/api/posts",
+        json={"title": "Cached comments", "content": "page"},
+        headers={"Author": "cache_author"},
+    )
+    post_id = create_response.json()["id"]
+
+    empty = await client.get(f"/api/posts/{post_id}/comments")
+    assert empty.json()["items"] == []
+
+    await client.post(
+        "/api/comments",
+        json={"post_id": post_id, "content": "new reply"},
+        headers={"Author": "cache_author"},
+    )
+
+    page = await client.get(f"/api/posts/{post_id}/comments")
+    assert [c["content"] for c in page.json()["items"]] == ["new reply"]
+
+
+@pytest.mark.asyncio
+async def test_batch_get_posts_keeps_order_and_embeds_comments(
+    client: AsyncClient,
+):
+    headers = {"Author": "batch-author"}
+    ids = []
+    for i in range(3):
+        response = await client.post(
+            "/api/posts",
+            json={"title": f"t{i}", "content": f"c{i}"},
+            headers=headers,
+        )
+        ids.append(response.json()["id"])
+    comment_ids = []
+    for i in range(3):
+        response = await client.post(
+            "/api/comments",
+            json={"post_id": ids[0], "content": f"c{i}"},
+            headers=headers,
+        )
+        comment_ids.append(response.json()["id"])
+
+    missing = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+    response = await client.post(
+        "/api/posts:batchGet",
+        json={"ids": [ids[2], missing, ids[0], ids[2]], "comments": 2},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [ids[2], ids[0]]
+    assert data["missing"] == [missing]
+    assert data["items"][0]["comments"] == []
+    embedded = [c["id"] for c in data["items"][1]["comments"]]
+    assert embedded == comment_ids[:2]
+
+    plain = await client.post("/api/posts:batchGet", json={"ids": [ids[1]]})
+    assert plain.json()["items"][0]["comments"] is None
+
+    empty = await client.post("/api/posts:batchGet", json={"ids": []})
+    assert empty.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_counters_in_post_responses_and_user_stats(client: AsyncClient):
+    headers = {"Author": "counter-author"}
+    post = await client.post(
+        "/api/posts", json={"title": "t", "content": "c"}, headers=headers
+    )
+    post_id = post.json()["id"]
+    assert post.json()["comment_count"] == 0
+    first = await client.get(f"/api/posts/{post_id}")
+    assert first.json()["comment_count"] == 0
+
+    for i in range(2):
+        await client.post(
+            "/api/comments",
+            json={"post_id": post_id, "content": f"c{i}"},
+            headers=headers,
+        )
+
+    # 캐시된 글과 ETag 도 새 댓글 수를 따라간다.
+    second = await client.get(
+        f"/api/posts/{post_id}",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+    assert second.status_code == status.HTTP_200_OK
+    assert second.json()["comment_count"] == 2
+    comments = await client.get(
+        f"/api/posts/{post_id}/comments", params={"limit": 1}
+    )
+    assert comments.json()["total"] == 2
+    posts = await client.get("/api/auth/counter-author/posts")
+    assert posts.json()["total"] == 1
+
+    stats = await client.get("/api/auth/counter-author/stats")
+    assert stats.json() == {
+        "user_id": "counter-author",
+        "post_count": 1,
+        "comment_count": 2,
+    }
+    await client.delete(f"/api/posts/{post_id}", headers=headers)
+    stats = await client.get("/api/auth/counter-author/stats")
+    assert stats.json()["post_count"] == 0
+    unknown = await client.get("/api/auth/nobody/stats")
+    assert unknown.json() == {
+        "user_id": "nobody",
+        "post_count": 0,
+        "comment_count": 0,
+    }
@@ -0,0 +1,122 @@
+import json
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api.routing import FastJSONRoute
+from src.domain.page import Page
+from src.domain.post import PostResponse
+from src.domain.search import SearchHit
+from src.domain.user import User, UserResponse
+
+CREATED_AT = datetime(
+    2025, 3, 1, 9, 30, 15, 123456, tzinfo=ZoneInfo("Asia/Seoul")
+)
+
+POSTS = Page[PostResponse](
+    items=[
+        PostResponse(
+            id=f"01JNJ5Q0000000000000000{i:03d}",
+            author_id="kimcoding",
+            title=f'제목 "{i}" \\ <tag> 😀',
+            content="줄바꿈\n탭\t유니코드   끝",
+            created_at=CREATED_AT,
+        )
+        for i in range(3)
+    ],
+    next_cursor="01JNJ5Q0000000000000000002",
+)
+
+HIT = SearchHit(
+    id="01JNJ5Q0000000000000000000",
+    post_id="01JNJ5Q0000000000000000000",
+    author_id="kimcoding",
+    snippet="<mark>검색</mark>…",
+    created_at=CREATED_AT,
+    rank=-1.93e-06,
+)
+
+USER = User(
+    id="01JNJ5Q0000000000000000000",
+    username="kimcoding",
+    nickname="김코딩",
+    password="scrypt$secret",
+)
+
+
+def build_router(route_class: type) -> APIRouter:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/posts")
+    async def posts() -> Page[PostResponse]:
+        return POSTS
+
+    @router.get("/empty", response_model=Page[PostResponse])
+    async def empty():
+        return Page[PostResponse](items=[], next_cursor=None)
+
+    @router.get("/search", response_model=Page[SearchHit])
+    async def search():
+        return Page[SearchHit](items=[HIT], next_cursor=None)
+
+    # ORM 객체를 그대로 돌려주면 response_model 로 검증(필터링)되어야 한다.
+    @router.post("/users", response_model=UserResponse, status_code=201)
+    async def user():
+        return USER
+
+    @router.get("/users", response_model=list[UserResponse])
+    def users():
+        return [USER]
+
+    return router
+
+
+async def fetch(route_class: type, method: str, path: str):
+    app = FastAPI()
+    app.include_router(build_router(route_class))
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        return await client.request(method, path)
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("GET", "/posts"),
+        ("GET", "/empty"),
+        ("POST", "/users"),
+        ("GET", "/users"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_fast_route_matches_default_json(method: str, path: str):
+    expected = await fetch(APIRouter().route_class, method, path)
+    actual = await fetch(FastJSONRoute, method, path)
+
+    assert actual.status_code == expected.status_code
+    assert actual.headers["content-type"] == expected.headers["content-type"]
+    assert actual.content == expected.content
+    assert "password" not in actual.text
+
+
+@pytest.mark.asyncio
+async def test_fast_route_float_formatting_is_equivalent():
+    # pydantic-core 는 지수 표기를 "-1.93e-6" 처럼 줄여 쓰지만 값은 같다.
+    expected = await fetch(APIRouter().route_class, "GET", "/search")
+    actual = await fetch(FastJSONRoute, "GET", "/search")
+
+    assert json.loads(actual.content) == json.loads(expected.content)
+
+
+def test_fast_route_keeps_default_handling_for_response_options():
+    router = APIRouter(route_class=FastJSONRoute)
+
+    @router.get("/posts", response_model_exclude_none=True)
+    async def posts() -> Page[PostResponse]:
+        return POSTS
+
+    assert router.routes[0]._adapter is None
@@ -0,0 +1,127 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+
+async def create_post(client: AsyncClient, title: str, content: str) -> str:
+    response = await client.post(
+        "/api/posts",
+        json={"title": title, "content": content},
+        headers={"Author": "searcher"},
+    )
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_search_posts_ranks_and_highlights(client: AsyncClient):
+    body_id = await create_post(
+        client, "Unrelated", "a note about zebrafish habitats"
+    )
+    title_id = await create_post(client, "Zebrafish care", "tank basics")
+
+    response = await client.get("/api/posts/search", params={"q": "zebrafish"})
+    assert response.status_code == status.HTTP_200_OK
+    hits = response.json()["items"]
+
+    # 제목 매칭의 가중치가 더 높다.
+    assert [hit["id"] for hit in hits] == [title_id, body_id]
+    assert hits[0]["title"] == "<mark>Zebrafish</mark> care"
+    assert "<mark>zebrafish</mark>" in hits[1]["snippet"]
+
+
+@pytest.mark.asyncio
+async def test_search_escapes_indexed_text(client: AsyncClient):
+    post_id = await create_post(
+        client,
+        '<script>x</script> "quoll" & co',
+        'a <b>quoll</b> said "hi" & left',
+    )
+
+    response = await client.get("/api/posts/search", params={"q": "quoll"})
+    (hit,) = response.json()["items"]
+
+    assert hit["id"] == post_id
+    assert hit["title"] == (
+        "&lt;script&gt;x&lt;/script&gt; &quot;<mark>quoll</mark>&quot; &amp; co"
+    )
+    assert hit["snippet"] == (
+        "a &lt;b&gt;<mark>quoll</mark>&lt;/b&gt; said &quot;hi&quot; &amp; left"
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_posts_cursor_pagination(client: AsyncClient):
+    created = {
+        await create_post(client, f"Okapi {i}", "okapi sighting")
+        for i in range(5)
+    }
+
+    seen = []
+    after = None
+    while True:
+        params = {"q": "okapi", "limit": 2}
+        if after is not None:
+            params["after"] = after
+        page = (await client.get("/api/posts/search", params=params)).json()
+        seen.extend(hit["id"] for hit in page["items"])
+        after = page["next_cursor"]
+        if after is None:
+            break
+
+    assert len(seen) == len(set(seen))
+    assert set(seen) == created
+
+
+@pytest.mark.asyncio
+async def test_search_follows_updates_and_deletes(client: AsyncClient):
+    post_id = await create_post(client, "Narwhal", "tusk facts")
+
+    await client.put(
+        f"/api/posts/{post_id}",
+        json={"title": "Beluga", "content": "melon facts"},
+        headers={"Author": "searcher"},
+    )
+    narwhal = await client.get("/api/posts/search", params={"q": "narwhal"})
+    beluga = await client.get("/api/posts/search", params={"q": "beluga"})
+    assert narwhal.json()["items"] == []
+    assert [hit["id"] for hit in beluga.json()["items"]] == [post_id]
+
+    await client.delete(f"/api/posts/{post_id}", headers={"Author": "searcher"})
+    beluga = await client.get("/api/posts/search", params={"q": "beluga"})
+    assert beluga.json()["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_search_comments(client: AsyncClient):
+    post_id = await create_post(client, "Host", "post for comments")
+    await client.post(
+        "/api/comments",
+        json={"post_id": post_id, "content": "the axolotl regrows limbs"},
+        headers={"Author": "searcher"},
+    )
+
+    response = await client.get(
+        "/api/posts/search", params={"q": "axolotl", "target": "comments"}
+    )
+    hits = response.json()["items"]
+    assert len(hits) == 1
+    assert hits[0]["post_id"] == post_id
+    assert hits[0]["title"] is None
+    assert "<mark>axolotl</mark>" in hits[0]["snippet"]
+
+
+@pytest.mark.asyncio
+async def test_search_tolerates_fts_syntax_in_query(client: AsyncClient):
+    response = await client.get(
+        "/api/posts/search", params={"q": 'unbalanced " AND ( NEAR'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("after", ["...:5", "-.:1", "1.2.3:4"])
+async def test_search_rejects_malformed_cursor(client: AsyncClient, after):
+    response = await client.get(
+        "/api/posts/search", params={"q": "okapi", "after": after}
+    )
+    assert response.status_code == 422
@@ -0,0 +1,104 @@
+import pytest
+
+from src.cache.memory import MemoryCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(**kwargs) -> MemoryCache:
+    options = {
+        "max_entries": 100,
+        "max_bytes": 10_000,
+        "ttl_seconds": 10,
+        "sizeof": lambda value: len(value),
+    }
+    options.update(kwargs)
+    return MemoryCache(**options)
+
+
+@pytest.mark.asyncio
+async def test_get_counts_hits_and_misses():
+    cache = make_cache()
+    assert await cache.get("a") is None
+    await cache.set("a", "value", "tag", 0)
+    assert await cache.get("a") == "value"
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_entry():
+    cache = make_cache(max_entries=2)
+    await cache.set("a", "1", "t", 0)
+    await cache.set("b", "2", "t", 0)
+    await cache.get("a")
+    await cache.set("c", "3", "t", 0)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "1"
+    assert await cache.get("c") == "3"
+    assert cache.stats().evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_evicts_when_over_memory_cap():
+    cache = make_cache(max_bytes=10)
+    await cache.set("a", "x" * 6, "t", 0)
+    await cache.set("b", "x" * 6, "t", 0)
+
+    assert await cache.get("a") is None
+    assert cache.stats().bytes == 6
+
+    await cache.set("huge", "x" * 11, "t", 0)
+    assert await cache.get("huge") is None
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = make_cache(ttl_seconds=5, clock=clock)
+    await cache.set("a", "1", "t", 0)
+
+    clock.now = 4.9
+    assert await cache.get("a") == "1"
+    clock.now = 5.0
+    assert await cache.get("a") is None
+    assert cache.stats().expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_removes_only_entries_of_tag():
+    cache = make_cache()
+    await cache.set("post:1", "p1", "post:1", 0)
+    await cache.set("comments:1:a", "c1", "comments:1", 0)
+    await cache.set("comments:1:b", "c2", "comments:1", 0)
+    await cache.set("comments:2:a", "c3", "comments:2", 0)
+
+    await cache.invalidate("comments:1")
+
+    assert await cache.get("comments:1:a") is None
+    assert await cache.get("comments:1:b") is None
+    assert await cache.get("comments:2:a") == "c3"
+    assert await cache.get("post:1") == "p1"
+    assert cache.stats().invalidations == 2
+
+
+@pytest.mark.asyncio
+async def test_set_ignores_value_loaded_before_invalidation():
+    cache = make_cache()
+    version = await cache.tag_version("post:1")
+    await cache.invalidate("post:1")
+    await cache.set("post:1", "stale", "post:1", version)
+
+    assert await cache.get("post:1") is None
+
+    version = await cache.tag_version("post:1")
+    await cache.set("post:1", "fresh", "post:1", version)
+    assert await cache.get("post:1") == "fresh"
@@ -1,15 +1,25 @@
+import os
+import tempfile
 from collections.abc import AsyncGenerator
 
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
-from src.main import app as fastapi_app
+# 테스트는 로컬 `echo_board.db` 를 건드리지 않도록 임시 디렉터리의 DB를 사용합니다.
+os.environ.setdefault("DATABASE_TYPE", "sqlite")
+os.environ.setdefault(
+    "DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "echo_board.db")
+)
+
+from src.main import app as fastapi_app  # noqa: E402
 
 
 @pytest_asyncio.fixture
 async def app() -> AsyncGenerator[FastAPI, None]:
-    yield fastapi_app
+    # ASGITransport 는 lifespan 을 실행하지 않으므로 직접 실행합니다.
+    async with fastapi_app.router.lifespan_context(fastapi_app):
+        yield fastapi_app
 
 
 @pytest_asyncio.fixture
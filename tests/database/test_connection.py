@@ -0,0 +1,64 @@
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+
+from src.sqlite3.connection import (
+    config,
+    get_engine,
+    get_read_engine,
+    init_db,
+)
+
+
+@pytest.mark.asyncio
+async def test_write_engine_applies_pragmas(app: FastAPI):
+    async with get_engine().connect() as conn:
+        journal_mode = (
+            await conn.execute(text("PRAGMA journal_mode"))
+        ).scalar()
+        busy_timeout = (
+            await conn.execute(text("PRAGMA busy_timeout"))
+        ).scalar()
+        cache_size = (await conn.execute(text("PRAGMA cache_size"))).scalar()
+
+    assert journal_mode.upper() == config.sqlite_journal_mode
+    assert busy_timeout == config.sqlite_busy_timeout_ms
+    assert cache_size == config.sqlite_cache_size
+
+
+@pytest.mark.asyncio
+async def test_read_engine_is_read_only(app: FastAPI):
+    assert get_read_engine() is not get_engine()
+
+    async with get_read_engine().connect() as conn:
+        busy_timeout = (
+            await conn.execute(text("PRAGMA busy_timeout"))
+        ).scalar()
+        assert busy_timeout == config.sqlite_busy_timeout_ms
+
+        with pytest.raises(OperationalError, match="readonly"):
+            await conn.execute(
+                text(
+                    "INSERT INTO post (id, author_id, title, content, created_at)"
+                    " VALUES ('x', 'x', 'x', 'x', '2025-01-01')"
+                )
+            )
+
+
+@pytest.mark.asyncio
+async def test_init_db_skips_ddl_on_latest_schema(app: FastAPI):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await init_db()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    # 버전만 읽고 끝난다. 쓰기 락(BEGIN IMMEDIATE)도 create_all 도 없다.
+    assert statements == ["PRAGMA user_version"]
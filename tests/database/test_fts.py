@@ -0,0 +1,37 @@
+import pytest
+from fastapi import FastAPI
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.post import Post
+from src.service.search import search_service, to_match_query
+from src.sqlite3.connection import get_engine
+from src.sqlite3.fts import rebuild
+from src.sqlite3.writer import WRITER
+
+
+def test_to_match_query_quotes_terms():
+    assert to_match_query('foo "bar" baz*') == '"foo" """bar""" "baz"*'
+    assert to_match_query("  ***  ") == ""
+
+
+@pytest.mark.asyncio
+async def test_rebuild_restores_index(app: FastAPI):
+    post = await WRITER.add(
+        Post(author_id="indexer", title="Quokka", content="smiles")
+    )
+
+    async with get_engine().begin() as conn:
+        await conn.exec_driver_sql(
+            "INSERT INTO post_fts(post_fts) VALUES ('delete-all')"
+        )
+
+    async with AsyncSession(get_engine()) as session:
+        page = await search_service("quokka", "posts", session, 10)
+        assert page.items == []
+
+    async with get_engine().begin() as conn:
+        await rebuild(conn)
+
+    async with AsyncSession(get_engine()) as session:
+        page = await search_service("quokka", "posts", session, 10)
+        assert [hit.id for hit in page.items] == [post.id]
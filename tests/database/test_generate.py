@@ -0,0 +1,95 @@
+import sqlite3
+
+import pytest
+from sqlmodel import SQLModel, create_engine
+
+from src.sqlite3.fts import FTS_SCHEMA
+from src.sqlite3.generate import DatasetShape, generate
+
+SHAPE = DatasetShape(
+    users=20, posts=200, comments=3000, hot_posts=2, hot_comments=500
+)
+
+
+def make_db(path) -> str:
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+    conn = sqlite3.connect(path)
+    for statement in FTS_SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def dump(path: str) -> list[tuple]:
+    conn = sqlite3.connect(path)
+    try:
+        return [
+            *conn.execute("SELECT id, username, nickname FROM user"),
+            *conn.execute("SELECT * FROM post ORDER BY id"),
+            *conn.execute("SELECT * FROM comment ORDER BY id"),
+        ]
+    finally:
+        conn.close()
+
+
+def test_generate_is_deterministic(tmp_path):
+    first = make_db(tmp_path / "first.db")
+    second = make_db(tmp_path / "second.db")
+
+    counts = generate(first, SHAPE, seed=7)
+    generate(second, SHAPE, seed=7)
+
+    assert counts == {"users": 20, "posts": 200, "comments": 3000}
+    assert dump(first) == dump(second)
+
+
+def test_generate_skews_comments_and_keeps_schema(tmp_path):
+    path = make_db(tmp_path / "board.db")
+    generate(path, SHAPE, seed=1)
+
+    conn = sqlite3.connect(path)
+    counts = [
+        count
+        for (count,) in conn.execute(
+            "SELECT count(*) FROM comment GROUP BY post_id ORDER BY 1 DESC"
+        )
+    ]
+    # 인기 글 두 개에 500개씩, 나머지는 치우친 분포라 댓글 없는 글이 많다.
+    assert counts[0] >= 500 and counts[1] >= 500
+    assert len(counts) < SHAPE.posts
+
+    # 댓글은 글보다 늦게 달리고, id 는 시각 순서를 따른다.
+    assert not conn.execute(
+        "SELECT 1 FROM comment JOIN post ON post.id = comment.post_id"
+        " WHERE comment.created_at < post.created_at"
+    ).fetchone()
+    rows = conn.execute("SELECT id, created_at FROM comment ORDER BY id")
+    times = [created_at for _, created_at in rows]
+    assert times == sorted(times)
+
+    # 내려 두었던 인덱스와 FTS 트리거가 다시 만들어지고, 인덱스도 채워진다.
+    names = {name for (name,) in conn.execute("SELECT name FROM sqlite_master")}
+    assert {"ix_comment_post_id_id", "post_fts_ai", "comment_fts_ad"} <= names
+    post_id, title = conn.execute("SELECT id, title FROM post").fetchone()
+    matches = conn.execute(
+        "SELECT post.id FROM post_fts JOIN post ON post.rowid = post_fts.rowid"
+        " WHERE post_fts MATCH ?",
+        (f'"{title.split()[0]}"',),
+    )
+    assert post_id in {id for (id,) in matches}
+
+    # 트리거 없이 넣은 행의 카운터도 채워진다.
+    assert not conn.execute(
+        "SELECT 1 FROM post WHERE comment_count !="
+        " (SELECT count(*) FROM comment WHERE post_id = post.id)"
+    ).fetchone()
+    assert conn.execute(
+        "SELECT sum(post_count), sum(comment_count) FROM user_stats"
+    ).fetchone() == (SHAPE.posts, SHAPE.comments)
+    conn.close()
+
+    with pytest.raises(ValueError, match="already has rows"):
+        generate(path, SHAPE, seed=1)
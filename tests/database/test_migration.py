@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.sqlite3.migration import LATEST_VERSION, get_version, migrate
+
+# 인덱스가 추가되기 전의 스키마
+LEGACY_SCHEMA = (
+    "CREATE TABLE user (id VARCHAR NOT NULL, username VARCHAR NOT NULL,"
+    " password VARCHAR NOT NULL, nickname VARCHAR NOT NULL,"
+    " created_at DATETIME NOT NULL, PRIMARY KEY (id), UNIQUE (nickname))",
+    "CREATE UNIQUE INDEX ix_user_username ON user (username)",
+    "CREATE TABLE post (id VARCHAR NOT NULL, author_id VARCHAR NOT NULL,"
+    " title VARCHAR NOT NULL, content VARCHAR NOT NULL,"
+    " created_at DATETIME NOT NULL, PRIMARY KEY (id),"
+    " FOREIGN KEY(author_id) REFERENCES user (id))",
+    "CREATE TABLE comment (id VARCHAR NOT NULL, author_id VARCHAR NOT NULL,"
+    " post_id VARCHAR NOT NULL, content VARCHAR NOT NULL,"
+    " created_at DATETIME NOT NULL, PRIMARY KEY (id),"
+    " FOREIGN KEY(author_id) REFERENCES user (id),"
+    " FOREIGN KEY(post_id) REFERENCES post (id))",
+)
+
+
+LEGACY_ROWS = (
+    "INSERT INTO post VALUES ('p1', 'u1', 't', 'c', '2024-01-01 00:00:00')",
+    "INSERT INTO comment VALUES"
+    " ('c1', 'u1', 'p1', 'c', '2024-01-01 00:00:01'),"
+    " ('c2', 'u2', 'p1', 'c', '2024-01-01 00:00:02')",
+)
+
+
+def index_names(sync_conn) -> set[str]:
+    inspector = inspect(sync_conn)
+    return {
+        index["name"]
+        for table in inspector.get_table_names()
+        for index in inspector.get_indexes(table)
+    }
+
+
+@pytest.mark.asyncio
+async def test_migrate_upgrades_legacy_database(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/legacy.db")
+    async with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            await conn.exec_driver_sql(statement)
+        for statement in LEGACY_ROWS:
+            await conn.exec_driver_sql(statement)
+
+    async with engine.begin() as conn:
+        applied = await migrate(conn)
+
+    async with engine.connect() as conn:
+        assert await get_version(conn) == LATEST_VERSION
+        indexes = await conn.run_sync(index_names)
+        post_columns = await conn.run_sync(
+            lambda sync_conn: {
+                column["name"]
+                for column in inspect(sync_conn).get_columns("post")
+            }
+        )
+        comment_count = (
+            await conn.exec_driver_sql("SELECT comment_count FROM post")
+        ).scalar()
+        stats = (
+            await conn.exec_driver_sql(
+                "SELECT user_id, post_count, comment_count FROM user_stats"
+                " ORDER BY user_id"
+            )
+        ).all()
+
+    assert [m.version for m in applied] == list(range(1, LATEST_VERSION + 1))
+    assert {
+        "ix_post_author_id_id",
+        "ix_comment_post_id_id",
+        "ix_comment_author_id_id",
+        "ix_user_nickname",
+        "ix_post_deleted_at_id",
+    } <= indexes
+    assert {
+        "revision",
+        "comments_revision",
+        "deleted_at",
+        "comment_count",
+    } <= post_columns
+    # 이미 있던 글/댓글로 카운터를 채운다.
+    assert comment_count == 2
+    assert [tuple(row) for row in stats] == [("u1", 1, 1), ("u2", 0, 1)]
+
+    async with engine.begin() as conn:
+        assert await migrate(conn) == []
+    await engine.dispose()
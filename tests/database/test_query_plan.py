@@ -0,0 +1,140 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.comment import CommentUpdateRequest
+from src.repository.sql import sql_repositories
+from src.service.account import check_user, check_user_by_nickname
+from src.service.comment import (
+    delete_comment_service,
+    get_comments_by_author_service,
+    update_comment_service,
+)
+from src.sqlite3.connection import get_engine, get_read_engine
+
+
+def is_full_scan(statement: str, details: list[str]) -> bool:
+    # FTS5 가상 테이블은 역색인(MATCH)으로 찾는다. bm25 정렬은 매칭된 문서를
+    # 모두 점수 매겨야 하므로 임시 B-tree 정렬도 피할 수 없다.
+    if any("VIRTUAL TABLE" in detail for detail in details):
+        return False
+
+    # 윈도 함수 등 서브쿼리(CO-ROUTINE)의 결과를 훑는 것은 테이블 스캔이 아니다.
+    # 서브쿼리 안의 테이블 접근은 그 줄에서 따로 본다.
+    subqueries = {
+        detail.removeprefix("CO-ROUTINE ")
+        for detail in details
+        if detail.startswith("CO-ROUTINE ")
+    }
+
+    for detail in details:
+        if detail.removeprefix("SCAN ") in subqueries:
+            continue
+        # 정렬을 위해 임시 B-tree 를 만들면 조건에 맞는 행을 전부 읽어야 한다.
+        if "USE TEMP B-TREE" in detail:
+            return True
+        if not detail.startswith("SCAN"):
+            continue
+        # 조건 없는 첫 페이지는 PK 인덱스 순서로 LIMIT 만큼만 읽고 멈춘다.
+        # 조건이 있는데 SCAN 이면 조건에 맞는 행을 찾을 때까지 테이블을 훑는다.
+        if "WHERE" in statement.upper() or "USING" not in detail:
+            return True
+    return False
+
+
+@pytest.fixture
+def statements(app: FastAPI):
+    captured: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(
+            ("SELECT", "UPDATE", "DELETE")
+        ):
+            captured.append((statement, parameters))
+
+    engines = {get_engine().sync_engine, get_read_engine().sync_engine}
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+async def exercise_services(client: AsyncClient) -> None:
+    headers = {"Author": "planner"}
+    post = (
+        await client.post(
+            "/api/posts", json={"title": "t", "content": "c"}, headers=headers
+        )
+    ).json()
+    comment = (
+        await client.post(
+            "/api/comments",
+            json={"post_id": post["id"], "content": "c"},
+            headers=headers,
+        )
+    ).json()
+
+    await client.get("/api/posts")
+    await client.get("/api/posts", params={"after": post["id"]})
+    await client.get(f"/api/posts/{post['id']}")
+    await client.get(f"/api/posts/{post['id']}/views")
+    await client.get(f"/api/posts/{post['id']}/comments")
+    await client.get(
+        f"/api/posts/{post['id']}/comments", params={"after": comment["id"]}
+    )
+    await client.get("/api/posts/search", params={"q": "t"})
+    await client.get(
+        "/api/posts/search", params={"q": "c", "target": "comments"}
+    )
+    await client.post(
+        "/api/posts:batchGet", json={"ids": [post["id"]], "comments": 3}
+    )
+    await client.get("/api/auth/planner/posts")
+    await client.get("/api/auth/planner/posts", params={"after": post["id"]})
+    await client.get("/api/auth/planner/stats")
+    await client.put(
+        f"/api/posts/{post['id']}",
+        json={"title": "t2", "content": "c2"},
+        headers=headers,
+    )
+
+    async with AsyncSession(get_read_engine()) as session:
+        repo = sql_repositories(session)
+        await check_user("planner", repo.users)
+        await check_user_by_nickname("planner", repo.users)
+        await get_comments_by_author_service("planner", repo.comments, 10)
+        await get_comments_by_author_service(
+            "planner", repo.comments, 10, comment["id"]
+        )
+        await update_comment_service(
+            comment["id"],
+            CommentUpdateRequest(content="u"),
+            repo.comments,
+            "planner",
+        )
+        await delete_comment_service(comment["id"], repo.comments, "planner")
+
+    await client.delete(f"/api/posts/{post['id']}", headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_service_queries_use_indexes(client: AsyncClient, statements):
+    await exercise_services(client)
+    assert statements
+
+    offenders = []
+    async with get_engine().connect() as conn:
+        for statement, parameters in statements:
+            plan = (
+                await conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+            ).all()
+            details = [row[-1] for row in plan]
+            if is_full_scan(statement, details):
+                offenders.append((statement, details))
+
+    assert offenders == []
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.post import Post
+from src.sqlite3.connection import get_engine
+from src.sqlite3.writer import WriteQueue
+
+
+def make_post(title: str) -> Post:
+    return Post(author_id="writer", title=title, content="group commit")
+
+
+@pytest.mark.asyncio
+async def test_write_queue_groups_inserts_into_one_commit(app: FastAPI):
+    commits = 0
+
+    def on_commit(conn):
+        nonlocal commits
+        commits += 1
+
+    writer = WriteQueue(get_engine(), window_ms=50, max_batch=100)
+    await writer.start()
+    event.listen(get_engine().sync_engine, "commit", on_commit)
+    try:
+        posts = await asyncio.gather(
+            *(writer.add(make_post(f"batched {i}")) for i in range(20))
+        )
+    finally:
+        event.remove(get_engine().sync_engine, "commit", on_commit)
+        await writer.stop()
+
+    assert commits == 1
+    assert [p.title for p in posts] == [f"batched {i}" for i in range(20)]
+
+    async with AsyncSession(get_engine()) as session:
+        stmt = select(Post).where(Post.id.in_([p.id for p in posts]))
+        assert len((await session.exec(stmt)).all()) == 20
+
+
+@pytest.mark.asyncio
+async def test_write_queue_isolates_errors_per_caller(app: FastAPI):
+    async def failing(session: AsyncSession):
+        session.add(make_post("doomed"))
+        raise ValueError("boom")
+
+    writer = WriteQueue(get_engine(), window_ms=50, max_batch=100)
+    await writer.start()
+    try:
+        results = await asyncio.gather(
+            writer.add(make_post("survivor 1")),
+            writer.submit(failing),
+            writer.add(make_post("survivor 2")),
+            return_exceptions=True,
+        )
+    finally:
+        await writer.stop()
+
+    assert results[0].title == "survivor 1"
+    assert isinstance(results[1], ValueError)
+    assert results[2].title == "survivor 2"
+
+    async with AsyncSession(get_engine()) as session:
+        titles = (
+            await session.exec(
+                select(Post.title).where(Post.author_id == "writer")
+            )
+        ).all()
+    assert "survivor 1" in titles
+    assert "survivor 2" in titles
+    assert "doomed" not in titles
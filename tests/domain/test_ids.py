@@ -0,0 +1,26 @@
+from ulid import ULID
+
+from src.domain import ids
+from src.domain.ids import MonotonicULID
+
+
+def test_ids_in_same_millisecond_keep_creation_order(monkeypatch):
+    now = 1_700_000_000_000_000_000
+    monkeypatch.setattr(ids.time, "time_ns", lambda: now)
+    new_ulid = MonotonicULID()
+
+    created = [new_ulid() for _ in range(1000)]
+
+    assert created == sorted(created)
+    assert len(set(created)) == len(created)
+    assert {ULID.from_str(i).milliseconds for i in created} == {now // 10**6}
+
+
+def test_ids_keep_order_when_clock_goes_back(monkeypatch):
+    clock = iter([2_000_000_000, 1_000_000_000, 3_000_000_000])
+    monkeypatch.setattr(ids.time, "time_ns", lambda: next(clock))
+    new_ulid = MonotonicULID()
+
+    created = [new_ulid() for _ in range(3)]
+
+    assert created == sorted(created)
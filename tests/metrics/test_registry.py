@@ -0,0 +1,40 @@
+from src.metrics.registry import Registry
+
+
+def test_render_counter_and_gauge():
+    registry = Registry()
+    counter = registry.counter("jobs_total", "Jobs", ("kind",))
+    gauge = registry.gauge("queue_size", "Queue size")
+
+    counter.inc(kind="a")
+    counter.inc(2, kind='quote"d')
+    gauge.set(3)
+
+    assert registry.render().splitlines() == [
+        "# HELP jobs_total Jobs",
+        "# TYPE jobs_total counter",
+        'jobs_total{kind="a"} 1.0',
+        'jobs_total{kind="quote\\"d"} 2.0',
+        "# HELP queue_size Queue size",
+        "# TYPE queue_size gauge",
+        "queue_size 3.0",
+    ]
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    histogram = registry.histogram(
+        "latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)
+    )
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, route="/posts")
+
+    lines = registry.render().splitlines()[2:]
+    assert lines == [
+        'latency_seconds_bucket{route="/posts",le="0.1"} 2.0',
+        'latency_seconds_bucket{route="/posts",le="1.0"} 3.0',
+        'latency_seconds_bucket{route="/posts",le="+Inf"} 4.0',
+        'latency_seconds_sum{route="/posts"} 3.65',
+        'latency_seconds_count{route="/posts"} 4.0',
+    ]
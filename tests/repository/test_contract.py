@@ -0,0 +1,237 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ulid import ULID
+
+from src.domain.comment import Comment
+from src.domain.post import Post
+from src.domain.user import User
+from src.repository.base import DuplicateError, Repositories
+from src.repository.memory import memory_repositories
+from src.repository.sql import sql_repositories
+from src.service.purge import PURGER
+from src.sqlite3.connection import get_read_engine
+
+
+# 두 구현이 같은 계약을 지키는지 같은 테스트로 확인한다.
+# SQL 쪽은 테스트끼리 DB를 공유하므로 작성자 id 를 테스트마다 새로 만든다.
+@pytest_asyncio.fixture(params=["sql", "memory"])
+async def repo(request, app) -> AsyncGenerator[Repositories, None]:
+    if request.param == "memory":
+        yield memory_repositories()
+        return
+    async with AsyncSession(get_read_engine()) as session:
+        yield sql_repositories(session)
+
+
+def unique(prefix: str) -> str:
+    return f"{prefix}-{ULID()}"
+
+
+async def add_posts(repo: Repositories, author: str, count: int) -> list[Post]:
+    return [
+        await repo.posts.add(
+            Post(author_id=author, title=f"t{i}", content=f"c{i}")
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_users(repo: Repositories):
+    username, nickname = unique("user"), unique("nick")
+    user = await repo.users.add(
+        User(username=username, nickname=nickname, password="hash")
+    )
+
+    assert (await repo.users.get(user.id)).username == username
+    assert (await repo.users.get_by_username(username)).id == user.id
+    assert (await repo.users.get_by_nickname(nickname)).id == user.id
+    assert await repo.users.get_by_username(unique("missing")) is None
+
+    with pytest.raises(DuplicateError):
+        await repo.users.add(
+            User(username=username, nickname=unique("nick"), password="x")
+        )
+    with pytest.raises(DuplicateError):
+        await repo.users.add(
+            User(username=unique("user"), nickname=nickname, password="x")
+        )
+
+    await repo.users.set_password(user.id, "rehashed")
+    assert (await repo.users.get(user.id)).password == "rehashed"
+
+
+@pytest.mark.asyncio
+async def test_posts_pages_and_revision(repo: Repositories):
+    author = unique("author")
+    posts = await add_posts(repo, author, 5)
+    ids = [post.id for post in posts]
+
+    first = await repo.posts.list_by_author(author, None, 3)
+    rest = await repo.posts.list_by_author(author, first[-1].id, 3)
+    assert [p.id for p in first + rest] == ids
+    assert [p.id for p in await repo.posts.list_all(ids[2], 10)] == ids[3:]
+    assert await repo.posts.list_by_author(unique("nobody"), None, 3) == []
+
+    assert await repo.posts.revision(ids[0]) == 1
+    updated = await repo.posts.update(ids[0], "new", "body")
+    assert (updated.title, updated.revision) == ("new", 2)
+    assert (await repo.posts.get(ids[0])).title == "new"
+    assert await repo.posts.revision(ids[0]) == 2
+    assert await repo.posts.update(unique("missing"), "t", "c") is None
+
+    assert await repo.posts.delete(ids[1])
+    assert not await repo.posts.delete(ids[1])
+    assert await repo.posts.get(ids[1]) is None
+    assert await repo.posts.revision(ids[1]) is None
+    remaining = await repo.posts.list_by_author(author, None, 10)
+    assert [p.id for p in remaining] == ids[:1] + ids[2:]
+
+
+@pytest.mark.asyncio
+async def test_comments_bump_post_comments_revision(repo: Repositories):
+    author = unique("author")
+    (post,) = await add_posts(repo, author, 1)
+    assert await repo.posts.comments_revision(post.id) == 0
+
+    comments = [
+        await repo.comments.add(
+            Comment(author_id=author, post_id=post.id, content=f"c{i}")
+        )
+        for i in range(3)
+    ]
+    ids = [comment.id for comment in comments]
+    assert await repo.posts.comments_revision(post.id) == 3
+
+    page = await repo.comments.list_by_post(post.id, ids[0], 10)
+    assert [c.id for c in page] == ids[1:]
+    by_author = await repo.comments.list_by_author(author, None, 2)
+    assert [c.id for c in by_author] == ids[:2]
+
+    updated = await repo.comments.update(ids[0], "edited")
+    assert updated.content == "edited" and updated.updated_at is not None
+    assert (await repo.comments.get(ids[0])).content == "edited"
+    assert await repo.posts.comments_revision(post.id) == 4
+
+    assert await repo.comments.delete(ids[0])
+    assert not await repo.comments.delete(ids[0])
+    assert await repo.comments.get(ids[0]) is None
+    assert await repo.posts.comments_revision(post.id) == 5
+    page = await repo.comments.list_by_post(post.id, None, 10)
+    assert [c.id for c in page] == ids[1:]
+
+
+@pytest.mark.asyncio
+async def test_deleted_post_is_hidden_then_purged(repo: Repositories):
+    # 앱의 purger 가 같은 글을 먼저 지우지 않게 멈춘다.
+    await PURGER.stop()
+    author = unique("author")
+    post, other = await add_posts(repo, author, 2)
+    for i in range(5):
+        await repo.comments.add(
+            Comment(author_id=author, post_id=post.id, content=f"c{i}")
+        )
+    kept = await repo.comments.add(
+        Comment(author_id=author, post_id=other.id, content="kept")
+    )
+    (hidden,) = await repo.comments.list_by_post(post.id, None, 1)
+
+    assert await repo.posts.delete(post.id)
+    assert await repo.posts.get(post.id) is None
+    assert await repo.posts.comments_revision(post.id) is None
+    assert await repo.comments.get(hidden.id) is None
+    assert await repo.comments.update(hidden.id, "late") is None
+    assert not await repo.comments.delete(hidden.id)
+    late = Comment(author_id=author, post_id=post.id, content="late")
+    assert await repo.comments.add(late) is None
+    assert await repo.comments.list_by_post(post.id, None, 10) == []
+    by_author = await repo.comments.list_by_author(author, None, 1)
+    assert [c.id for c in by_author] == [kept.id]
+    assert post.id in await repo.posts.pending_purge(100)
+    posts, comments = await repo.posts.purge_backlog()
+    assert posts >= 1 and comments >= 5
+
+    # 지우지 않은 글의 댓글은 건드리지 않는다.
+    assert await repo.posts.purge(other.id, 2) == 0
+    assert [await repo.posts.purge(post.id, 2) for _ in range(3)] == [2, 2, 1]
+    assert post.id not in await repo.posts.pending_purge(100)
+    assert await repo.posts.purge(post.id, 2) == 0
+    assert await repo.comments.list_by_post(other.id, None, 10) == [kept]
+
+
+@pytest.mark.asyncio
+async def test_batch_lookups(repo: Repositories):
+    author = unique("author")
+    first, second = await add_posts(repo, author, 2)
+    comments = [
+        await repo.comments.add(
+            Comment(author_id=author, post_id=first.id, content=f"c{i}")
+        )
+        for i in range(3)
+    ]
+
+    found = await repo.posts.get_many([second.id, unique("missing"), first.id])
+    assert {p.id for p in found} == {first.id, second.id}
+
+    embedded = await repo.comments.first_by_posts([first.id, second.id], 2)
+    assert list(embedded) == [first.id]
+    assert [c.id for c in embedded[first.id]] == [c.id for c in comments[:2]]
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_writes(repo: Repositories):
+    await PURGER.stop()
+    author, commenter = unique("author"), unique("commenter")
+    post, other = await add_posts(repo, author, 2)
+    comments = [
+        await repo.comments.add(
+            Comment(author_id=commenter, post_id=post.id, content=f"c{i}")
+        )
+        for i in range(3)
+    ]
+    assert await repo.posts.count_by_author(author) == 2
+    assert await repo.comments.count_by_post(post.id) == 3
+    assert await repo.comments.count_by_post(other.id) == 0
+    assert await repo.comments.count_by_author(commenter) == 3
+    assert await repo.comments.count_by_author(unique("missing")) == 0
+    # 응답의 comment_count 가 바뀌므로 revision 도 오른다.
+    assert (await repo.posts.get(post.id)).comment_count == 3
+    assert await repo.posts.revision(post.id) == 4
+
+    assert await repo.comments.delete(comments[0].id)
+    assert await repo.comments.count_by_post(post.id) == 2
+    assert await repo.comments.count_by_author(commenter) == 2
+
+    # 글 수는 바로, 지운 글의 댓글 수는 purge 가 행을 지울 때 줄어든다.
+    assert await repo.posts.delete(post.id)
+    assert await repo.posts.count_by_author(author) == 1
+    assert await repo.comments.count_by_post(post.id) == 0
+    assert await repo.comments.count_by_author(commenter) == 2
+    assert await repo.posts.purge(post.id, 10) == 2
+    assert await repo.comments.count_by_author(commenter) == 0
+    assert await repo.posts.count_by_author(author) == 1
+
+
+@pytest.mark.asyncio
+async def test_views_accumulate_until_purged(repo: Repositories):
+    await PURGER.stop()
+    post, other = await add_posts(repo, unique("author"), 2)
+    assert await repo.posts.views(post.id) == 0
+
+    await repo.posts.add_views({post.id: 2, other.id: 1})
+    await repo.posts.add_views({post.id: 3})
+    assert await repo.posts.views(post.id) == 5
+    assert await repo.posts.views(other.id) == 1
+
+    assert await repo.posts.delete(post.id)
+    assert await repo.posts.purge(post.id, 10) == 0
+    assert await repo.posts.views(post.id) == 0
+    assert await repo.posts.views(other.id) == 1
+
+    # 버퍼에 남아 있던 조회수가 purge 뒤에 반영돼도 행을 다시 만들지 않는다.
+    await repo.posts.add_views({post.id: 4, other.id: 1})
+    assert await repo.posts.views(post.id) == 0
+    assert await repo.posts.views(other.id) == 2
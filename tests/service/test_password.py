@@ -0,0 +1,70 @@
+import asyncio
+import hashlib
+
+import pytest
+from fastapi import HTTPException
+
+from src.service.password import (
+    PasswordHasher,
+    hash_password,
+    needs_rehash,
+    verify_password,
+)
+
+
+def test_hash_password_is_salted_and_verifiable():
+    first = hash_password("Secret123")
+    second = hash_password("Secret123")
+
+    assert first != second
+    assert verify_password("Secret123", first)
+    assert not verify_password("Secret124", first)
+    assert not needs_rehash(first)
+
+
+def test_legacy_sha512_hash_verifies_and_needs_rehash():
+    legacy = hashlib.sha512(b"Secret123").hexdigest()
+
+    assert verify_password("Secret123", legacy)
+    assert not verify_password("secret123", legacy)
+    assert needs_rehash(legacy)
+
+
+@pytest.mark.parametrize(
+    "stored",
+    [
+        "scrypt$16384$8",
+        "scrypt$x$8$1$c2FsdA==$aGFzaA==",
+        "scrypt$1000$8$1$c2FsdA==$aGFzaA==",
+        "pbkdf2_sha256$0$c2FsdA==$aGFzaA==",
+        "pbkdf2_sha256$1$c2Fsd$aGFzaA==",
+        # 설정보다 센 작업 강도 (ex. 수 GB 를 쓰는 scrypt)
+        "scrypt$1048576$64$1$c2FsdA==$aGFzaA==",
+        "scrypt$16384$8$64$c2FsdA==$aGFzaA==",
+        "pbkdf2_sha256$1000000000$c2FsdA==$aGFzaA==",
+        "해시",
+    ],
+)
+def test_malformed_hash_does_not_verify(stored: str):
+    assert not verify_password("Secret123", stored)
+
+
+@pytest.mark.asyncio
+async def test_hasher_rejects_when_queue_is_full():
+    hasher = PasswordHasher(workers=1, queue_limit=1)
+    try:
+        running = [
+            asyncio.create_task(hasher.hash("Secret123")) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await hasher.hash("Secret123")
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "1"}
+        assert hasher.rejected == 1
+
+        for password_hash in await asyncio.gather(*running):
+            assert verify_password("Secret123", password_hash)
+    finally:
+        hasher.shutdown()
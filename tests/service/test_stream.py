@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from src.domain.comment import CommentResponse
+from src.service.stream import (
+    COMMENT_HUB,
+    CommentHub,
+    SubscriberLimitError,
+    comment_events,
+)
+
+
+def make_comment(i: int, post_id: str = "p") -> CommentResponse:
+    return CommentResponse(
+        id=f"01J{i:023d}",
+        post_id=post_id,
+        author_id="a",
+        content=f"c{i}",
+        created_at="2025-01-01T00:00:00+09:00",
+    )
+
+
+@pytest.mark.asyncio
+async def test_hub_drops_slow_subscribers():
+    hub = CommentHub(buffer_size=2, max_subscribers=2, heartbeat_s=60)
+    fast, slow = hub.subscribe("p"), hub.subscribe("p")
+
+    for i in range(3):
+        assert hub.publish(make_comment(i)) == (2 if i < 2 else 1)
+        event_id, data = await fast.get()
+        assert event_id == make_comment(i).id
+        assert data.startswith(f"id: {event_id}\nevent: comment\n".encode())
+
+    # 버퍼가 넘친 구독자는 닫히고, 남은 이벤트도 받지 않는다.
+    assert slow.closed and await slow.get() is None
+    assert hub.dropped == 1
+    assert hub.publish(make_comment(3, post_id="other")) == 0
+
+    with pytest.raises(SubscriberLimitError):
+        hub.subscribe("p")
+    hub.unsubscribe(slow)
+    hub.unsubscribe(slow)
+    assert hub.subscribers == 1
+    hub.subscribe("q")
+
+
+@pytest.mark.asyncio
+async def test_comment_events_resume_from_last_event_id(client: AsyncClient):
+    headers = {"Author": "streamer"}
+    post_id = (
+        await client.post(
+            "/api/posts", json={"title": "t", "content": "c"}, headers=headers
+        )
+    ).json()["id"]
+
+    async def add_comment(content: str) -> dict:
+        response = await client.post(
+            "/api/comments",
+            json={"post_id": post_id, "content": content},
+            headers=headers,
+        )
+        return response.json()
+
+    first, second, third = [await add_comment(f"c{i}") for i in range(3)]
+
+    subscription = COMMENT_HUB.subscribe(post_id)
+    events = comment_events(COMMENT_HUB, subscription, first["id"])
+    for comment in (second, third):
+        event = await asyncio.wait_for(anext(events), 5)
+        assert event.startswith(f"id: {comment['id']}\n".encode())
+    assert COMMENT_HUB.subscribers == 1
+
+    # DB 에서 이미 보낸 댓글은 다시 보내지 않고, 새 댓글은 커밋 뒤 바로 온다.
+    COMMENT_HUB.publish(CommentResponse(**third))
+    live = await add_comment("live")
+    event = await asyncio.wait_for(anext(events), 5)
+    assert event.startswith(f"id: {live['id']}\n".encode())
+
+    await events.aclose()
+    assert COMMENT_HUB.subscribers == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_unknown_post_and_bad_cursor(client: AsyncClient):
+    missing = await client.get("/api/posts/missing/comments/stream")
+    assert missing.status_code == 404
+
+    bad = await client.get(
+        "/api/posts/missing/comments/stream",
+        headers={"Last-Event-ID": "not-a-ulid"},
+    )
+    assert bad.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_when_hub_is_full(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    post_id = (
+        await client.post(
+            "/api/posts",
+            json={"title": "t", "content": "c"},
+            headers={"Author": "streamer"},
+        )
+    ).json()["id"]
+    monkeypatch.setattr(COMMENT_HUB, "max_subscribers", COMMENT_HUB.subscribers)
+
+    response = await client.get(f"/api/posts/{post_id}/comments/stream")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "5"
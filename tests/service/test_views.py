@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.service.repository import open_repositories
+from src.service.views import VIEW_COUNTER, ViewCounter
+
+
+async def stored_views(post_id: str) -> int:
+    async with open_repositories() as repo:
+        return await repo.posts.views(post_id)
+
+
+@pytest.mark.asyncio
+async def test_views_combine_stored_and_pending(client: AsyncClient):
+    post_id = (
+        await client.post(
+            "/api/posts",
+            json={"title": "t", "content": "c"},
+            headers={"Author": "viewer"},
+        )
+    ).json()["id"]
+
+    first = await client.get(f"/api/posts/{post_id}")
+    await client.get(f"/api/posts/{post_id}")
+    # 304 도 조회로 센다.
+    cached = await client.get(
+        f"/api/posts/{post_id}",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+    assert await stored_views(post_id) == 0
+    views = await client.get(f"/api/posts/{post_id}/views")
+    assert views.json() == {"post_id": post_id, "views": 3}
+
+    assert await VIEW_COUNTER.flush() >= 3
+    assert VIEW_COUNTER.pending(post_id) == 0
+    assert await stored_views(post_id) == 3
+    await client.get(f"/api/posts/{post_id}")
+    views = await client.get(f"/api/posts/{post_id}/views")
+    assert views.json()["views"] == 4
+
+    missing = await client.get("/api/posts/01ARZ3NDEKTSV4RRFFQ69G5FAV/views")
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_counter_flushes_when_full_and_on_stop(client: AsyncClient):
+    post_id = (
+        await client.post(
+            "/api/posts",
+            json={"title": "t", "content": "c"},
+            headers={"Author": "viewer"},
+        )
+    ).json()["id"]
+    counter = ViewCounter(flush_interval_s=60, max_pending=3)
+    await counter.start()
+    for _ in range(3):
+        counter.record(post_id)
+    # 주기(60초)를 기다리지 않고 반영한다.
+    for _ in range(100):
+        if counter.flushed:
+            break
+        await asyncio.sleep(0.01)
+    assert (counter.flushed, counter.buffered) == (3, 0)
+
+    counter.record(post_id)
+    await counter.stop()
+    assert (counter.flushed, counter.buffered) == (4, 0)
+    assert await stored_views(post_id) == 4
@@ -0,0 +1,29 @@
+import pytest
+
+from src.config import ServerConfig
+from src.server import serve_options
+
+
+def test_serve_options_come_from_config():
+    config = ServerConfig(
+        SERVER_WORKERS=3,
+        SERVER_LOOP="uvloop",
+        SERVER_HTTP="httptools",
+        SERVER_LIMIT_CONCURRENCY=500,
+    )
+    options = serve_options(config)
+
+    assert options["workers"] == 3
+    assert (options["loop"], options["http"]) == ("uvloop", "httptools")
+    assert options["limit_concurrency"] == 500
+    assert options["timeout_graceful_shutdown"] == 30
+    assert "reload" not in options
+
+
+def test_in_memory_storage_refuses_multiple_workers():
+    config = ServerConfig(DATABASE_TYPE="in-memory", SERVER_WORKERS=2)
+    with pytest.raises(ValueError, match="SERVER_WORKERS=1"):
+        serve_options(config)
+
+    single = ServerConfig(DATABASE_TYPE="in-memory", SERVER_WORKERS=1)
+    assert serve_options(single)["workers"] == 1